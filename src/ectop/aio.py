@@ -0,0 +1,451 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Asyncio facade over the ecFlow client wrapper.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from ectop.constants import CLIENT_POOL_SIZE, DEFAULT_CLIENT_TIMEOUT
+from ectop.workers import worker_limiter
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+    from ectop.client import EcflowClient
+
+
+def _settle(future: asyncio.Future[Any], result: Any, error: BaseException | None) -> None:
+    """
+    Complete a call future on the event loop unless it was already cancelled.
+
+    Parameters
+    ----------
+    future : asyncio.Future[Any]
+        The future awaited by the caller.
+    result : Any
+        The call result.
+    error : BaseException | None
+        The exception raised by the call, if any.
+    """
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class AsyncEcflowClient:
+    """
+    Awaitable versions of the `EcflowClient` calls.
+
+    Each call runs the blocking client method on a managed thread pool and is
+    awaited with a timeout. Calls are submitted through the shared
+    `worker_limiter` in the ``async`` category, so they count in the status
+    bar queue and wait there, without holding a pool thread, while the
+    category is full. Cancelling the awaiting task (for example when a
+    screen and its workers are dismissed) returns control immediately; the
+    blocking call finishes in the background and its result is discarded.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    client : EcflowClient
+        The wrapped blocking client.
+    timeout : float | None
+        Default timeout in seconds for each call, or None to wait forever.
+    in_flight : int
+        Number of calls currently awaited.
+    """
+
+    def __init__(
+        self,
+        client: EcflowClient,
+        timeout: float | None = DEFAULT_CLIENT_TIMEOUT,
+        max_workers: int = CLIENT_POOL_SIZE + 1,
+    ) -> None:
+        """
+        Initialize the AsyncEcflowClient.
+
+        Parameters
+        ----------
+        client : EcflowClient
+            The blocking client to wrap.
+        timeout : float | None, optional
+            Default per-call timeout in seconds, by default DEFAULT_CLIENT_TIMEOUT.
+        max_workers : int, optional
+            Size of the managed thread pool, by default CLIENT_POOL_SIZE + 1.
+        """
+        self.client: EcflowClient = client
+        self.timeout: float | None = timeout
+        self.in_flight: int = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ectop-aio")
+
+    async def _run(self, name: str, func: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+        """
+        Run a blocking client method on the executor and await it.
+
+        Parameters
+        ----------
+        name : str
+            The call name, used in the timeout error message.
+        func : Callable[..., Any]
+            The blocking `EcflowClient` method.
+        *args : Any
+            Arguments for `func`.
+        timeout : float | None, optional
+            Timeout override in seconds, by default the instance timeout.
+
+        Returns
+        -------
+        Any
+            The result of `func`.
+
+        Raises
+        ------
+        RuntimeError
+            If the call fails or does not complete within the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+
+        def job() -> None:
+            if future.done():
+                # Timed out or cancelled while queued
+                return
+            try:
+                result = func(*args)
+            except Exception as e:
+                outcome: tuple[Any, BaseException | None] = (None, e)
+            else:
+                outcome = (result, None)
+            try:
+                loop.call_soon_threadsafe(_settle, future, *outcome)
+            except RuntimeError:
+                # The event loop is closed
+                pass
+
+        self._executor.submit(worker_limiter.run, "async", functools.partial(job))
+        limit = self.timeout if timeout is None else timeout
+        self.in_flight += 1
+        try:
+            return await asyncio.wait_for(future, limit)
+        except TimeoutError as e:
+            raise RuntimeError(f"{name} timed out after {limit}s") from e
+        finally:
+            self.in_flight -= 1
+
+    async def ping(self, timeout: float | None = None) -> None:
+        """
+        Ping the ecFlow server.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the server is unreachable or the call times out.
+        """
+        await self._run("ping", self.client.ping, timeout=timeout)
+
+    async def sync_local(self, timeout: float | None = None) -> None:
+        """
+        Synchronize the local definition with the server.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If synchronization fails or times out.
+        """
+        await self._run("sync_local", self.client.sync_local, timeout=timeout)
+
+    async def get_defs(self, timeout: float | None = None) -> Defs | None:
+        """
+        Retrieve the current definitions from the client.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Returns
+        -------
+        ecflow.Defs | None
+            The ecFlow definitions, or None if not available.
+
+        Raises
+        ------
+        RuntimeError
+            If the definitions cannot be retrieved in time.
+        """
+        return await self._run("get_defs", self.client.get_defs, timeout=timeout)
+
+    async def file(self, path: str, file_type: str, max_lines: int | None = None, timeout: float | None = None) -> str:
+        """
+        Retrieve a file (log, script, job) for a specific node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        file_type : str
+            The type of file to retrieve ('jobout', 'script', 'job').
+        max_lines : int | None, optional
+            Only retrieve the last lines of the file, by default None.
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Returns
+        -------
+        str
+            The content of the requested file.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be retrieved in time.
+        """
+        if max_lines is None:
+            return await self._run(f"file {file_type}", self.client.file, path, file_type, timeout=timeout)
+        return await self._run(f"file {file_type}", self.client.file, path, file_type, max_lines, timeout=timeout)
+
+    async def get_log(self, max_lines: int | None = None, timeout: float | None = None) -> str:
+        """
+        Retrieve the server log.
+
+        Parameters
+        ----------
+        max_lines : int | None, optional
+            Only retrieve the last lines of the log, by default None.
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Returns
+        -------
+        str
+            The log content.
+
+        Raises
+        ------
+        RuntimeError
+            If the log cannot be retrieved in time.
+        """
+        if max_lines is None:
+            return await self._run("get_log", self.client.get_log, timeout=timeout)
+        return await self._run("get_log", self.client.get_log, max_lines, timeout=timeout)
+
+    async def query(self, path: str, query_type: str, attribute: str = "", timeout: float | None = None) -> str:
+        """
+        Query a single state or attribute value of a node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        query_type : str
+            The value to query, e.g. 'state', 'meter' or 'label'.
+        attribute : str, optional
+            The attribute name for attribute queries, by default "".
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Returns
+        -------
+        str
+            The value.
+
+        Raises
+        ------
+        RuntimeError
+            If the query fails or times out.
+        """
+        return await self._run(f"query {query_type}", self.client.query, path, query_type, attribute, timeout=timeout)
+
+    async def suite_names(self, timeout: float | None = None) -> list[str]:
+        """
+        List the names of all suites on the server.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Returns
+        -------
+        list[str]
+            The suite names.
+
+        Raises
+        ------
+        RuntimeError
+            If the suites cannot be listed in time.
+        """
+        return await self._run("suite_names", self.client.suite_names, timeout=timeout)
+
+    async def register_suites(self, suites: Iterable[str] | None, timeout: float | None = None) -> None:
+        """
+        Limit synchronization to some suites.
+
+        Parameters
+        ----------
+        suites : Iterable[str] | None
+            The suites to synchronize, or None for all suites.
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the handle cannot be registered in time.
+        """
+        await self._run("register_suites", self.client.register_suites, suites, timeout=timeout)
+
+    async def files(self, path: str, file_types: Iterable[str], timeout: float | None = None) -> dict[str, str | RuntimeError]:
+        """
+        Retrieve several files for a node concurrently.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        file_types : Iterable[str]
+            The file types to retrieve.
+        timeout : float | None, optional
+            Per-file timeout override in seconds, by default None.
+
+        Returns
+        -------
+        dict[str, str | RuntimeError]
+            The content of each file type, or the error raised while fetching it.
+        """
+        types = list(file_types)
+        results = await asyncio.gather(*(self.file(path, t, timeout=timeout) for t in types), return_exceptions=True)
+        out: dict[str, str | RuntimeError] = {}
+        for file_type, result in zip(types, results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(result, RuntimeError):
+                raise result
+            out[file_type] = result
+        return out
+
+    async def command(self, command_name: str, path: str, timeout: float | None = None) -> None:
+        """
+        Run a node command such as 'suspend', 'resume', 'kill', 'force_complete' or 'requeue'.
+
+        Parameters
+        ----------
+        command_name : str
+            The name of the `EcflowClient` method.
+        path : str
+            The absolute path to the node.
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the command fails or times out.
+        """
+        await self._run(command_name, getattr(self.client, command_name), path, timeout=timeout)
+
+    async def alter(self, path: str, alter_type: str, name: str, value: str = "", timeout: float | None = None) -> None:
+        """
+        Alter a node attribute or variable.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        alter_type : str
+            The type of alteration (e.g., 'change', 'add', 'delete').
+        name : str
+            The name of the attribute or variable.
+        value : str, optional
+            The new value, by default "".
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the alteration fails or times out.
+        """
+        await self._run("alter", self.client.alter, path, alter_type, name, value, timeout=timeout)
+
+    async def restart_server(self, timeout: float | None = None) -> None:
+        """
+        Restart the ecFlow server (resume from HALTED state).
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the server cannot be restarted in time.
+        """
+        await self._run("restart_server", self.client.restart_server, timeout=timeout)
+
+    async def halt_server(self, timeout: float | None = None) -> None:
+        """
+        Halt the ecFlow server (suspend scheduling).
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the server cannot be halted in time.
+        """
+        await self._run("halt_server", self.client.halt_server, timeout=timeout)
+
+    async def server_version(self, timeout: float | None = None) -> str:
+        """
+        Retrieve the ecFlow server version.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Timeout override in seconds, by default None.
+
+        Returns
+        -------
+        str
+            The server version string.
+
+        Raises
+        ------
+        RuntimeError
+            If the version cannot be retrieved in time.
+        """
+        return await self._run("server_version", self.client.server_version, timeout=timeout)
+
+    def close(self) -> None:
+        """Shut down the executor without waiting for in-flight calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,325 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Rule-based alerts evaluated against each synchronization.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shlex
+import subprocess
+import time
+import tomllib
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import ecflow
+
+from ectop.constants import ALERTS_FILE_NAME, CONFIG_SUBDIR
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+    from ectop.transitions import Transition
+
+ALERT_ACTIONS: frozenset[str] = frozenset({"bell", "notify", "command"})
+"""Actions a rule can take when it fires."""
+RULE_TYPES: frozenset[str] = frozenset({"state", "deadline", "limit"})
+"""Supported rule types."""
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$")
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+_PLACEHOLDER_RE = re.compile(r"\{(name|path|message)\}")
+
+
+class AlertRule(NamedTuple):
+    """A configured alert rule."""
+
+    name: str
+    """The rule name, shown in alerts."""
+    kind: str
+    """One of RULE_TYPES."""
+    path: str
+    """The node path; for state rules, the node and everything below it."""
+    state: str = ""
+    """State rules: the state entered. Deadline rules: the state to reach, by default complete."""
+    tasks_only: bool = True
+    """State rules: only fire for tasks, not for the families and suites that inherit their state."""
+    by: str = ""
+    """Deadline rules: the local time of day, "HH:MM"."""
+    limit: str = ""
+    """Limit rules: the name of the limit defined on `path`."""
+    duration: float = 0.0
+    """Limit rules: seconds the limit must stay full."""
+    actions: tuple[str, ...] = ("notify",)
+    """What to do when the rule fires, a subset of ALERT_ACTIONS."""
+    command: str = ""
+    """The command run by the "command" action, with {name}, {path} and {message} substituted; other braces are kept."""
+
+
+class Alert(NamedTuple):
+    """A fired alert."""
+
+    rule: AlertRule
+    """The rule that fired."""
+    path: str
+    """The node the alert is about."""
+    message: str
+    """A human readable description."""
+
+
+def default_alerts_path() -> str:
+    """
+    Get the path of the default alert rules file.
+
+    Returns
+    -------
+    str
+        ``$XDG_CONFIG_HOME/ectop/alerts.toml``, or below ``~/.config`` if the variable is unset.
+    """
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(base, CONFIG_SUBDIR, ALERTS_FILE_NAME)
+
+
+def _parse_duration(value: Any) -> float:
+    """
+    Parse a duration such as 600, "90s", "10m" or "1.5h".
+
+    Raises
+    ------
+    ValueError
+        If the value is not a duration.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _DURATION_RE.match(str(value))
+    if not match:
+        raise ValueError(f"invalid duration {value!r}")
+    return float(match[1]) * _DURATION_UNITS[match[2]]
+
+
+def _parse_rule(index: int, raw: dict[str, Any]) -> AlertRule:
+    """
+    Build a rule from its TOML table.
+
+    Raises
+    ------
+    ValueError
+        If the rule is incomplete or invalid.
+    """
+    name = str(raw.get("name") or f"rule {index + 1}")
+    kind = raw.get("type", "state")
+    if kind not in RULE_TYPES:
+        raise ValueError(f"{name}: unknown type {kind!r}, expected one of {sorted(RULE_TYPES)}")
+    path = raw.get("path")
+    if not isinstance(path, str) or not path.startswith("/"):
+        raise ValueError(f"{name}: 'path' must be an absolute node path")
+    actions = tuple(raw.get("actions", ["notify"]))
+    unknown = set(actions) - ALERT_ACTIONS
+    if unknown:
+        raise ValueError(f"{name}: unknown actions {sorted(unknown)}")
+    command = str(raw.get("command", ""))
+    if "command" in actions and not command:
+        raise ValueError(f"{name}: the 'command' action needs a 'command'")
+    try:
+        shlex.split(command)
+    except ValueError as e:
+        raise ValueError(f"{name}: invalid 'command': {e}") from None
+
+    rule = AlertRule(name, kind, path.rstrip("/") or "/", actions=actions, command=command)
+    if kind == "state":
+        if not raw.get("state"):
+            raise ValueError(f"{name}: state rules need a 'state'")
+        return rule._replace(state=str(raw["state"]), tasks_only=bool(raw.get("tasks_only", True)))
+    if kind == "deadline":
+        by = str(raw.get("by", ""))
+        try:
+            datetime.strptime(by, "%H:%M")
+        except ValueError:
+            raise ValueError(f"{name}: deadline rules need 'by' as HH:MM") from None
+        return rule._replace(state=str(raw.get("state", "complete")), by=by)
+    if not raw.get("limit"):
+        raise ValueError(f"{name}: limit rules need a 'limit' name")
+    return rule._replace(limit=str(raw["limit"]), duration=_parse_duration(raw.get("for", 0)))
+
+
+def load_rules(path: str) -> list[AlertRule]:
+    """
+    Load alert rules from a TOML file of ``[[rule]]`` tables.
+
+    Parameters
+    ----------
+    path : str
+        The rules file.
+
+    Returns
+    -------
+    list[AlertRule]
+        The rules, in file order.
+
+    Raises
+    ------
+    RuntimeError
+        If the file cannot be read or a rule is invalid.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        return [_parse_rule(i, raw) for i, raw in enumerate(data.get("rule", []))]
+    except (OSError, tomllib.TOMLDecodeError, ValueError, TypeError) as e:
+        raise RuntimeError(f"Invalid alert rules in {path}: {e}") from e
+
+
+def _ancestry(path: str) -> list[str]:
+    """List a path and the paths above it, nearest first."""
+    parts = path.strip("/").split("/")
+    return ["/" + "/".join(parts[:n]) for n in range(len(parts), 0, -1)]
+
+
+class AlertEngine:
+    """
+    Evaluates alert rules against each synchronization.
+
+    State rules are indexed by path, so each transition is only checked
+    against the rules of its own path and its ancestors: the cost of a sync
+    is proportional to the number of changed nodes, not to the suite size.
+    Deadline and limit rules look up their one node per sync. Each rule
+    fires once per occurrence: a deadline once a day, a limit once per
+    period of being full.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    rules : list[AlertRule]
+        The configured rules.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule]) -> None:
+        """
+        Initialize the AlertEngine.
+
+        Parameters
+        ----------
+        rules : Iterable[AlertRule]
+            The rules, e.g. from `load_rules`.
+        """
+        self.rules: list[AlertRule] = list(rules)
+        self._state_rules: dict[str, list[AlertRule]] = {}
+        for rule in self.rules:
+            if rule.kind == "state":
+                self._state_rules.setdefault(rule.path, []).append(rule)
+        self._deadline_fired: dict[AlertRule, str] = {}
+        self._full_since: dict[AlertRule, float] = {}
+        self._limit_fired: set[AlertRule] = set()
+
+    def evaluate(self, defs: Defs | None, transitions: Iterable[Transition], now: float | None = None) -> list[Alert]:
+        """
+        Find the alerts raised by a synchronization.
+
+        Parameters
+        ----------
+        defs : ecflow.Defs | None
+            The synchronized definitions.
+        transitions : Iterable[Transition]
+            The changes of the synchronization, e.g. from `TransitionRecorder.observe`.
+        now : float | None, optional
+            The current time, by default `time.time()`.
+
+        Returns
+        -------
+        list[Alert]
+            The alerts that fired.
+        """
+        stamp = time.time() if now is None else now
+        alerts: list[Alert] = []
+        if self._state_rules:
+            for t in transitions:
+                for ancestor in _ancestry(t.path):
+                    for rule in self._state_rules.get(ancestor, ()):
+                        if rule.state == t.new and (not rule.tasks_only or self._is_task(defs, t.path)):
+                            alerts.append(Alert(rule, t.path, f"{rule.name}: {t.path} is {t.new} (was {t.old})"))
+        for rule in self.rules:
+            if rule.kind == "deadline":
+                alerts.extend(self._check_deadline(rule, defs, stamp))
+            elif rule.kind == "limit":
+                alerts.extend(self._check_limit(rule, defs, stamp))
+        return alerts
+
+    @staticmethod
+    def _is_task(defs: Defs | None, path: str) -> bool:
+        """Check whether a path is a task rather than a family or suite."""
+        node = defs.find_abs_node(path) if defs else None
+        return node is not None and not isinstance(node, (ecflow.Family, ecflow.Suite))
+
+    def _check_deadline(self, rule: AlertRule, defs: Defs | None, now: float) -> list[Alert]:
+        """Fire a deadline rule once a day if its node is late."""
+        local = datetime.fromtimestamp(now)
+        day = local.strftime("%Y-%m-%d")
+        if local.strftime("%H:%M") < rule.by or self._deadline_fired.get(rule) == day:
+            return []
+        node = defs.find_abs_node(rule.path) if defs else None
+        if node is None:
+            return []
+        state = str(node.get_state())
+        if state == rule.state:
+            return []
+        self._deadline_fired[rule] = day
+        return [Alert(rule, rule.path, f"{rule.name}: {rule.path} is {state}, not {rule.state} by {rule.by}")]
+
+    def _check_limit(self, rule: AlertRule, defs: Defs | None, now: float) -> list[Alert]:
+        """Fire a limit rule once when its limit has been full for long enough."""
+        node = defs.find_abs_node(rule.path) if defs else None
+        limit = next((lim for lim in getattr(node, "limits", ()) if lim.name() == rule.limit), None)
+        if limit is None or limit.value() < limit.limit():
+            self._full_since.pop(rule, None)
+            self._limit_fired.discard(rule)
+            return []
+        since = self._full_since.setdefault(rule, now)
+        if rule in self._limit_fired or now - since < rule.duration:
+            return []
+        self._limit_fired.add(rule)
+        minutes = int((now - since) // 60)
+        return [
+            Alert(
+                rule,
+                rule.path,
+                f"{rule.name}: limit {rule.limit} on {rule.path} full ({limit.value()}/{limit.limit()}) for {minutes} min",
+            )
+        ]
+
+
+def run_command(alert: Alert) -> None:
+    """
+    Start the command hook of an alert without waiting for it.
+
+    Parameters
+    ----------
+    alert : Alert
+        The fired alert.
+
+    Raises
+    ------
+    RuntimeError
+        If the command cannot be started.
+    """
+    values = {"name": alert.rule.name, "path": alert.path, "message": alert.message}
+    try:
+        args = [_PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], arg) for arg in shlex.split(alert.rule.command)]
+    except ValueError as e:
+        raise RuntimeError(f"Invalid alert command {alert.rule.command!r}: {e}") from e
+    try:
+        subprocess.Popen(
+            args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+        )
+    except OSError as e:
+        raise RuntimeError(f"Failed to run alert command {args[0] if args else ''!r}: {e}") from e
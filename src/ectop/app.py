@@ -11,18 +11,25 @@ Main application class for ectop.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
 import tempfile
-from typing import Any
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.command import Hit, Hits, Provider
 from textual.containers import Container, Horizontal
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Input
 
+from ectop.aio import AsyncEcflowClient
+from ectop.alerts import Alert, AlertEngine, default_alerts_path, load_rules, run_command
 from ectop.client import EcflowClient
 from ectop.constants import (
     COLOR_BG,
@@ -33,19 +40,51 @@ from ectop.constants import (
     COLOR_STATUS_BAR_BG,
     COLOR_TEXT,
     COLOR_TEXT_HIGHLIGHT,
+    CONN_DOWN,
+    CONN_HALF_OPEN,
     DEFAULT_EDITOR,
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_REFRESH_INTERVAL,
     ERROR_CONNECTION_FAILED,
+    HEALTH_CHECK_INTERVAL,
+    PREFETCH_IDLE_DELAY,
+    PREFETCH_MAX_FILES,
+    SHUTDOWN_DROP_TIMEOUT,
+    STATE_CACHE_SAVE_INTERVAL,
+    STATUS_STALE,
     STATUS_SYNC_ERROR,
+    WATCH_POLL_INTERVAL,
 )
+from ectop.filecache import FileCache
+from ectop.history import HistoryStore
+from ectop.nodes import node_details, node_signature, tasks_in_state
+from ectop.offline import OfflineClient
+from ectop.replay import ReplayClient, SessionRecorder
+from ectop.runtimes import RuntimeStats
+from ectop.serverlog import ServerLog
+from ectop.statecache import StateCache
+from ectop.trace import CallTracer
+from ectop.transitions import TransitionRecorder
+from ectop.tries import OutputHistory, fetch_try_outputs, try_number, try_output_paths
+from ectop.watch import fetch_status
 from ectop.widgets.content import MainContent
+from ectop.widgets.modals.gantt import GanttScreen
+from ectop.widgets.modals.serverlog import ServerLogScreen
+from ectop.widgets.modals.slow import SlowTasks
+from ectop.widgets.modals.suites import SuitePicker
+from ectop.widgets.modals.triage import AbortedTriage
+from ectop.widgets.modals.tries import TryHistory
 from ectop.widgets.modals.variables import VariableTweaker
 from ectop.widgets.modals.why import WhyInspector
 from ectop.widgets.search import SearchBox
 from ectop.widgets.sidebar import SuiteTree
 from ectop.widgets.statusbar import StatusBar
+from ectop.widgets.watchlist import WatchList
+from ectop.workers import limited, worker_limiter
+
+if TYPE_CHECKING:
+    from ecflow import Defs
 
 
 class EctopCommands(Provider):
@@ -87,6 +126,16 @@ class EctopCommands(Provider):
             ("Restart Server", app.action_restart_server, "Start server scheduling (RUNNING)"),
             ("Halt Server", app.action_halt_server, "Stop server scheduling (HALT)"),
             ("Toggle Live Log", app.action_toggle_live, "Toggle live log updates"),
+            ("Jump in Log", app.action_jump_log, "Jump to a line, percentage or the end of the output"),
+            ("Diff Script/Job", app.action_diff_script, "Diff the .ecf script against the processed job"),
+            ("Diff Tries", app.action_diff_tries, "Diff the output of the previous try against the current one"),
+            ("Output Tries", app.action_tries, "Browse the job output of every try"),
+            ("Aborted Triage", app.action_triage, "List every aborted task with its reason and output tail"),
+            ("Gantt Chart", app.action_gantt, "Chart the last cycle of the selected family's tasks"),
+            ("Slow Tasks", app.action_slow_tasks, "List active tasks running longer than their historical p95"),
+            ("Server Log", app.action_server_log, "Tail the server log, filtered to the selected node"),
+            ("Watch Node", app.action_toggle_watch, "Pin or unpin the selected node on the watch list"),
+            ("Pick Suites", app.action_pick_suites, "Choose the suites to synchronize"),
             ("Quit", app.action_quit, "Quit the application"),
         ]
 
@@ -135,6 +184,13 @@ class Ectop(App):
         padding: 1;
     }}
 
+    #watch_list {{
+        height: auto;
+        max-height: 40%;
+        border-top: solid {COLOR_BORDER};
+        background: {COLOR_SIDEBAR_BG};
+    }}
+
     /* Right Content (Tabs) */
     #main_content {{
         width: 70%;
@@ -225,6 +281,158 @@ class Ectop(App):
     #var_input.hidden {{
         display: none;
     }}
+
+    #tries_container {{
+        padding: 1 2;
+        background: {COLOR_BG};
+        border: thick {COLOR_BORDER};
+        width: 80%;
+        height: 60%;
+    }}
+
+    #tries_title {{
+        text-align: center;
+        background: {COLOR_HEADER_BG};
+        color: white;
+        margin-bottom: 1;
+    }}
+
+    #triage_container {{
+        padding: 1 2;
+        background: {COLOR_BG};
+        border: thick {COLOR_BORDER};
+        width: 90%;
+        height: 85%;
+    }}
+
+    #triage_title {{
+        text-align: center;
+        background: {COLOR_HEADER_BG};
+        color: white;
+        margin-bottom: 1;
+    }}
+
+    #triage_table {{
+        height: 1fr;
+    }}
+
+    #triage_tail_scroll {{
+        height: 12;
+        border-top: solid {COLOR_BORDER};
+        background: {COLOR_CONTENT_BG};
+    }}
+
+    #server_log_container {{
+        padding: 1 2;
+        background: {COLOR_BG};
+        border: thick {COLOR_BORDER};
+        width: 95%;
+        height: 90%;
+    }}
+
+    #server_log_title {{
+        text-align: center;
+        background: {COLOR_HEADER_BG};
+        color: white;
+        margin-bottom: 1;
+    }}
+
+    #server_log_table {{
+        height: 1fr;
+    }}
+
+    #server_log_line {{
+        height: 3;
+        border-top: solid {COLOR_BORDER};
+        background: {COLOR_CONTENT_BG};
+    }}
+
+    #slow_container {{
+        padding: 1 2;
+        background: {COLOR_BG};
+        border: thick {COLOR_BORDER};
+        width: 80%;
+        height: 70%;
+    }}
+
+    #slow_title {{
+        text-align: center;
+        background: {COLOR_HEADER_BG};
+        color: white;
+        margin-bottom: 1;
+    }}
+
+    #slow_table {{
+        height: 1fr;
+    }}
+
+    #suites_container {{
+        padding: 1 2;
+        background: {COLOR_BG};
+        border: thick {COLOR_BORDER};
+        width: 60%;
+        height: 70%;
+    }}
+
+    #suites_title {{
+        text-align: center;
+        background: {COLOR_HEADER_BG};
+        color: white;
+        margin-bottom: 1;
+    }}
+
+    #suites_list {{
+        height: 1fr;
+    }}
+
+    #suites_actions {{
+        height: auto;
+        align: center middle;
+    }}
+
+    #suites_actions Button {{
+        margin: 0 1;
+    }}
+
+    #gantt_container {{
+        padding: 1 2;
+        background: {COLOR_BG};
+        border: thick {COLOR_BORDER};
+        width: 95%;
+        height: 90%;
+    }}
+
+    #gantt_title {{
+        text-align: center;
+        background: {COLOR_HEADER_BG};
+        color: white;
+        margin-bottom: 1;
+    }}
+
+    #gantt_view {{
+        height: 1fr;
+        background: {COLOR_CONTENT_BG};
+    }}
+
+    #gantt_legend {{
+        color: {COLOR_TEXT};
+        margin-top: 1;
+    }}
+
+    #log_output.hidden, #log_large.hidden, #log_jump.hidden, #content_search.hidden {{
+        display: none;
+    }}
+
+    #diff_title {{
+        background: {COLOR_HEADER_BG};
+        color: {COLOR_TEXT_HIGHLIGHT};
+        padding: 0 1;
+    }}
+
+    LargeLogView, DiffView {{
+        background: {COLOR_CONTENT_BG};
+        color: {COLOR_TEXT_HIGHLIGHT};
+    }}
     """
 
     COMMANDS = App.COMMANDS | {EctopCommands}
@@ -249,6 +457,18 @@ class Ectop(App):
         Binding("t", "toggle_live", "Toggle Live Log"),
         Binding("v", "variables", "Variables"),
         Binding("ctrl+f", "search_content", "Search in Content"),
+        Binding("ctrl+g", "jump_log", "Jump in Log"),
+        Binding("d", "diff_script", "Diff Script/Job"),
+        Binding("D", "diff_tries", "Diff Tries"),
+        Binding("o", "tries", "Output Tries"),
+        Binding("A", "triage", "Aborted Triage"),
+        Binding("T", "gantt", "Gantt Chart"),
+        Binding("L", "slow_tasks", "Slow Tasks"),
+        Binding("M", "server_log", "Server Log"),
+        Binding("W", "toggle_watch", "Watch"),
+        Binding("P", "pick_suites", "Suites"),
+        Binding("f3", "next_match", "Next Match"),
+        Binding("shift+f3", "previous_match", "Previous Match"),
     ]
 
     def __init__(
@@ -256,6 +476,13 @@ class Ectop(App):
         host: str = DEFAULT_HOST,
         port: int = DEFAULT_PORT,
         refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        trace_path: str | None = None,
+        record_dir: str | None = None,
+        replay_dir: str | None = None,
+        replay_speed: float = 1.0,
+        offline_path: str | None = None,
+        alerts_path: str | None = None,
+        suites: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -269,6 +496,20 @@ class Ectop(App):
             The ecFlow server port, by default DEFAULT_PORT.
         refresh_interval : float, optional
             The interval for live log updates, by default DEFAULT_REFRESH_INTERVAL.
+        trace_path : str | None, optional
+            File to write a JSON-lines trace of all client calls to, by default None.
+        record_dir : str | None, optional
+            Directory to record the full session to for later replay, by default None.
+        replay_dir : str | None, optional
+            Recorded session directory to replay instead of connecting to a server, by default None.
+        replay_speed : float, optional
+            Replay latency scale (0 for as fast as possible), by default 1.0.
+        offline_path : str | None, optional
+            Checkpoint or `.def` file to browse instead of connecting to a server, by default None.
+        alerts_path : str | None, optional
+            Alert rules file, by default None (`default_alerts_path()`, if it exists).
+        suites : list[str] | None, optional
+            Only synchronize these suites, by default None (all suites).
         **kwargs : Any
             Additional keyword arguments for the Textual App.
         """
@@ -277,6 +518,30 @@ class Ectop(App):
         self.port = port
         self.refresh_interval = refresh_interval
         self.ecflow_client: EcflowClient | None = None
+        self.async_client: AsyncEcflowClient | None = None
+        self.replay_dir = replay_dir
+        self.replay_speed = replay_speed
+        self.offline_path = offline_path
+        self.output_history = OutputHistory()
+        self.file_cache = FileCache()
+        self.transitions = TransitionRecorder()
+        self.runtime_stats = RuntimeStats()
+        self.server_log = ServerLog()
+        self.alerts_path = alerts_path
+        self.suites = suites
+        self.alert_engine = AlertEngine([])
+        self._prefetch_timer: Timer | None = None
+        self._watch_polling: bool = False
+        # Detached definitions of the last refresh, read by the watch list for attribute names
+        self._watch_defs: Defs | None = None
+        # Replayed sessions and files are not a live server, so they neither read nor overwrite its cache
+        self.state_cache: StateCache | None = None if replay_dir or offline_path else StateCache(host, port)
+        self.history_store: HistoryStore | None = None if replay_dir or offline_path else HistoryStore(host, port)
+        self._saved_ui_state: dict[str, Any] | None = None
+        self._snapshot_saved_at: float = 0.0
+        self.tracer: CallTracer | SessionRecorder | None = CallTracer(trace_path) if trace_path else None
+        if record_dir:
+            self.tracer = SessionRecorder(record_dir, host, port, tracer=self.tracer)
 
     def compose(self) -> ComposeResult:
         """
@@ -290,7 +555,7 @@ class Ectop(App):
         yield Header(show_clock=True)
         yield SearchBox(placeholder="Search nodes...", id="search_box")
         yield Horizontal(
-            Container(SuiteTree("ecFlow Server", id="suite_tree"), id="sidebar"),
+            Container(SuiteTree("ecFlow Server", id="suite_tree"), WatchList(id="watch_list"), id="sidebar"),
             MainContent(id="main_content"),
         )
         yield StatusBar(id="status_bar")
@@ -304,8 +569,112 @@ class Ectop(App):
         -------
         None
         """
+        self.query_one("#suite_tree", SuiteTree).runtime_stats = self.runtime_stats
+        self._load_alert_rules()
         self._initial_connect()
         self.set_interval(self.refresh_interval, self._live_log_tick)
+        self.set_interval(HEALTH_CHECK_INTERVAL, self._health_tick)
+        self.set_interval(WATCH_POLL_INTERVAL, self._watch_tick)
+
+    def _load_alert_rules(self) -> None:
+        """
+        Load the alert rules, if a rules file is given or the default one exists.
+
+        Returns
+        -------
+        None
+        """
+        path = self.alerts_path or default_alerts_path()
+        if not self.alerts_path and not os.path.exists(path):
+            return
+        try:
+            self.alert_engine = AlertEngine(load_rules(path))
+        except RuntimeError as e:
+            self.notify(str(e), severity="error", timeout=10)
+
+    def _dispatch_alerts(self, alerts: list[Alert]) -> None:
+        """
+        Take the actions of fired alerts.
+
+        Parameters
+        ----------
+        alerts : list[Alert]
+            The alerts fired by a synchronization.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Called from the refresh worker thread; commands are started without waiting for them.
+        """
+        for alert in alerts:
+            if "bell" in alert.rule.actions:
+                self.call_from_thread(self.bell)
+            if "notify" in alert.rule.actions:
+                self.call_from_thread(self.notify, alert.message, title="Alert", severity="error", timeout=30)
+            if "command" in alert.rule.actions:
+                try:
+                    run_command(alert)
+                except RuntimeError as e:
+                    self.call_from_thread(self.notify, str(e), severity="error")
+
+    def on_unmount(self) -> None:
+        """
+        Handle the unmount event to release resources.
+
+        Returns
+        -------
+        None
+        """
+        if self.async_client:
+            self.async_client.close()
+        if self.tracer:
+            self.tracer.close()
+        if self.history_store:
+            self.history_store.close()
+        client = self.ecflow_client
+        if client and client.suites and client.health.state not in (CONN_DOWN, CONN_HALF_OPEN):
+            # Client handles outlive the connection on the server unless dropped,
+            # but an unresponsive server must not hold up the exit
+            dropper = threading.Thread(target=self._drop_suites, args=(client,), daemon=True)
+            dropper.start()
+            dropper.join(SHUTDOWN_DROP_TIMEOUT)
+
+    @staticmethod
+    def _drop_suites(client: EcflowClient) -> None:
+        """
+        Drop the client handle registered on the server, ignoring failures.
+
+        Parameters
+        ----------
+        client : EcflowClient
+            The client whose handle is dropped.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            client.register_suites(None)
+        except RuntimeError:
+            pass
+
+    async def action_quit(self) -> None:
+        """
+        Persist the tree UI state and exit.
+
+        Returns
+        -------
+        None
+        """
+        if self.state_cache:
+            try:
+                self.state_cache.save_ui_state(self.query_one("#suite_tree", SuiteTree).ui_state())
+            except RuntimeError:
+                pass
+        await super().action_quit()
 
     def on_tree_node_selected(self, event: SuiteTree.NodeSelected[str]) -> None:
         """
@@ -319,7 +688,149 @@ class Ectop(App):
         if event.node.data:
             self.action_load_node()
 
+    def on_tree_node_highlighted(self, event: SuiteTree.NodeHighlighted[str]) -> None:
+        """
+        Restart the idle timer of the prefetcher when the cursor moves.
+
+        Parameters
+        ----------
+        event : SuiteTree.NodeHighlighted[str]
+            The node highlight event.
+        """
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        """
+        Prefetch outputs of likely-next nodes once navigation has been idle for a while.
+
+        Returns
+        -------
+        None
+        """
+        if self._prefetch_timer:
+            self._prefetch_timer.stop()
+        self._prefetch_timer = self.set_timer(PREFETCH_IDLE_DELAY, self._start_prefetch)
+
+    def _start_prefetch(self) -> None:
+        """
+        Collect the siblings adjacent to the cursor and start a prefetch round.
+
+        Returns
+        -------
+        None
+        """
+        self._prefetch_timer = None
+        if not self.ecflow_client:
+            return
+        siblings: list[str] = []
+        try:
+            cursor = self.query_one("#suite_tree", SuiteTree).cursor_node
+        except Exception:
+            cursor = None
+        if cursor is not None and cursor.parent is not None:
+            children = list(cursor.parent.children)
+            idx = children.index(cursor)
+            for neighbour in (children[idx + 1 : idx + 2], children[max(0, idx - 1) : idx]):
+                siblings.extend(node.data for node in neighbour if node.data)
+        self._prefetch_worker(siblings)
+
+    def _show_runtime(self, path: str) -> None:
+        """
+        Show the run time statistics and predicted completion of a node in the Timeline tab.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#main_content", MainContent).show_runtime(self.runtime_stats.summary(path), self.runtime_stats.eta(path))
+
+    @work(thread=True, exclusive=True, group="history")
+    @limited("history")
+    def _run_history_worker(self, path: str) -> None:
+        """
+        Query the persisted run times of a node for the Timeline tab.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+
+        Returns
+        -------
+        None
+        """
+        if not self.history_store:
+            return
+        runs = self.history_store.runs(path)
+        # Give nodes that have not completed since startup their statistics from earlier sessions
+        self.runtime_stats.seed(path, [run.duration for run in runs if run.state == "complete"])
+        self.call_from_thread(self.query_one("#main_content", MainContent).show_run_history, runs)
+        self.call_from_thread(self._show_runtime, path)
+
+    def _user_busy(self) -> bool:
+        """
+        Whether user-initiated work is in progress.
+
+        Returns
+        -------
+        bool
+            True if any other worker or an awaitable client call is running.
+        """
+        if self.async_client and self.async_client.in_flight:
+            return True
+        return worker_limiter.busy(exclude=("prefetch",))
+
     @work(thread=True)
+    @limited("prefetch", coalesce=True)
+    def _prefetch_worker(self, siblings: list[str]) -> None:
+        """
+        Fetch job outputs of adjacent siblings and aborted tasks into the file cache.
+
+        Parameters
+        ----------
+        siblings : list[str]
+            Paths of the nodes next to the cursor, fetched first.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is a low-priority background worker. It runs one fetch at a
+        time, skips outputs that are already cached, and stops as soon as
+        any user-initiated work is in progress.
+        """
+        if not self.ecflow_client:
+            return
+        try:
+            defs = self.ecflow_client.get_defs()
+        except RuntimeError:
+            return
+        candidates = list(dict.fromkeys([*siblings, *tasks_in_state(defs, "aborted")]))
+        fetched = 0
+        for path in candidates:
+            if fetched >= PREFETCH_MAX_FILES or self._user_busy():
+                return
+            signature = node_signature(defs, path)
+            # Running outputs change constantly, so they are not worth prefetching
+            if signature is None or signature[0] in ("active", "submitted"):
+                continue
+            if self.file_cache.get(path, "jobout", signature) is not None:
+                continue
+            try:
+                self.file_cache.put(path, "jobout", self.ecflow_client.file(path, "jobout"), signature)
+            except RuntimeError:
+                continue
+            fetched += 1
+
+    @work(thread=True)
+    @limited("connect")
     def _initial_connect(self) -> None:
         """
         Perform initial connection to the ecFlow server.
@@ -332,9 +843,16 @@ class Ectop(App):
         -----
         This is a background worker that performs blocking I/O.
         """
+        self._show_cached_state()
         try:
-            self.ecflow_client = EcflowClient(self.host, self.port)
+            self.ecflow_client = self._create_client()
+            self.async_client = AsyncEcflowClient(self.ecflow_client)
+            if self.offline_path:
+                self.call_from_thread(self.notify, f"Loading {self.offline_path}...")
+            # Offline files are parsed by the first call, here in the worker thread
             self.ecflow_client.ping()
+            if self.suites:
+                self._register_suites(self.suites)
             # Initial refresh
             self.action_refresh()
         except RuntimeError as e:
@@ -344,6 +862,181 @@ class Ectop(App):
         except Exception as e:
             self.call_from_thread(self.notify, f"Unexpected Error: {e}", severity="error")
 
+    def _register_suites(self, suites: list[str]) -> None:
+        """
+        Limit synchronization to some suites, falling back to all suites on failure.
+
+        Parameters
+        ----------
+        suites : list[str]
+            The suites to synchronize; empty for all suites.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Called from worker threads, since registering contacts the server.
+        """
+        if not self.ecflow_client:
+            return
+        try:
+            self.ecflow_client.register_suites(suites)
+        except RuntimeError as e:
+            self.call_from_thread(self.notify, f"{e}; synchronizing all suites", severity="error")
+            return
+        finally:
+            self.suites = self.ecflow_client.suites
+        scope = ", ".join(suites) if suites else "all suites"
+        self.call_from_thread(self.notify, f"Synchronizing {scope}")
+
+    def _show_cached_state(self) -> None:
+        """
+        Show the persisted snapshot of the server as stale until the first sync.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Called from the connect worker. The saved expanded nodes, cursor and
+        filter are restored on the cached tree, and again on the first live
+        tree, so the view is kept when the live data replaces the snapshot.
+        """
+        if not self.state_cache:
+            return
+        ui_state = self.state_cache.load_ui_state()
+        self._saved_ui_state = ui_state or None
+        cached = self.state_cache.load_defs()
+        if cached is None:
+            return
+        defs, saved_at = cached
+        synced_at = datetime.fromtimestamp(saved_at)
+        tree = self.query_one("#suite_tree", SuiteTree)
+        status_bar = self.query_one("#status_bar", StatusBar)
+        self.call_from_thread(tree.update_tree, self.host, self.port, defs, ui_state)
+        self.call_from_thread(
+            status_bar.update_status,
+            self.host,
+            self.port,
+            status=f"{STATUS_STALE} (cached {synced_at:%Y-%m-%d %H:%M})",
+            synced_at=synced_at,
+        )
+
+    def _merged_ui_state(self, tree: SuiteTree) -> dict[str, Any]:
+        """
+        Get the tree state to restore after a rebuild.
+
+        Parameters
+        ----------
+        tree : SuiteTree
+            The suite tree widget.
+
+        Returns
+        -------
+        dict[str, Any]
+            The current state of the tree. On the first live sync it is merged
+            with the persisted state, which may still be being restored.
+        """
+        current = self.call_from_thread(tree.ui_state)
+        saved, self._saved_ui_state = self._saved_ui_state, None
+        if not saved:
+            return current
+        return {
+            "expanded": sorted({*(saved.get("expanded") or []), *current["expanded"]}),
+            "cursor": current["cursor"] or saved.get("cursor"),
+            "filter": current["filter"] if current["filter"] is not None else saved.get("filter"),
+        }
+
+    def _persist_state(self, defs: Defs | None, ui_state: dict[str, Any]) -> None:
+        """
+        Persist the tree UI state and, at most every STATE_CACHE_SAVE_INTERVAL seconds, the definitions.
+
+        Parameters
+        ----------
+        defs : ecflow.Defs | None
+            The synchronized definitions.
+        ui_state : dict[str, Any]
+            The tree state restored after the sync.
+
+        Returns
+        -------
+        None
+        """
+        if not self.state_cache or not defs:
+            return
+        now = time.monotonic()
+        try:
+            self.state_cache.save_ui_state(ui_state)
+            if self._snapshot_saved_at and now - self._snapshot_saved_at < STATE_CACHE_SAVE_INTERVAL:
+                return
+            self._snapshot_saved_at = now
+            self.state_cache.save_defs(defs)
+        except RuntimeError as e:
+            self.call_from_thread(self.notify, f"Snapshot not saved: {e}", severity="warning")
+
+    def _health_tick(self) -> None:
+        """
+        Show the connection state and start a reconnect attempt when one is due.
+
+        Returns
+        -------
+        None
+        """
+        if not self.ecflow_client:
+            return
+        health = self.ecflow_client.health
+        self.query_one("#status_bar", StatusBar).update_connection(health.state, health.retry_in())
+        if health.retry_due():
+            self._reconnect()
+
+    @work(thread=True)
+    @limited("connect", coalesce=True)
+    def _reconnect(self) -> None:
+        """
+        Probe the server and resynchronize once it is reachable again.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is a background worker that performs blocking I/O. Failures only
+        update the connection health, which schedules the next attempt.
+        """
+        if not self.ecflow_client:
+            return
+        try:
+            self.ecflow_client.ping()
+        except RuntimeError:
+            return
+        self.call_from_thread(self.notify, f"Reconnected to {self.ecflow_client.host}:{self.ecflow_client.port}")
+        self.action_refresh()
+
+    def _create_client(self) -> EcflowClient:
+        """
+        Create the client used for all server access.
+
+        Returns
+        -------
+        EcflowClient
+            A live client, a `ReplayClient` when replaying a recorded session,
+            or an `OfflineClient` when browsing a file.
+
+        Raises
+        ------
+        RuntimeError
+            If the client cannot be initialized.
+        """
+        if self.offline_path:
+            return OfflineClient(self.offline_path, tracer=self.tracer)
+        if self.replay_dir:
+            return ReplayClient(self.replay_dir, speed=self.replay_speed, tracer=self.tracer)
+        return EcflowClient(self.host, self.port, tracer=self.tracer)
+
     def _update_tree_error(self, tree: SuiteTree) -> None:
         """
         Update tree root to show error.
@@ -360,6 +1053,7 @@ class Ectop(App):
         tree.root.label = f"[red]{ERROR_CONNECTION_FAILED} (Check Host/Port)[/]"
 
     @work(exclusive=True, thread=True)
+    @limited("sync")
     def action_refresh(self) -> None:
         """
         Fetch suites from server and rebuild the tree.
@@ -382,6 +1076,12 @@ class Ectop(App):
         try:
             self.ecflow_client.sync_local()
             defs = self.ecflow_client.get_defs()
+            self._watch_defs = defs
+            found = self.transitions.observe(defs)
+            self.runtime_stats.update(found)
+            if self.history_store:
+                self.history_store.record(found)
+            self._dispatch_alerts(self.alert_engine.evaluate(defs, found))
             status = "Connected"
             version = "Unknown"
             if defs:
@@ -391,11 +1091,26 @@ class Ectop(App):
             except RuntimeError:
                 pass
 
-            self.call_from_thread(tree.update_tree, self.ecflow_client.host, self.ecflow_client.port, defs)
+            ui_state = self._merged_ui_state(tree)
+            self.call_from_thread(tree.update_tree, self.ecflow_client.host, self.ecflow_client.port, defs, ui_state)
             self.call_from_thread(
                 status_bar.update_status, self.ecflow_client.host, self.ecflow_client.port, status=status, version=version
             )
             self.call_from_thread(self.notify, "Tree Refreshed")
+            self.call_from_thread(self._schedule_prefetch)
+            content_area = self.query_one("#main_content", MainContent)
+            timeline_path = content_area.timeline_path
+            if timeline_path:
+                # Looked up here, off the UI thread, and only when the shown subtree changed
+                prefix = timeline_path.rstrip("/") + "/"
+                if any(t.path == timeline_path or t.path.startswith(prefix) for t in found):
+                    transitions = self.transitions.for_path(timeline_path, descendants=True)
+                    self.call_from_thread(content_area.show_timeline, timeline_path, transitions)
+                self.call_from_thread(self._show_runtime, timeline_path)
+            if content_area.details is not None:
+                # Repaints only if the attributes of the loaded node changed
+                self.call_from_thread(content_area.show_details, node_details(defs, content_area.details.path))
+            self._persist_state(defs, ui_state)
         except RuntimeError as e:
             self.call_from_thread(
                 status_bar.update_status, self.ecflow_client.host, self.ecflow_client.port, status=STATUS_SYNC_ERROR
@@ -405,6 +1120,7 @@ class Ectop(App):
             self.call_from_thread(self.notify, f"Unexpected Error: {e}", severity="error")
 
     @work(thread=True)
+    @limited("control")
     def action_restart_server(self) -> None:
         """
         Restart the ecFlow server (RUNNING).
@@ -419,6 +1135,7 @@ class Ectop(App):
             self.call_from_thread(self.notify, f"Restart Error: {e}", severity="error")
 
     @work(thread=True)
+    @limited("control")
     def action_halt_server(self) -> None:
         """
         Halt the ecFlow server (HALT).
@@ -447,45 +1164,309 @@ class Ectop(App):
         except Exception:
             return None
 
-    @work(thread=True)
-    def action_load_node(self) -> None:
-        """Fetch Output, Script, and Job files for the selected node."""
+    @work(exclusive=True, group="load_node")
+    async def action_load_node(self) -> None:
+        """
+        Fetch Output, Script, and Job files for the selected node.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an exclusive async worker: the three files are fetched
+        concurrently, and selecting another node cancels a load in progress.
+        Files already in `file_cache` for the node's current state and try
+        number, e.g. from the prefetcher, are not fetched again.
+        """
         path = self.get_selected_path()
-        if not path or not self.ecflow_client:
-            self.call_from_thread(self.notify, "No node selected", severity="warning")
+        if not path or not self.async_client:
+            self.notify("No node selected", severity="warning")
             return
 
-        self.call_from_thread(self.notify, f"Loading files for {path}...")
+        self.notify(f"Loading files for {path}...")
         content_area = self.query_one("#main_content", MainContent)
 
+        try_no = 0
+        signature = None
+        defs = None
         try:
             # Sync to get latest try numbers for filenames
-            self.ecflow_client.sync_local()
+            await self.async_client.sync_local()
+            defs = await self.async_client.get_defs()
+            try_no = try_number(defs, path)
+            signature = node_signature(defs, path)
         except RuntimeError:
             pass
 
+        file_types = ("jobout", "script", "job")
+        results: dict[str, str | RuntimeError] = {}
+        if signature is not None:
+            for file_type in file_types:
+                # The output of a running task changes constantly, always fetch it
+                if file_type == "jobout" and signature[0] in ("active", "submitted"):
+                    continue
+                cached = self.file_cache.get(path, file_type, signature)
+                if cached is not None:
+                    results[file_type] = cached
+        missing = [t for t in file_types if t not in results]
+        if missing:
+            fetched = await self.async_client.files(path, missing)
+            for file_type, result in fetched.items():
+                if isinstance(result, str):
+                    self.file_cache.put(path, file_type, result, signature)
+            results.update(fetched)
+
+        content_area.show_timeline(path, self.transitions.for_path(path, descendants=True))
+        if defs is not None:
+            content_area.show_details(node_details(defs, path))
+        self._show_runtime(path)
+        self._run_history_worker(path)
+
         # 1. Output Log
-        try:
-            content = self.ecflow_client.file(path, "jobout")
-            self.call_from_thread(content_area.update_log, content)
-        except RuntimeError:
-            self.call_from_thread(content_area.show_error, "#log_output", "File type 'jobout' not found.")
+        if isinstance(results["jobout"], str):
+            content_area.update_log(results["jobout"])
+            if try_no:
+                self.output_history.put(path, try_no, results["jobout"])
+        else:
+            content_area.show_error("#log_output", "File type 'jobout' not found.")
 
         # 2. Script
-        try:
-            content = self.ecflow_client.file(path, "script")
-            self.call_from_thread(content_area.update_script, content)
-        except RuntimeError:
-            self.call_from_thread(content_area.show_error, "#view_script", "File type 'script' not available.")
+        if isinstance(results["script"], str):
+            content_area.update_script(results["script"])
+        else:
+            content_area.show_error("#view_script", "File type 'script' not available.")
 
         # 3. Job
+        if isinstance(results["job"], str):
+            content_area.update_job(results["job"])
+        else:
+            content_area.show_error("#view_job", "File type 'job' not available.")
+
+    @work(exclusive=True, group="diff")
+    async def action_diff_script(self) -> None:
+        """
+        Diff the .ecf script of the selected node against its processed job.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker; both files are fetched concurrently.
+        """
+        path = self.get_selected_path()
+        if not path or not self.async_client:
+            self.notify("No node selected", severity="warning")
+            return
+        results = await self.async_client.files(path, ("script", "job"))
+        for file_type, result in results.items():
+            if not isinstance(result, str):
+                self.notify(f"Cannot diff: {file_type} not available ({result})", severity="error")
+                return
+        self.query_one("#main_content", MainContent).show_diff(f"{path}: Script → Job", str(results["script"]), str(results["job"]))
+
+    @work(exclusive=True, group="diff")
+    async def action_diff_tries(self) -> None:
+        """
+        Diff the output of the previous try of the selected task against the current one.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker. Both outputs are fetched concurrently: the
+        current one from the server, the previous one from `output_history`
+        or, failing that, from its output file if it is locally accessible.
+        """
+        path = self.get_selected_path()
+        if not path or not self.async_client:
+            self.notify("No node selected", severity="warning")
+            return
         try:
-            content = self.ecflow_client.file(path, "job")
-            self.call_from_thread(content_area.update_job, content)
-        except RuntimeError:
-            self.call_from_thread(content_area.show_error, "#view_job", "File type 'job' not available.")
+            await self.async_client.sync_local()
+            defs = await self.async_client.get_defs()
+        except RuntimeError as e:
+            self.notify(f"Cannot diff tries: {e}", severity="error")
+            return
+        try_no = try_number(defs, path)
+        if try_no < 2:
+            self.notify(f"{path} has no previous try", severity="warning")
+            return
+        outputs = await fetch_try_outputs(
+            self.async_client, self.output_history, path, try_output_paths(defs, path), try_no, (try_no - 1, try_no)
+        )
+        previous, current = outputs[try_no - 1], outputs[try_no]
+        if not isinstance(previous, str) or not isinstance(current, str):
+            error = current if not isinstance(current, str) else previous
+            self.notify(f"Cannot diff tries: {error}", severity="error")
+            return
+        self.query_one("#main_content", MainContent).show_diff(f"{path}: Try {try_no - 1} → Try {try_no}", previous, current)
+
+    def action_tries(self) -> None:
+        """
+        Open the output try browser for the selected task.
+
+        Returns
+        -------
+        None
+        """
+        path = self.get_selected_path()
+        if not path or not self.async_client:
+            self.notify("No node selected", severity="warning")
+            return
+        self.push_screen(TryHistory(path, self.async_client, self.output_history, self.query_one("#main_content", MainContent)))
+
+    def action_gantt(self) -> None:
+        """
+        Open a Gantt chart of the selected node's tasks.
+
+        Returns
+        -------
+        None
+        """
+        path = self.get_selected_path()
+        if not path:
+            self.notify("No node selected", severity="warning")
+            return
+        self.push_screen(GanttScreen(path, self.transitions.for_path(path, descendants=True)))
+
+    def action_server_log(self) -> None:
+        """
+        Open the server log, filtered to the selected node.
+
+        Returns
+        -------
+        None
+        """
+        if not self.async_client:
+            self.notify("Not connected", severity="warning")
+            return
+        self.push_screen(ServerLogScreen(self.async_client, self.server_log, self.get_selected_path()))
+
+    def action_toggle_watch(self) -> None:
+        """
+        Pin the selected node on the watch list, or unpin it.
+
+        Returns
+        -------
+        None
+        """
+        path = self.get_selected_path()
+        if not path:
+            self.notify("No node selected", severity="warning")
+            return
+        found = self.transitions.for_path(path)
+        try:
+            watched = self.query_one("#watch_list", WatchList).toggle(path, since=found[-1].time if found else None)
+        except RuntimeError as e:
+            self.notify(str(e), severity="warning")
+            return
+        self.notify(f"{'Watching' if watched else 'Stopped watching'} {path}")
+        if watched:
+            self._watch_tick()
+
+    def _watch_tick(self) -> None:
+        """Periodic tick to query the watched nodes, unless a poll is still running."""
+        paths = self.query_one("#watch_list", WatchList).paths
+        if paths and self.async_client and not self._watch_polling:
+            self._poll_watch(list(paths))
+
+    @work(group="watch")
+    async def _poll_watch(self, paths: list[str]) -> None:
+        """
+        Query the state, meters and labels of the watched nodes.
+
+        Parameters
+        ----------
+        paths : list[str]
+            The watched node paths.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker. Each node costs one small query per value,
+        all issued concurrently, instead of a full synchronization. Attribute
+        names and meter ranges come from the definitions of the last refresh,
+        so a tick never waits on the client state lock behind a sync.
+        """
+        if not self.async_client:
+            return
+        self._watch_polling = True
+        try:
+            defs = self._watch_defs
+            statuses = await asyncio.gather(*(fetch_status(self.async_client, defs, path) for path in paths))
+            self.query_one("#watch_list", WatchList).update_status(list(statuses))
+        finally:
+            self._watch_polling = False
+
+    def action_pick_suites(self) -> None:
+        """
+        Choose the suites to synchronize.
+
+        Returns
+        -------
+        None
+        """
+        if not self.async_client or not self.ecflow_client:
+            self.notify("Not connected", severity="warning")
+            return
+        self.push_screen(SuitePicker(self.async_client, self.ecflow_client.suites, self._apply_suites))
+
+    @work(thread=True, exclusive=True, group="suites")
+    @limited("control")
+    def _apply_suites(self, suites: list[str]) -> None:
+        """
+        Register the chosen suites and synchronize again.
+
+        Parameters
+        ----------
+        suites : list[str]
+            The suites to synchronize; empty for all suites.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is a background worker that performs blocking I/O.
+        """
+        self._register_suites(suites)
+        self.action_refresh()
+
+    def action_slow_tasks(self) -> None:
+        """
+        Open the list of active tasks running longer than usual.
+
+        Returns
+        -------
+        None
+        """
+        self.push_screen(SlowTasks(self.runtime_stats, self.query_one("#suite_tree", SuiteTree)))
+
+    def action_triage(self) -> None:
+        """
+        Open the triage screen listing every aborted task.
+
+        Returns
+        -------
+        None
+        """
+        if not self.async_client:
+            self.notify("Not connected", severity="warning")
+            return
+        self.push_screen(AbortedTriage(self.async_client, self.query_one("#suite_tree", SuiteTree)))
 
     @work(thread=True)
+    @limited("control")
     def _run_client_command(self, command_name: str, path: str | None) -> None:
         """
         Generic helper to run ecflow commands in a worker thread.
@@ -611,6 +1592,7 @@ class Ectop(App):
             content_area.active = "tab_output"
 
     @work(thread=True)
+    @limited("poll", coalesce=True)
     def _live_log_tick(self) -> None:
         """Periodic tick to update the live log if enabled."""
         if not self.ecflow_client:
@@ -663,7 +1645,38 @@ class Ectop(App):
         """
         self.query_one("#main_content", MainContent).action_search()
 
+    def action_next_match(self) -> None:
+        """
+        Jump to the next content search match.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#main_content", MainContent).action_next_match()
+
+    def action_previous_match(self) -> None:
+        """
+        Jump to the previous content search match.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#main_content", MainContent).action_previous_match()
+
+    def action_jump_log(self) -> None:
+        """
+        Open the jump input of the Output tab.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#main_content", MainContent).action_jump()
+
     @work(thread=True)
+    @limited("files")
     def action_edit_script(self) -> None:
         """Open the node script in an editor and update it on the server."""
         path = self.get_selected_path()
@@ -704,6 +1717,7 @@ class Ectop(App):
         self._finish_edit(temp_path, path, old_content)
 
     @work(thread=True)
+    @limited("control")
     def _finish_edit(self, temp_path: str, path: str, old_content: str) -> None:
         """
         Process the edited script and update the server.
@@ -727,6 +1741,7 @@ class Ectop(App):
             if new_content != old_content:
                 if self.ecflow_client:
                     self.ecflow_client.alter(path, "change", "script", new_content)
+                    self.file_cache.invalidate(path)
                     self.call_from_thread(self.notify, "Script updated on server")
                     self.call_from_thread(self._prompt_requeue, path)
             else:
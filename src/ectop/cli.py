@@ -44,9 +44,74 @@ def main() -> None:
         help=f"Automatic refresh interval in seconds (default: {DEFAULT_REFRESH_INTERVAL} or ECTOP_REFRESH)",
     )
 
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=os.environ.get("ECTOP_TRACE"),
+        help="Write a JSON-lines trace of all ecFlow client calls to this file (default: ECTOP_TRACE)",
+    )
+
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        help="Record the full session (Defs snapshots and file contents) to this directory",
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        help="Replay a session recorded with --record instead of connecting to a server",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay time scale: 1.0 keeps the original timing, 2.0 is twice as fast, 0 is as fast as possible (default: 1.0)",
+    )
+
+    parser.add_argument(
+        "--offline",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Browse a checkpoint (.check) or definition (.def) file without a server",
+    )
+
+    parser.add_argument(
+        "--alerts",
+        type=str,
+        default=os.environ.get("ECTOP_ALERTS"),
+        metavar="FILE",
+        help="Alert rules file (default: ECTOP_ALERTS or ~/.config/ectop/alerts.toml if it exists)",
+    )
+
+    parser.add_argument(
+        "--suites",
+        type=lambda value: [name for name in value.split(",") if name],
+        default=None,
+        metavar="SUITE[,SUITE...]",
+        help="Only synchronize these suites, registered as an ecFlow client handle (default: all suites)",
+    )
+
     args = parser.parse_args()
+    if args.offline and args.replay:
+        parser.error("--offline and --replay cannot be combined")
+    if args.suites and args.offline:
+        parser.error("--suites cannot be used with --offline")
 
-    app = Ectop(host=args.host, port=args.port, refresh_interval=args.refresh)
+    app = Ectop(
+        host=args.host,
+        port=args.port,
+        refresh_interval=args.refresh,
+        trace_path=args.trace,
+        record_dir=args.record,
+        replay_dir=args.replay,
+        replay_speed=args.replay_speed,
+        offline_path=args.offline,
+        alerts_path=args.alerts,
+        suites=args.suites,
+    )
     app.run()
 
 
@@ -11,13 +11,158 @@ ecFlow Client Wrapper for ectop.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import ecflow
 
+from ectop.constants import (
+    CLIENT_POOL_SIZE,
+    CONN_BACKOFF_INITIAL,
+    CONN_BACKOFF_MAX,
+    CONN_CONNECTED,
+    CONN_DEGRADED,
+    CONN_DOWN,
+    CONN_FAILURE_THRESHOLD,
+    CONN_HALF_OPEN,
+)
+from ectop.snapshot import copy_defs
+
 if TYPE_CHECKING:
     from ecflow import Defs
 
+    from ectop.trace import CallTracer
+
+STATEFUL_CALLS: frozenset[str] = frozenset({"sync_local", "get_defs", "ch_register", "ch_drop"})
+"""`ecflow.Client` methods that read or mutate the client's local Defs or its suite handle."""
+CONNECTIVITY_CALLS: frozenset[str] = frozenset({"ping", "sync_local"})
+"""`ecflow.Client` methods whose failures indicate the server is unreachable."""
+LOCAL_CALLS: frozenset[str] = frozenset({"get_defs"})
+"""`ecflow.Client` methods answered from the client's local state, whose success says nothing about the server."""
+
+
+class ConnectionHealth:
+    """
+    Connection state machine with exponential backoff and a circuit breaker.
+
+    The state moves from connected to degraded on the first connectivity
+    failure and to down after `failure_threshold` consecutive failures. Each
+    failure schedules the next retry with an exponentially growing delay.
+    While down, requests are refused until that retry time is reached. The
+    first request after it half-opens the circuit and goes through as the
+    probe; the others are refused until the probe succeeds or fails.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    state : str
+        One of CONN_CONNECTED, CONN_DEGRADED, CONN_HALF_OPEN or CONN_DOWN.
+    failures : int
+        Number of consecutive connectivity failures.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CONN_FAILURE_THRESHOLD,
+        backoff_initial: float = CONN_BACKOFF_INITIAL,
+        backoff_max: float = CONN_BACKOFF_MAX,
+    ) -> None:
+        """
+        Initialize the ConnectionHealth.
+
+        Parameters
+        ----------
+        failure_threshold : int, optional
+            Failures before the circuit opens, by default CONN_FAILURE_THRESHOLD.
+        backoff_initial : float, optional
+            First retry delay in seconds, by default CONN_BACKOFF_INITIAL.
+        backoff_max : float, optional
+            Upper bound for the retry delay in seconds, by default CONN_BACKOFF_MAX.
+        """
+        self.failure_threshold: int = failure_threshold
+        self.backoff_initial: float = backoff_initial
+        self.backoff_max: float = backoff_max
+        self.state: str = CONN_CONNECTED
+        self.failures: int = 0
+        self._next_retry: float = 0.0
+        self._lock = threading.Lock()
+
+    def record_success(self) -> None:
+        """Mark the server as reachable and reset the backoff."""
+        with self._lock:
+            self.state = CONN_CONNECTED
+            self.failures = 0
+            self._next_retry = 0.0
+
+    def record_failure(self) -> None:
+        """Count a connectivity failure and schedule the next retry."""
+        with self._lock:
+            self.failures += 1
+            delay = min(self.backoff_initial * 2 ** (self.failures - 1), self.backoff_max)
+            self._next_retry = time.monotonic() + delay
+            self.state = CONN_DOWN if self.failures >= self.failure_threshold else CONN_DEGRADED
+
+    def release_probe(self) -> None:
+        """Give up the probe without a verdict, so the next request probes instead."""
+        with self._lock:
+            if self.state == CONN_HALF_OPEN:
+                self.state = CONN_DOWN
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent to the server.
+
+        Returns
+        -------
+        bool
+            False while the circuit is open and the retry time has not been
+            reached, or while another request is probing the server. The
+            first request after the retry time becomes the probe.
+        """
+        with self._lock:
+            if self.state == CONN_HALF_OPEN:
+                return False
+            if self.state != CONN_DOWN:
+                return True
+            if time.monotonic() < self._next_retry:
+                return False
+            self.state = CONN_HALF_OPEN
+            return True
+
+    def retry_due(self) -> bool:
+        """
+        Check whether a reconnect attempt should be made now.
+
+        Returns
+        -------
+        bool
+            True if the connection is not healthy, no probe is in flight and
+            the backoff delay has elapsed.
+        """
+        with self._lock:
+            return self.state not in (CONN_CONNECTED, CONN_HALF_OPEN) and time.monotonic() >= self._next_retry
+
+    def retry_in(self) -> float | None:
+        """
+        Get the time remaining until the next reconnect attempt.
+
+        Returns
+        -------
+        float | None
+            Seconds until the next retry, or None when connected or while a
+            probe is in flight.
+        """
+        with self._lock:
+            if self.state in (CONN_CONNECTED, CONN_HALF_OPEN):
+                return None
+            return max(0.0, self._next_retry - time.monotonic())
+
 
 class EcflowClient:
     """
@@ -33,10 +178,39 @@ class EcflowClient:
     port : int
         The port number of the ecFlow server.
     client : ecflow.Client
-        The underlying ecFlow client instance.
+        The underlying ecFlow client instance. It owns the local Defs, so
+        calls that touch them are serialized on it.
+    tracer : CallTracer | None
+        Optional sink recording every server call.
+    pool_size : int
+        Number of additional clients used for stateless calls in parallel.
+    suites : list[str] | None
+        The suites `sync_local` is limited to, or None for all suites.
+    health : ConnectionHealth
+        Connection state, updated from connectivity calls.
+
+    Notes
+    -----
+    All methods are safe to call from several worker threads at once.
+    `sync_local` and `get_defs` are serialized on the primary client, while
+    file retrieval and commands check out a client from a bounded pool.
+    `sync_local` updates the client's Defs in place, so `get_defs` returns a
+    copy taken under the lock after each sync, which workers can walk while
+    the next sync runs.
+    While `health` reports the server down, calls fail fast with a
+    RuntimeError instead of waiting for a network timeout.
     """
 
-    def __init__(self, host: str = "localhost", port: int = 3141) -> None:
+    DETACH_DEFS: bool = True
+    """Whether `get_defs` copies the client's Defs, which `sync_local` modifies in place."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 3141,
+        tracer: CallTracer | None = None,
+        pool_size: int = CLIENT_POOL_SIZE,
+    ) -> None:
         """
         Initialize the EcflowClient.
 
@@ -46,6 +220,11 @@ class EcflowClient:
             The hostname of the ecFlow server, by default "localhost".
         port : int, optional
             The port number of the ecFlow server, by default 3141.
+        tracer : CallTracer | None, optional
+            Sink recording every server call, by default None (tracing disabled).
+        pool_size : int, optional
+            Maximum number of extra clients for parallel stateless calls, by
+            default CLIENT_POOL_SIZE. Zero serializes every call on the primary client.
 
         Raises
         ------
@@ -54,10 +233,134 @@ class EcflowClient:
         """
         self.host: str = host
         self.port: int = port
+        self.tracer: CallTracer | None = tracer
         try:
             self.client: ecflow.Client = ecflow.Client(host, port)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to initialize ecFlow client for {host}:{port}: {e}") from e
+        self._init_access(pool_size)
+
+    def _init_access(self, pool_size: int) -> None:
+        """
+        Set up the lock and client pool guarding access to the server, with no suites registered.
+
+        Parameters
+        ----------
+        pool_size : int
+            Maximum number of extra clients for stateless calls.
+        """
+        self.pool_size: int = pool_size
+        self.suites: list[str] | None = None
+        self._defs_copy: Defs | None = None
+        self.health: ConnectionHealth = ConnectionHealth()
+        self._state_lock = threading.RLock()
+        self._pool_lock = threading.Lock()
+        self._pool: queue.LifoQueue[Any] = queue.LifoQueue()
+        self._pool_created: int = 0
+
+    def _new_pool_client(self) -> Any:
+        """
+        Create an additional client for the pool.
+
+        Returns
+        -------
+        ecflow.Client
+            A new client connected to the same server.
+        """
+        return ecflow.Client(self.host, self.port)
+
+    @contextmanager
+    def _checkout(self, func_name: str) -> Iterator[Any]:
+        """
+        Borrow a client suitable for an `ecflow.Client` method.
+
+        Parameters
+        ----------
+        func_name : str
+            The `ecflow.Client` method about to be called.
+
+        Yields
+        ------
+        ecflow.Client
+            The primary client (held under lock) for stateful calls, or a pooled client.
+        """
+        if func_name in STATEFUL_CALLS or self.pool_size <= 0:
+            with self._state_lock:
+                yield self.client
+            return
+
+        try:
+            pooled = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._pool_created < self.pool_size
+                if create:
+                    self._pool_created += 1
+            if create:
+                try:
+                    pooled = self._new_pool_client()
+                except RuntimeError:
+                    with self._pool_lock:
+                        self._pool_created -= 1
+                    raise
+            else:
+                pooled = self._pool.get()
+        try:
+            yield pooled
+        finally:
+            self._pool.put(pooled)
+
+    def _call(self, method: str, path: str | None, func_name: str, *args: Any) -> Any:
+        """
+        Invoke an underlying client method, recording it to the tracer if enabled.
+
+        Parameters
+        ----------
+        method : str
+            The name of the public method making the call.
+        path : str | None
+            The node path targeted by the call, if any.
+        func_name : str
+            The `ecflow.Client` method to invoke.
+        *args : Any
+            Arguments passed to the method.
+
+        Returns
+        -------
+        Any
+            The result of the underlying call.
+
+        Raises
+        ------
+        RuntimeError
+            Propagated from the underlying client, or raised immediately while
+            the server is considered down. Calls answered locally are never refused.
+        """
+        if func_name not in LOCAL_CALLS and not self.health.allow_request():
+            retry_in = self.health.retry_in()
+            if retry_in is None:
+                raise RuntimeError(f"server {self.host}:{self.port} is down, a reconnect probe is in flight")
+            raise RuntimeError(f"server {self.host}:{self.port} is down, next retry in {retry_in:.0f}s")
+
+        with self._checkout(func_name) as client:
+            func = getattr(client, func_name)
+            start = time.time()
+            t0 = time.perf_counter()
+            try:
+                result = func(*args)
+            except RuntimeError as e:
+                if func_name in CONNECTIVITY_CALLS:
+                    self.health.record_failure()
+                else:
+                    self.health.release_probe()
+                if self.tracer is not None:
+                    self.tracer.record(method, path, start, time.perf_counter() - t0, error=str(e), args=args)
+                raise
+            if func_name not in LOCAL_CALLS:
+                self.health.record_success()
+            if self.tracer is not None:
+                self.tracer.record(method, path, start, time.perf_counter() - t0, result=result, args=args)
+            return result
 
     def ping(self) -> None:
         """
@@ -77,7 +380,7 @@ class EcflowClient:
         This is a blocking network call and should be run in a background worker.
         """
         try:
-            self.client.ping()
+            self._call("ping", None, "ping")
         except RuntimeError as e:
             raise RuntimeError(f"Failed to ping ecFlow server at {self.host}:{self.port}: {e}") from e
 
@@ -99,7 +402,9 @@ class EcflowClient:
         This is a blocking network call and should be run in a background worker.
         """
         try:
-            self.client.sync_local()
+            with self._state_lock:
+                self._call("sync_local", None, "sync_local")
+                self._defs_copy = None
         except RuntimeError as e:
             raise RuntimeError(f"Failed to sync with ecFlow server: {e}") from e
 
@@ -110,7 +415,8 @@ class EcflowClient:
         Returns
         -------
         ecflow.Defs | None
-            The ecFlow definitions, or None if not available.
+            The ecFlow definitions as of the last sync, or None if not available.
+            They are not modified by later syncs; do not modify them.
 
         Raises
         ------
@@ -118,11 +424,18 @@ class EcflowClient:
             If the definitions cannot be retrieved.
         """
         try:
-            return self.client.get_defs()
+            with self._state_lock:
+                defs = self._call("get_defs", None, "get_defs")
+                if not self.DETACH_DEFS or not isinstance(defs, ecflow.Defs):
+                    return defs
+                if self._defs_copy is None:
+                    # Copied once per sync, while no sync can modify the client's Defs
+                    self._defs_copy = copy_defs(defs)
+                return self._defs_copy
         except RuntimeError as e:
             raise RuntimeError(f"Failed to get definitions from client: {e}") from e
 
-    def file(self, path: str, file_type: str) -> str:
+    def file(self, path: str, file_type: str, max_lines: int | None = None) -> str:
         """
         Retrieve a file (log, script, job) for a specific node.
 
@@ -132,6 +445,9 @@ class EcflowClient:
             The absolute path to the node.
         file_type : str
             The type of file to retrieve ('jobout', 'script', 'job').
+        max_lines : int | None, optional
+            Only retrieve the last lines of the file, by default None (the
+            server's default limit).
 
         Returns
         -------
@@ -144,10 +460,125 @@ class EcflowClient:
             If the file cannot be retrieved.
         """
         try:
-            return self.client.get_file(path, file_type)
+            if max_lines is not None:
+                # The server reads only the tail of the file, so the transfer stays small
+                return self._call("file", path, "get_file", path, file_type, str(max_lines))
+            return self._call("file", path, "get_file", path, file_type)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to retrieve {file_type} for {path}: {e}") from e
 
+    def get_log(self, max_lines: int | None = None) -> str:
+        """
+        Retrieve the server log.
+
+        Parameters
+        ----------
+        max_lines : int | None, optional
+            Only retrieve the last lines of the log, by default None (the
+            whole log).
+
+        Returns
+        -------
+        str
+            The log content.
+
+        Raises
+        ------
+        RuntimeError
+            If the log cannot be retrieved.
+        """
+        try:
+            if max_lines is not None:
+                return str(self._call("get_log", None, "get_log", max_lines))
+            return str(self._call("get_log", None, "get_log"))
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to get server log: {e}") from e
+
+    def query(self, path: str, query_type: str, attribute: str = "") -> str:
+        """
+        Query a single state or attribute value of a node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        query_type : str
+            The value to query, e.g. 'state', 'meter', 'label' or 'event'.
+        attribute : str, optional
+            The attribute name for attribute queries, by default "".
+
+        Returns
+        -------
+        str
+            The value, as returned by the server.
+
+        Raises
+        ------
+        RuntimeError
+            If the query fails.
+
+        Notes
+        -----
+        A query transfers one value instead of the definitions, so it is
+        cheap enough to poll a few nodes between full synchronizations.
+        """
+        try:
+            return str(self._call("query", path, "query", query_type, path, attribute))
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to query {query_type} {attribute} of {path}: {e}") from e
+
+    def suite_names(self) -> list[str]:
+        """
+        List the names of all suites on the server.
+
+        Returns
+        -------
+        list[str]
+            The suite names, whether or not they are registered.
+
+        Raises
+        ------
+        RuntimeError
+            If the suites cannot be listed.
+        """
+        try:
+            return [str(name) for name in self._call("suite_names", None, "suites")]
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to list suites: {e}") from e
+
+    def register_suites(self, suites: Iterable[str] | None) -> None:
+        """
+        Limit synchronization to some suites, through an ecFlow client handle.
+
+        Parameters
+        ----------
+        suites : Iterable[str] | None
+            The suites to synchronize, or None (or nothing) for all suites.
+
+        Raises
+        ------
+        RuntimeError
+            If the handle cannot be registered or dropped.
+
+        Notes
+        -----
+        Once registered, the server only sends the listed suites on
+        `sync_local`, which cuts transfer and parse time on servers with many
+        suites. Suites added to the server later are not included. Any
+        previous handle of this client is dropped first, so the server does
+        not keep stale handles.
+        """
+        names = sorted(set(suites or ()))
+        try:
+            if self.suites is not None:
+                self._call("register_suites", None, "ch_drop")
+                self.suites = None
+            if names:
+                self._call("register_suites", None, "ch_register", False, names)
+                self.suites = names
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to register suites {', '.join(names) or '(all)'}: {e}") from e
+
     def suspend(self, path: str) -> None:
         """
         Suspend a node.
@@ -163,7 +594,7 @@ class EcflowClient:
             If the node cannot be suspended.
         """
         try:
-            self.client.suspend(path)
+            self._call("suspend", path, "suspend", path)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to suspend {path}: {e}") from e
 
@@ -182,7 +613,7 @@ class EcflowClient:
             If the node cannot be resumed.
         """
         try:
-            self.client.resume(path)
+            self._call("resume", path, "resume", path)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to resume {path}: {e}") from e
 
@@ -201,7 +632,7 @@ class EcflowClient:
             If the node cannot be killed.
         """
         try:
-            self.client.kill(path)
+            self._call("kill", path, "kill", path)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to kill {path}: {e}") from e
 
@@ -220,7 +651,7 @@ class EcflowClient:
             If the node state cannot be forced.
         """
         try:
-            self.client.force_complete(path)
+            self._call("force_complete", path, "force_complete", path)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to force complete {path}: {e}") from e
 
@@ -245,7 +676,7 @@ class EcflowClient:
             If the alteration fails.
         """
         try:
-            self.client.alter(path, alter_type, name, value)
+            self._call("alter", path, "alter", path, alter_type, name, value)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to alter {path} ({alter_type} {name}={value}): {e}") from e
 
@@ -264,7 +695,7 @@ class EcflowClient:
             If the node cannot be requeued.
         """
         try:
-            self.client.requeue(path)
+            self._call("requeue", path, "requeue", path)
         except RuntimeError as e:
             raise RuntimeError(f"Failed to requeue {path}: {e}") from e
 
@@ -278,7 +709,7 @@ class EcflowClient:
             If the server cannot be restarted.
         """
         try:
-            self.client.restart_server()
+            self._call("restart_server", None, "restart_server")
         except RuntimeError as e:
             raise RuntimeError(f"Failed to restart server: {e}") from e
 
@@ -292,7 +723,7 @@ class EcflowClient:
             If the server cannot be halted.
         """
         try:
-            self.client.halt_server()
+            self._call("halt_server", None, "halt_server")
         except RuntimeError as e:
             raise RuntimeError(f"Failed to halt server: {e}") from e
 
@@ -311,7 +742,7 @@ class EcflowClient:
             If the version cannot be retrieved.
         """
         try:
-            return str(self.client.version())
+            return str(self._call("version", None, "version"))
         except RuntimeError as e:
             raise RuntimeError(f"Failed to get client version: {e}") from e
 
@@ -330,6 +761,6 @@ class EcflowClient:
             If the server version cannot be retrieved.
         """
         try:
-            return str(self.client.server_version())
+            return str(self._call("server_version", None, "server_version"))
         except RuntimeError as e:
             raise RuntimeError(f"Failed to get server version: {e}") from e
@@ -27,6 +27,62 @@ DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 3141
 DEFAULT_REFRESH_INTERVAL = 2.0
 
+# --- Client Access ---
+CLIENT_POOL_SIZE = 4
+"""Maximum number of extra ecflow.Client instances used for parallel stateless calls."""
+
+DEFAULT_CLIENT_TIMEOUT = 30.0
+"""Default timeout in seconds for awaitable client calls."""
+
+# --- Connection Health ---
+CONN_CONNECTED = "connected"
+"""Connection state: the last connectivity check succeeded."""
+CONN_DEGRADED = "degraded"
+"""Connection state: recent connectivity checks failed, requests still allowed."""
+CONN_DOWN = "down"
+"""Connection state: circuit open, requests fail fast until the next retry."""
+CONN_HALF_OPEN = "probing"
+"""Connection state: the retry is due and one probe request is in flight, all others fail fast."""
+CONN_FAILURE_THRESHOLD = 3
+"""Consecutive connectivity failures after which the circuit opens."""
+CONN_BACKOFF_INITIAL = 1.0
+"""Initial reconnect delay in seconds."""
+CONN_BACKOFF_MAX = 60.0
+"""Maximum reconnect delay in seconds."""
+HEALTH_CHECK_INTERVAL = 1.0
+"""Interval in seconds at which the app checks connection health and retries."""
+SHUTDOWN_DROP_TIMEOUT = 2.0
+"""Seconds the app waits on exit for the server to drop its client handle."""
+
+# --- Client Tracing ---
+DEFAULT_TRACE_MAX_BYTES = 10 * 1024 * 1024
+"""Size in bytes at which the client call trace file is rotated."""
+DEFAULT_TRACE_BACKUP_COUNT = 3
+"""Number of rotated client call trace files to keep."""
+
+# --- Worker Concurrency ---
+WORKER_LIMITS: dict[str, int] = {
+    "connect": 1,
+    "sync": 1,
+    "files": 2,
+    "control": 2,
+    "poll": 1,
+    "modal": 2,
+    "tree": 4,
+    "index": 1,
+    "search": 1,
+    "highlight": 1,
+    "diff": 1,
+    "prefetch": 1,
+    "history": 1,
+    "async": CLIENT_POOL_SIZE + 1,
+}
+"""Maximum number of concurrent background jobs per worker category."""
+DEFAULT_WORKER_LIMIT = 2
+"""Concurrency limit for worker categories not listed in WORKER_LIMITS."""
+WORKER_STATUS_INTERVAL = 1.0
+"""Interval in seconds at which the status bar refreshes worker queue depth."""
+
 # --- UI Icons ---
 ICON_SERVER = "🌍"
 ICON_FAMILY = "📂"
@@ -40,6 +96,8 @@ ICON_TIME = "⏳"
 ICON_DATE = "📅"
 ICON_CRON = "⏰"
 ICON_UNKNOWN_STATE = "⚪"
+ICON_ETA = "🏁"
+ICON_SLOW = "🐢"
 
 # --- Variable Types ---
 VAR_TYPE_USER = "User"
@@ -59,16 +117,98 @@ INHERITED_VAR_PREFIX = "inh_"
 """Prefix for inherited variable keys in the VariableTweaker."""
 SYNTAX_THEME = "monokai"
 """Default theme for syntax highlighting."""
+SYNTAX_INLINE_MAX_SIZE = 20_000
+"""Script/Job size in characters up to which highlighting is done immediately on the main thread."""
+SYNTAX_HIGHLIGHT_MAX_SIZE = 500_000
+"""Script/Job size in characters above which plain text is shown without syntax highlighting."""
+SYNTAX_CACHE_SIZE = 32
+"""Number of rendered Script/Job files kept in the highlight cache."""
 DEFAULT_SHELL = "bash"
 """Default shell for script execution."""
 DEFAULT_EDITOR = "vi"
 """Default editor for script editing."""
+LARGE_LOG_THRESHOLD = 1_000_000
+"""Output size in characters above which the windowed large log viewer is used."""
+LOG_INDEX_CHUNK_SIZE = 8 * 1024 * 1024
+"""Number of bytes scanned per step when indexing a large log."""
+DIFF_CONTEXT_LINES = 3
+"""Unchanged lines shown around each change in the Diff tab; longer unchanged runs are folded."""
+OUTPUT_HISTORY_SIZE = 64
+"""Number of job outputs (per node and try) kept in memory for try diffs."""
+OUTPUT_HISTORY_MAX_BYTES = 64 * 1024 * 1024
+"""Total size in characters of the job outputs kept in memory for try diffs."""
+FILE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""Total size in characters of node files kept in the file cache."""
+FILE_CACHE_TTL = 300.0
+"""Maximum age in seconds of a cached node file."""
+PREFETCH_IDLE_DELAY = 1.5
+"""Seconds without tree navigation after which outputs of likely-next nodes are prefetched."""
+PREFETCH_MAX_FILES = 16
+"""Maximum number of outputs fetched per prefetch round."""
+TRIAGE_TAIL_LINES = 20
+"""Number of trailing job output lines fetched per task on the aborted triage screen."""
+TRIAGE_MAX_FETCHES = 8
+"""Maximum number of concurrent output tail fetches on the aborted triage screen."""
+TRANSITION_BUFFER_SIZE = 100_000
+"""Number of node state transitions kept in memory for the Timeline tab."""
+TIMELINE_MAX_ROWS = 1000
+"""Maximum number of transitions listed in the Timeline tab."""
+GANTT_LABEL_WIDTH = 32
+"""Width in cells of the task name column of the Gantt chart."""
+METER_BAR_WIDTH = 24
+"""Width in cells of the meter progress bars in the Details tab."""
+RUNTIME_WINDOW = 30
+"""Number of recent completed runs per node used for runtime statistics and predictions."""
+SLOW_MIN_RUNS = 3
+"""Number of completed runs of a node needed before it can be flagged as slow."""
+SEARCH_MAX_MATCHES = 100_000
+"""Maximum number of content search matches recorded per search."""
+REGEX_SEARCH_PREFIX = "re:"
+"""Content search queries starting with this prefix are treated as regular expressions."""
+
+SERVER_LOG_TAIL_LINES = 2000
+"""Number of trailing server log lines requested per poll of the Server Log screen."""
+SERVER_LOG_POLL_INTERVAL = 5.0
+"""Seconds between two polls of the server log while the Server Log screen is open."""
+SERVER_LOG_MAX_RECORDS = 200_000
+"""Maximum number of parsed server log lines kept in memory."""
+SERVER_LOG_MAX_ROWS = 2000
+"""Maximum number of server log lines listed on the Server Log screen."""
+SERVER_LOG_OVERLAP = 20
+"""Number of last seen server log lines matched against a new tail to find where it continues."""
+
+# --- Watch List ---
+WATCH_POLL_INTERVAL = 3.0
+"""Interval in seconds at which the watched nodes are queried."""
+WATCH_MAX_NODES = 50
+"""Maximum number of nodes on the watch list."""
+
+# --- Persisted State ---
+STATE_CACHE_SUBDIR = "ectop"
+"""Directory below the user cache directory holding per-server snapshots and UI state."""
+STATE_CACHE_SAVE_INTERVAL = 60.0
+"""Minimum interval in seconds between two persisted definitions snapshots."""
+
+HISTORY_BATCH_SIZE = 500
+"""Maximum number of state transitions written to the history database per transaction."""
+HISTORY_FLUSH_INTERVAL = 2.0
+"""Seconds the history writer waits to batch further transitions before writing."""
+HISTORY_QUERY_RUNS = 30
+"""Number of past runs of a node summarized in the Timeline tab."""
+
+# --- Alerts ---
+CONFIG_SUBDIR = "ectop"
+"""Directory below the user configuration directory holding ectop's configuration."""
+ALERTS_FILE_NAME = "alerts.toml"
+"""Name of the alert rules file in the configuration directory."""
 
 # --- Status & Error Messages ---
 ERROR_CONNECTION_FAILED = "Connection Failed"
 """Standard error message for connection failures."""
 STATUS_SYNC_ERROR = "Sync Error"
 """Standard status message for synchronization errors."""
+STATUS_STALE = "Stale"
+"""Status shown while the tree displays a cached snapshot instead of live data."""
 
 # --- UI Theme Colors ---
 COLOR_BG = "#1a1b26"
@@ -80,3 +220,38 @@ COLOR_TEXT_HIGHLIGHT = "#c0caf5"
 COLOR_STATUS_BAR_BG = "#16161e"
 COLOR_HEADER_BG = "#565f89"
 COLOR_STATUS_HALTED = "bold yellow"
+COLOR_STATUS_STALE = "italic yellow"
+"""Style of the status while a cached snapshot is shown."""
+COLOR_DIFF_DELETE = "#f7768e"
+"""Style of removed lines in the Diff tab."""
+COLOR_DIFF_INSERT = "#9ece6a"
+"""Style of added lines in the Diff tab."""
+COLOR_DIFF_FOLD = "dim italic"
+"""Style of folded unchanged regions in the Diff tab."""
+COLOR_GANTT_QUEUED = "#565f89"
+"""Style of the queue wait (queued to submitted) in the Gantt chart."""
+COLOR_GANTT_SUBMITTED = "#e0af68"
+"""Style of the submission lag (submitted to active) in the Gantt chart."""
+COLOR_GANTT_ACTIVE = "#7dcfff"
+"""Style of the run time of a running task in the Gantt chart."""
+COLOR_GANTT_COMPLETE = "#9ece6a"
+"""Style of the run time of a completed task in the Gantt chart."""
+COLOR_GANTT_ABORTED = "#f7768e"
+"""Style of the run time of an aborted task in the Gantt chart."""
+COLOR_SLOW = "bold #ff9e64"
+"""Style of active nodes running longer than their historical p95."""
+COLOR_METER_BAR = "#7dcfff"
+"""Style of the filled part of meter progress bars."""
+COLOR_LATE = "bold #f7768e"
+"""Style of a triggered late attribute."""
+COLOR_SEARCH_MATCH = "black on #e0af68"
+"""Highlight style of content search matches."""
+COLOR_SEARCH_CURRENT = "black on #ff9e64"
+"""Highlight style of the selected content search match."""
+CONN_STATE_COLORS: dict[str, str] = {
+    CONN_CONNECTED: "dim green",
+    CONN_DEGRADED: "yellow",
+    CONN_HALF_OPEN: "yellow",
+    CONN_DOWN: "bold red",
+}
+"""Status bar colors for each connection state."""
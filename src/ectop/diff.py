@@ -0,0 +1,175 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Near-linear line diff for large files.
+
+The algorithm is a patience diff: lines that occur exactly once on both
+sides are used as anchors, the longest increasing run of anchors is kept,
+and the gaps between anchors are diffed the same way. Regions without
+unique lines are only trimmed of their common prefix and suffix and are
+otherwise reported as replaced. Every step is linear (plus an
+``O(k log k)`` anchor selection), so files of hundreds of thousands of lines
+diff in well under a second, unlike the quadratic worst case of `difflib`.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+Opcode = tuple[str, int, int, int, int]
+"""A `difflib`-style opcode: ``(tag, i1, i2, j1, j2)`` with tag 'equal', 'replace', 'delete' or 'insert'."""
+
+
+def _unique_anchors(a: Sequence[str], alo: int, ahi: int, b: Sequence[str], blo: int, bhi: int) -> list[tuple[int, int]]:
+    """
+    Find the longest increasing sequence of lines unique on both sides.
+
+    Parameters
+    ----------
+    a, b : Sequence[str]
+        Lines of both sides.
+    alo, ahi : int
+        The range of `a` to consider.
+    blo, bhi : int
+        The range of `b` to consider.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Matching ``(i, j)`` index pairs, increasing on both sides.
+    """
+    # Position of each line in a, or -1 if it occurs more than once
+    pos_a: dict[str, int] = {}
+    for i in range(alo, ahi):
+        pos_a[a[i]] = -1 if a[i] in pos_a else i
+    pos_b: dict[str, int] = {}
+    for j in range(blo, bhi):
+        line = b[j]
+        if pos_a.get(line, -1) >= 0:
+            pos_b[line] = -1 if line in pos_b else j
+
+    # Dicts keep first-insertion order, so unique lines come out ordered by position in a
+    pairs = [(i, pos_b[line]) for line, i in pos_a.items() if i >= 0 and pos_b.get(line, -1) >= 0]
+    if not pairs:
+        return []
+
+    # Patience sorting: longest increasing subsequence on the b index
+    tails: list[int] = []
+    tail_idx: list[int] = []
+    back: list[int] = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        # Fast path: in similar files most anchors extend the current run
+        pos = len(tails) if not tails or j > tails[-1] else bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_idx.append(k)
+        else:
+            tails[pos] = j
+            tail_idx[pos] = k
+        back[k] = tail_idx[pos - 1] if pos > 0 else -1
+
+    result: list[tuple[int, int]] = []
+    k = tail_idx[-1]
+    while k != -1:
+        result.append(pairs[k])
+        k = back[k]
+    result.reverse()
+    return result
+
+
+def matching_blocks(a: Sequence[str], b: Sequence[str]) -> list[tuple[int, int, int]]:
+    """
+    Compute the runs of matching lines of two line sequences.
+
+    Parameters
+    ----------
+    a, b : Sequence[str]
+        Lines of both sides.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        Non-overlapping ``(i, j, n)`` runs with ``a[i:i + n] == b[j:j + n]``,
+        in increasing order.
+    """
+    blocks: list[tuple[int, int, int]] = []
+    # Explicit stack instead of recursion: deep anchor chains must not hit the recursion limit
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        n = 0
+        while alo + n < ahi and blo + n < bhi and a[alo + n] == b[blo + n]:
+            n += 1
+        if n:
+            blocks.append((alo, blo, n))
+            alo += n
+            blo += n
+        n = 0
+        while alo < ahi - n and blo < bhi - n and a[ahi - n - 1] == b[bhi - n - 1]:
+            n += 1
+        if n:
+            ahi -= n
+            bhi -= n
+            blocks.append((ahi, bhi, n))
+        if alo == ahi or blo == bhi:
+            continue
+
+        prev_i, prev_j = alo, blo
+        for i, j in _unique_anchors(a, alo, ahi, b, blo, bhi):
+            if i < prev_i:
+                # Already covered by the run extended from a previous anchor
+                continue
+            if i > prev_i or j > prev_j:
+                stack.append((prev_i, i, prev_j, j))
+            n = 1
+            while i + n < ahi and j + n < bhi and a[i + n] == b[j + n]:
+                n += 1
+            blocks.append((i, j, n))
+            prev_i, prev_j = i + n, j + n
+        if prev_i > alo and (prev_i < ahi or prev_j < bhi):
+            stack.append((prev_i, ahi, prev_j, bhi))
+
+    blocks.sort()
+    return blocks
+
+
+def diff_lines(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    """
+    Diff two sequences of lines.
+
+    Parameters
+    ----------
+    a : Sequence[str]
+        The old lines.
+    b : Sequence[str]
+        The new lines.
+
+    Returns
+    -------
+    list[Opcode]
+        Opcodes describing how to turn `a` into `b`, as from
+        `difflib.SequenceMatcher.get_opcodes`.
+    """
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for bi, bj, n in [*matching_blocks(a, b), (len(a), len(b), 0)]:
+        if i < bi and j < bj:
+            opcodes.append(("replace", i, bi, j, bj))
+        elif i < bi:
+            opcodes.append(("delete", i, bi, j, j))
+        elif j < bj:
+            opcodes.append(("insert", i, i, j, bj))
+        if n:
+            if opcodes and opcodes[-1][0] == "equal":
+                _, i1, _, j1, _ = opcodes[-1]
+                opcodes[-1] = ("equal", i1, bi + n, j1, bj + n)
+            else:
+                opcodes.append(("equal", bi, bi + n, bj, bj + n))
+        i, j = bi + n, bj + n
+    return opcodes
@@ -0,0 +1,136 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Cache of node files fetched from the server.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from ectop.constants import FILE_CACHE_MAX_BYTES, FILE_CACHE_TTL
+
+
+class FileCache:
+    """
+    A thread-safe LRU cache of node files with a size budget.
+
+    Each entry records a signature of the node at fetch time, such as its
+    state and try number. A lookup with a different signature is a miss, so
+    a task that was rerun or changed state is never served an old output.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    max_bytes : int
+        Maximum total size of cached content in characters.
+    ttl : float
+        Maximum age of an entry in seconds.
+    """
+
+    def __init__(self, max_bytes: int = FILE_CACHE_MAX_BYTES, ttl: float = FILE_CACHE_TTL) -> None:
+        """
+        Initialize the FileCache.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum total size of cached content, by default FILE_CACHE_MAX_BYTES.
+        ttl : float, optional
+            Maximum age of an entry in seconds, by default FILE_CACHE_TTL.
+        """
+        self.max_bytes: int = max_bytes
+        self.ttl: float = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[str, Hashable, float]] = OrderedDict()
+        self._size: int = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, file_type: str, signature: Hashable = None) -> str | None:
+        """
+        Look up a file.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        file_type : str
+            The file type ('jobout', 'script', 'job').
+        signature : Hashable, optional
+            The current node signature, by default None.
+
+        Returns
+        -------
+        str | None
+            The cached content, or None if missing, expired or fetched for a different signature.
+        """
+        key = (path, file_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != signature or time.monotonic() - entry[2] > self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, path: str, file_type: str, content: str, signature: Hashable = None) -> None:
+        """
+        Store a file, evicting least recently used entries beyond the size budget.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        file_type : str
+            The file type.
+        content : str
+            The file content.
+        signature : Hashable, optional
+            The node signature at fetch time, by default None.
+        """
+        if len(content) > self.max_bytes:
+            return
+        key = (path, file_type)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            self._entries[key] = (content, signature, time.monotonic())
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop every cached file of a node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the node.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                self._size -= len(self._entries.pop(key)[0])
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of cached content.
+
+        Returns
+        -------
+        int
+            The size in characters.
+        """
+        with self._lock:
+            return self._size
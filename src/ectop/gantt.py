@@ -0,0 +1,167 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Execution phases of a family's tasks, derived from recorded transitions.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from ectop.transitions import Transition
+
+
+class Bar(NamedTuple):
+    """The phases of the last cycle of a task, or of a group of tasks."""
+
+    path: str
+    """The task path, or the path of the group."""
+    queued: float | None
+    """Time the task was seen queued, if it was."""
+    submitted: float | None
+    """Time the task was seen submitted, if it was."""
+    active: float | None
+    """Time the task was seen active, if it was."""
+    end: float | None
+    """Time the task was seen complete or aborted, None while it runs."""
+    state: str
+    """The last state seen."""
+    count: int = 1
+    """Number of tasks in the bar."""
+
+    @property
+    def start(self) -> float:
+        """The earliest known time of the bar."""
+        return min(t for t in (self.queued, self.submitted, self.active, self.end) if t is not None)
+
+
+def _relative(path: str, root: str) -> list[str]:
+    """Split a path into its components below `root`."""
+    return [part for part in path[len(root) :].split("/") if part]
+
+
+def task_bars(transitions: Iterable[Transition], root: str) -> list[Bar]:
+    """
+    Build the bar of the last cycle of each task below a node.
+
+    A cycle starts when the task is seen queued; the bar holds the first
+    time it was then seen submitted, active, and complete or aborted.
+    Nodes with recorded descendants are families and get no bar of their
+    own.
+
+    Parameters
+    ----------
+    transitions : Iterable[Transition]
+        Transitions oldest first, e.g. from `TransitionRecorder.for_path` with descendants.
+    root : str
+        The absolute path of the family.
+
+    Returns
+    -------
+    list[Bar]
+        The bars ordered by start time.
+    """
+    phases: dict[str, dict[str, float]] = {}
+    states: dict[str, str] = {}
+    for t in transitions:
+        times = phases.setdefault(t.path, {})
+        if t.new == "queued":
+            times.clear()
+        if t.new in ("queued", "submitted", "active"):
+            times.setdefault(t.new, t.time)
+        elif t.new in ("complete", "aborted"):
+            times.setdefault("end", t.time)
+        states[t.path] = t.new
+
+    families = {path.rsplit("/", 1)[0] for path in phases}
+    bars: list[Bar] = []
+    for path, times in phases.items():
+        if not times or path in families or not (path == root or path.startswith(root.rstrip("/") + "/")):
+            continue
+        bars.append(Bar(path, times.get("queued"), times.get("submitted"), times.get("active"), times.get("end"), states[path]))
+    bars.sort(key=lambda bar: (bar.start, bar.path))
+    return bars
+
+
+def depth_of(bars: Iterable[Bar], root: str) -> int:
+    """
+    Get the number of path levels between a family and its deepest task.
+
+    Parameters
+    ----------
+    bars : Iterable[Bar]
+        Task bars from `task_bars`.
+    root : str
+        The absolute path of the family.
+
+    Returns
+    -------
+    int
+        The depth, at least 1.
+    """
+    return max((len(_relative(bar.path, root)) for bar in bars), default=1) or 1
+
+
+def _earliest(values: Iterable[float | None]) -> float | None:
+    """Get the smallest known value."""
+    known = [v for v in values if v is not None]
+    return min(known) if known else None
+
+
+def aggregate(bars: list[Bar], root: str, depth: int) -> list[Bar]:
+    """
+    Merge task bars into one bar per sub-family, `depth` levels below a family.
+
+    A group spans from the earliest phase start of its tasks to the last
+    completion, and runs on while any of its tasks does. Its state is
+    aborted if any task aborted, otherwise the state of the latest task.
+
+    Parameters
+    ----------
+    bars : list[Bar]
+        Task bars from `task_bars`.
+    root : str
+        The absolute path of the family.
+    depth : int
+        Number of path levels kept below `root`; tasks at or above it keep their own bar.
+
+    Returns
+    -------
+    list[Bar]
+        The merged bars ordered by start time.
+    """
+    groups: dict[str, list[Bar]] = {}
+    for bar in bars:
+        parts = _relative(bar.path, root)
+        key = root.rstrip("/") + "/" + "/".join(parts[:depth]) if parts else bar.path
+        groups.setdefault(key, []).append(bar)
+
+    merged: list[Bar] = []
+    for key, members in groups.items():
+        if len(members) == 1 and members[0].path == key:
+            merged.append(members[0])
+            continue
+        ends = [bar.end for bar in members]
+        if any(bar.state == "aborted" for bar in members):
+            state = "aborted"
+        else:
+            state = max(members, key=lambda bar: bar.end or float("inf")).state
+        merged.append(
+            Bar(
+                key,
+                _earliest(bar.queued for bar in members),
+                _earliest(bar.submitted for bar in members),
+                _earliest(bar.active for bar in members),
+                None if None in ends else max(e for e in ends if e is not None),
+                state,
+                len(members),
+            )
+        )
+    merged.sort(key=lambda bar: (bar.start, bar.path))
+    return merged
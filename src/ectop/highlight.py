@@ -0,0 +1,218 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Cached syntax highlighting for Script and Job files.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from rich.syntax import Syntax
+from rich.text import Text
+
+from ectop.constants import SYNTAX_CACHE_SIZE, SYNTAX_THEME
+
+LINE_NUMBER_STYLE = "dim"
+"""Style of the line number gutter."""
+
+
+def content_key(content: str) -> str:
+    """
+    Compute the cache key of a file's content.
+
+    Parameters
+    ----------
+    content : str
+        The file content.
+
+    Returns
+    -------
+    str
+        A hex digest of the content.
+    """
+    return hashlib.blake2b(content.encode("utf-8", errors="replace"), digest_size=16).hexdigest()
+
+
+def gutter_width(content: str) -> int:
+    """
+    Width of the line number gutter, including its separating space.
+
+    Parameters
+    ----------
+    content : str
+        The file content.
+
+    Returns
+    -------
+    int
+        The number of characters prefixed to every line.
+    """
+    return len(str(content.count("\n") + 1)) + 1
+
+
+def rendered_spans(content: str, offset: int, length: int, line: int) -> list[tuple[int, int]]:
+    """
+    Map a span of the content to its spans in the rendering of `render_code`.
+
+    A span that crosses line breaks is split at each of them, since every
+    following line is shifted by one more gutter.
+
+    Parameters
+    ----------
+    content : str
+        The file content.
+    offset : int
+        Content offset of the span.
+    length : int
+        Length of the span.
+    line : int
+        Zero-based line number of `offset`.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Start and end offsets in the rendered Text, one pair per line, without
+        the line breaks.
+    """
+    gutter = gutter_width(content)
+    end = offset + length
+    spans = []
+    while True:
+        newline = content.find("\n", offset, end)
+        stop = end if newline == -1 else newline
+        shift = (line + 1) * gutter
+        spans.append((offset + shift, stop + shift))
+        if newline == -1:
+            return spans
+        offset, line = newline + 1, line + 1
+
+
+def render_code(content: str, highlight: bool = True, lexer: str = "bash", theme: str = SYNTAX_THEME) -> Text:
+    """
+    Render a file as a Text with line numbers, optionally syntax highlighted.
+
+    Unlike a `rich.syntax.Syntax`, which lexes the whole file again every
+    time it is rendered, the returned Text carries its styles and can be
+    cached and re-rendered cheaply.
+
+    Parameters
+    ----------
+    content : str
+        The file content.
+    highlight : bool, optional
+        Whether to lex and highlight the content, by default True.
+    lexer : str, optional
+        The Pygments lexer name, by default "bash".
+    theme : str, optional
+        The syntax theme, by default SYNTAX_THEME.
+
+    Returns
+    -------
+    Text
+        The rendered file. Character ``i`` of line ``n`` (zero-based) of the
+        content is at offset ``i + (n + 1) * gutter_width(content)`` of the
+        plain content offset.
+    """
+    if highlight:
+        body = Syntax(content, lexer, theme=theme).highlight(content)
+    else:
+        body = Text(content)
+    if body.plain.endswith("\n"):
+        body.right_crop(1)
+    width = gutter_width(content) - 1
+    lines = body.split("\n", allow_blank=True)
+    out = Text(no_wrap=True, end="")
+    for number, line in enumerate(lines, start=1):
+        if number > 1:
+            out.append("\n")
+        out.append(f"{number:>{width}} ", style=LINE_NUMBER_STYLE)
+        out.append_text(line)
+    return out
+
+
+class HighlightCache:
+    """
+    A thread-safe LRU cache of rendered files keyed by content digest.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries.
+    """
+
+    def __init__(self, maxsize: int = SYNTAX_CACHE_SIZE) -> None:
+        """
+        Initialize the HighlightCache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries, by default SYNTAX_CACHE_SIZE.
+        """
+        self.maxsize: int = maxsize
+        self._entries: OrderedDict[str, Text] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Text | None:
+        """
+        Look up a rendered file.
+
+        Parameters
+        ----------
+        key : str
+            The content digest.
+
+        Returns
+        -------
+        Text | None
+            The cached rendering, or None on a miss.
+        """
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: str, text: Text) -> None:
+        """
+        Store a rendered file, evicting the least recently used entry if full.
+
+        Parameters
+        ----------
+        key : str
+            The content digest.
+        text : Text
+            The rendering.
+        """
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """
+        Number of cached renderings.
+
+        Returns
+        -------
+        int
+            The entry count.
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+highlight_cache = HighlightCache()
+"""Process-wide cache of rendered Script and Job files."""
@@ -0,0 +1,228 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Persistent per-server history of node state transitions.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from ectop.constants import HISTORY_BATCH_SIZE, HISTORY_FLUSH_INTERVAL, HISTORY_QUERY_RUNS
+from ectop.statecache import server_cache_path
+from ectop.transitions import Transition
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS transitions (time REAL NOT NULL, path TEXT NOT NULL, old TEXT NOT NULL, new TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS transitions_path_time ON transitions (path, time)",
+    "CREATE INDEX IF NOT EXISTS transitions_new_time ON transitions (new, time)",
+)
+
+_RUN_END_STATES = ("complete", "aborted")
+"""States that end a run that started with the node becoming active."""
+
+
+class Run(NamedTuple):
+    """One execution of a node, from becoming active to completing or aborting."""
+
+    start: float
+    """Time the node was first seen active, in seconds since the epoch."""
+    end: float
+    """Time the node was first seen complete or aborted."""
+    state: str
+    """The state the run ended in."""
+
+    @property
+    def duration(self) -> float:
+        """The run time in seconds."""
+        return self.end - self.start
+
+
+class HistoryStore:
+    """
+    State transitions of one server, kept in a local SQLite database.
+
+    `record` only queues transitions, so the refresh that found them is
+    never slowed down. A daemon thread owns the writing connection and
+    inserts the queued transitions in batches of up to
+    HISTORY_BATCH_SIZE rows, one transaction per batch, waiting up to
+    HISTORY_FLUSH_INTERVAL seconds for a batch to fill. Queries open their
+    own connection; the database runs in WAL mode so they do not block
+    the writer.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    db_path : str
+        Path of the SQLite database.
+    last_error : str | None
+        The last error of the writer thread, if any.
+    """
+
+    def __init__(self, host: str, port: int, directory: str | None = None) -> None:
+        """
+        Initialize the HistoryStore.
+
+        Parameters
+        ----------
+        host : str
+            The ecFlow server hostname.
+        port : int
+            The ecFlow server port.
+        directory : str | None, optional
+            The cache directory, by default `default_cache_dir()`.
+        """
+        self.db_path: str = server_cache_path(host, port, ".history.sqlite", directory)
+        self.last_error: str | None = None
+        self._queue: queue.Queue[list[Transition] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def record(self, transitions: Iterable[Transition]) -> None:
+        """
+        Queue transitions to be written.
+
+        Parameters
+        ----------
+        transitions : Iterable[Transition]
+            The transitions, e.g. from `TransitionRecorder.observe`.
+        """
+        batch = list(transitions)
+        if not batch:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="ectop-history", daemon=True)
+                self._writer.start()
+        self._queue.put(batch)
+
+    def close(self) -> None:
+        """Write the queued transitions and stop the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database, creating it if needed.
+
+        Returns
+        -------
+        sqlite3.Connection
+            A new connection.
+        """
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        return conn
+
+    def _next_batch(self) -> tuple[list[Transition], bool]:
+        """
+        Collect the next batch from the queue, blocking until one arrives.
+
+        Returns
+        -------
+        tuple[list[Transition], bool]
+            The transitions, and whether `close` was called.
+        """
+        batch: list[Transition] = []
+        item = self._queue.get()
+        if item is None:
+            return batch, True
+        batch.extend(item)
+        deadline = time.monotonic() + HISTORY_FLUSH_INTERVAL
+        while len(batch) < HISTORY_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.extend(item)
+        return batch, False
+
+    def _write_loop(self) -> None:
+        """Insert queued transitions until `close` is called."""
+        conn: sqlite3.Connection | None = None
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if not batch:
+                continue
+            try:
+                if conn is None:
+                    conn = self._connect()
+                with conn:
+                    for n in range(0, len(batch), HISTORY_BATCH_SIZE):
+                        conn.executemany("INSERT INTO transitions VALUES (?, ?, ?, ?)", batch[n : n + HISTORY_BATCH_SIZE])
+            except (OSError, sqlite3.Error) as e:
+                # History is best effort; keep the UI running and report on demand
+                self.last_error = f"Failed to write history to {self.db_path}: {e}"
+        if conn is not None:
+            conn.close()
+
+    def runs(self, path: str, limit: int = HISTORY_QUERY_RUNS) -> list[Run]:
+        """
+        List the latest completed or aborted runs of a node.
+
+        A run starts when the node is seen active and ends when it is next
+        seen complete or aborted. Requeues in between discard the start.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+        limit : int, optional
+            Maximum number of runs, by default HISTORY_QUERY_RUNS.
+
+        Returns
+        -------
+        list[Run]
+            The runs, oldest first. Empty if there is no history yet.
+        """
+        if not os.path.exists(self.db_path):
+            return []
+        try:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            try:
+                # Each run needs at most a start, an end and a requeue; fetch a margin for noise
+                rows = conn.execute(
+                    "SELECT time, new FROM transitions WHERE path = ? ORDER BY time DESC LIMIT ?",
+                    (path, limit * 4),
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return []
+        found: list[Run] = []
+        start: float | None = None
+        for stamp, state in reversed(rows):
+            if state == "active":
+                if start is None:
+                    start = stamp
+            elif state in _RUN_END_STATES:
+                if start is not None:
+                    found.append(Run(start, stamp, state))
+                start = None
+            elif state == "queued":
+                start = None
+        return found[-limit:]
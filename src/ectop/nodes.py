@@ -0,0 +1,224 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Helpers for querying nodes of a synchronized definition.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import ecflow
+
+from ectop.tries import try_number
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+
+class NodeDetails(NamedTuple):
+    """The attributes of a node, as shown in the Details tab; equal details need no repaint."""
+
+    path: str
+    """The absolute node path."""
+    kind: str
+    """The node type: "suite", "family" or "task"."""
+    state: str
+    """The node state."""
+    events: tuple[tuple[str, bool], ...] = ()
+    """Name and value of each event."""
+    meters: tuple[tuple[str, int, int, int], ...] = ()
+    """Name, minimum, maximum and value of each meter."""
+    labels: tuple[tuple[str, str], ...] = ()
+    """Name and current value of each label."""
+    repeat: tuple[str, str, str, str, str] | None = None
+    """Name, current value, start, end and step of the repeat, if any."""
+    limits: tuple[tuple[str, int, int], ...] = ()
+    """Name, tokens in use and maximum of each limit defined on the node."""
+    inlimits: tuple[tuple[str, str, int], ...] = ()
+    """Limit name, path of the node defining it, and tokens consumed, of each inlimit."""
+    late: str = ""
+    """The late attribute, if any."""
+    is_late: bool = False
+    """Whether the late attribute has been triggered."""
+    flags: str = ""
+    """The flags set on the node, comma separated."""
+
+
+def node_signature(defs: Defs | None, path: str) -> tuple[str, int] | None:
+    """
+    Describe the run state of a node for cache validation.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the node.
+
+    Returns
+    -------
+    tuple[str, int] | None
+        The node state and try number, or None if the node is unknown.
+    """
+    if not defs:
+        return None
+    node = defs.find_abs_node(path)
+    if not node:
+        return None
+    return str(node.get_state()), try_number(defs, path)
+
+
+def tasks_in_state(defs: Defs | None, state: str) -> list[str]:
+    """
+    List the paths of all tasks in a given state.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    state : str
+        The state to look for, e.g. "aborted".
+
+    Returns
+    -------
+    list[str]
+        The absolute paths of matching tasks, in definition order.
+    """
+    if not defs:
+        return []
+    paths: list[str] = []
+    for suite in defs.suites:
+        for node in suite.get_all_nodes():
+            if isinstance(node, (ecflow.Family, ecflow.Suite)):
+                continue
+            if str(node.get_state()) == state:
+                paths.append(node.get_abs_node_path())
+    return paths
+
+
+def abort_reason(defs: Defs | None, path: str) -> str:
+    """
+    Get the reason a task aborted.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the task.
+
+    Returns
+    -------
+    str
+        The abort reason recorded by the server, or an empty string.
+    """
+    if not defs:
+        return ""
+    node = defs.find_abs_node(path)
+    if not node or not hasattr(node, "get_abort"):
+        return ""
+    return str(node.get_abort() or "")
+
+
+def query_attribute(defs: Defs | None, path: str, query_type: str, attribute: str = "") -> str:
+    """
+    Answer a node query from synchronized definitions, as the server would.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the node.
+    query_type : str
+        One of 'state', 'dstate', 'meter', 'label' or 'event'.
+    attribute : str, optional
+        The attribute name for attribute queries, by default "".
+
+    Returns
+    -------
+    str
+        The value: the state, the meter value, the label's current value, or
+        "set"/"clear" for an event.
+
+    Raises
+    ------
+    RuntimeError
+        If the node or attribute does not exist, or the query type is unknown.
+    """
+    node = defs.find_abs_node(path) if defs else None
+    if not node:
+        raise RuntimeError(f"node {path} not found")
+    if query_type == "state":
+        return str(node.get_state())
+    if query_type == "dstate":
+        return str(node.get_dstate())
+    if query_type == "meter":
+        for meter in node.meters:
+            if meter.name() == attribute:
+                return str(meter.value())
+    elif query_type == "label":
+        for label in node.labels:
+            if label.name() == attribute:
+                return str(label.new_value() or label.value())
+    elif query_type == "event":
+        for event in node.events:
+            if event.name_or_number() == attribute:
+                return "set" if event.value() else "clear"
+    else:
+        raise RuntimeError(f"unknown query type {query_type!r}")
+    raise RuntimeError(f"{query_type} {attribute} not found on {path}")
+
+
+def node_details(defs: Defs | None, path: str) -> NodeDetails | None:
+    """
+    Collect the attributes of a node from synchronized definitions.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the node.
+
+    Returns
+    -------
+    NodeDetails | None
+        The attributes, or None if the node is unknown.
+
+    Notes
+    -----
+    This reads the local definitions only, so it costs no server round
+    trip and can be repeated after every synchronization.
+    """
+    node = defs.find_abs_node(path) if defs else None
+    if not node:
+        return None
+    kind = "suite" if isinstance(node, ecflow.Suite) else "family" if isinstance(node, ecflow.Family) else "task"
+    repeat = node.get_repeat() if hasattr(node, "get_repeat") else None
+    late = node.get_late() if hasattr(node, "get_late") else None
+    flag = node.get_flag() if hasattr(node, "get_flag") else None
+    return NodeDetails(
+        path,
+        kind,
+        str(node.get_state()),
+        events=tuple((str(e.name_or_number()), bool(e.value())) for e in getattr(node, "events", ())),
+        meters=tuple((m.name(), int(m.min()), int(m.max()), int(m.value())) for m in getattr(node, "meters", ())),
+        labels=tuple((lb.name(), str(lb.new_value() or lb.value())) for lb in getattr(node, "labels", ())),
+        repeat=(
+            None
+            if repeat is None or repeat.empty()
+            else (repeat.name(), str(repeat.value()), str(repeat.start()), str(repeat.end()), str(repeat.step()))
+        ),
+        limits=tuple((lim.name(), int(lim.value()), int(lim.limit())) for lim in getattr(node, "limits", ())),
+        inlimits=tuple((il.name(), str(il.path_to_node()), int(il.tokens())) for il in getattr(node, "inlimits", ())),
+        late=str(late).strip() if late else "",
+        is_late=bool(late.is_late()) if late else False,
+        flags=str(flag).strip() if flag else "",
+    )
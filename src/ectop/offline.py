@@ -0,0 +1,188 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Offline browsing of checkpoint and definition files.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from ectop.client import EcflowClient
+from ectop.constants import CLIENT_POOL_SIZE
+from ectop.nodes import query_attribute
+from ectop.snapshot import load_defs_file
+from ectop.tries import generated_variables, read_output
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+    from ectop.trace import CallTracer
+
+OFFLINE_FILE_VARIABLES: dict[str, str] = {
+    "jobout": "ECF_JOBOUT",
+    "job": "ECF_JOB",
+    "script": "ECF_SCRIPT",
+}
+"""Generated variable holding the on-disk location of each file type."""
+
+
+class _OfflineBackend:
+    """
+    Stand-in for `ecflow.Client` serving definitions loaded from a file.
+
+    The file is parsed once, on the first call, so parsing a large
+    checkpoint happens in the worker that connects. Files are read from the
+    locations in the generated variables of each node, and every command
+    that would change state fails.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Initialize the backend.
+
+        Parameters
+        ----------
+        file_path : str
+            The checkpoint or `.def` file.
+        """
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._defs: Defs | None = None
+
+    def _load(self) -> Defs:
+        """
+        Parse the file on first use.
+
+        Returns
+        -------
+        ecflow.Defs
+            The loaded definitions.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be parsed.
+        """
+        with self._lock:
+            if self._defs is None:
+                self._defs = load_defs_file(self._file_path)
+            return self._defs
+
+    def _read_only(self, *args: Any) -> None:
+        """
+        Reject a command that would change state.
+
+        Raises
+        ------
+        RuntimeError
+            Always.
+        """
+        raise RuntimeError(f"offline view of {self._file_path} is read-only")
+
+    suspend = resume = kill = force_complete = requeue = alter = ch_register = ch_drop = _read_only
+    restart_server = halt_server = _read_only
+
+    def ping(self) -> None:
+        """Load the file."""
+        self._load()
+
+    def sync_local(self) -> None:
+        """Load the file; there are no changes to synchronize."""
+        self._load()
+
+    def get_defs(self) -> Defs:
+        """Return the loaded definitions."""
+        return self._load()
+
+    def get_file(self, path: str, file_type: str, max_lines: str | None = None) -> str:
+        """Read a node file from the location recorded in its generated variables."""
+        variable = OFFLINE_FILE_VARIABLES.get(file_type)
+        file_path = generated_variables(self._load(), path).get(variable or "")
+        if not file_path:
+            raise RuntimeError(f"no location of {file_type} known for {path}")
+        content = read_output(file_path)
+        if max_lines is not None:
+            return "\n".join(content.splitlines()[-int(max_lines) :])
+        return content
+
+    def get_log(self, max_lines: int | None = None) -> str:
+        """
+        Reject a server log request; a file has no server.
+
+        Raises
+        ------
+        RuntimeError
+            Always.
+        """
+        raise RuntimeError(f"offline view of {self._file_path} has no server log")
+
+    def suites(self) -> list[str]:
+        """List the suites of the loaded definitions."""
+        return [suite.name() for suite in self._load().suites]
+
+    def query(self, query_type: str, path: str, attribute: str = "") -> str:
+        """Answer a node query from the loaded definitions."""
+        return query_attribute(self._load(), path, query_type, attribute)
+
+    def version(self) -> str:
+        """Return the client version."""
+        return "offline"
+
+    def server_version(self) -> str:
+        """Describe the loaded file in place of a server version."""
+        return f"offline: {os.path.basename(self._file_path)}"
+
+
+class OfflineClient(EcflowClient):
+    """
+    An `EcflowClient` that browses a checkpoint or `.def` file without a server.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+    """
+
+    DETACH_DEFS = False
+    """The loaded definitions are never synchronized in place, so they are not copied."""
+
+    def __init__(self, file_path: str, tracer: CallTracer | None = None) -> None:
+        """
+        Initialize the OfflineClient.
+
+        Parameters
+        ----------
+        file_path : str
+            A `.check` checkpoint or a `.def` definition file.
+        tracer : CallTracer | None, optional
+            Sink recording every call, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the file does not exist.
+        """
+        if not os.path.isfile(file_path):
+            raise RuntimeError(f"Offline file {file_path} does not exist")
+        self.host: str = os.path.basename(file_path)
+        self.port: int = 0
+        self.tracer: CallTracer | None = tracer
+        self.client: Any = _OfflineBackend(file_path)
+        self._init_access(CLIENT_POOL_SIZE)
+
+    def _new_pool_client(self) -> Any:
+        """
+        Share the thread-safe offline backend with the pool.
+
+        Returns
+        -------
+        _OfflineBackend
+            The offline backend.
+        """
+        return self.client
@@ -0,0 +1,489 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Recording and replay of ecFlow server sessions.
+
+A session directory contains ``session.jsonl`` (a header line followed by one
+line per client call) and a ``defs/`` folder of compressed Defs snapshots.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from ectop.client import EcflowClient
+from ectop.constants import CLIENT_POOL_SIZE
+from ectop.nodes import query_attribute
+from ectop.snapshot import dump_defs, load_defs
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+    from ectop.trace import CallTracer
+
+SESSION_FILE = "session.jsonl"
+"""Name of the call log inside a session directory."""
+SNAPSHOT_DIR = "defs"
+"""Name of the Defs snapshot folder inside a session directory."""
+
+
+def _event_key(method: str, path: str | None, file_type: str | None) -> str:
+    """
+    Build the lookup key used to match replayed calls to recorded ones.
+
+    Parameters
+    ----------
+    method : str
+        The `EcflowClient` method name.
+    path : str | None
+        The node path, if any.
+    file_type : str | None
+        The file type for `file` calls, if any.
+
+    Returns
+    -------
+    str
+        The lookup key.
+    """
+    return f"{method}|{path or ''}|{file_type or ''}"
+
+
+class SessionRecorder:
+    """
+    A tracer sink that captures full responses of a session for later replay.
+
+    It implements the same `record` interface as `CallTracer` and can be
+    attached to `EcflowClient.tracer`. Defs snapshots are only written after a
+    `sync_local`, so repeated `get_defs` calls share one snapshot.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    directory : str
+        The session directory being written.
+    """
+
+    def __init__(self, directory: str, host: str, port: int, tracer: CallTracer | None = None) -> None:
+        """
+        Initialize the SessionRecorder.
+
+        Parameters
+        ----------
+        directory : str
+            The session directory to create or overwrite.
+        host : str
+            The recorded server hostname.
+        port : int
+            The recorded server port.
+        tracer : CallTracer | None, optional
+            A tracer to forward every record to, by default None.
+        """
+        self.directory: str = directory
+        self._tracer = tracer
+        self._lock = threading.Lock()
+        self._t0 = time.time()
+        self._snapshot_count = 0
+        self._last_snapshot: str | None = None
+        self._defs_dirty = True
+        os.makedirs(os.path.join(directory, SNAPSHOT_DIR), exist_ok=True)
+        self._file = open(os.path.join(directory, SESSION_FILE), "w", encoding="utf-8")
+        self._write({"host": host, "port": port, "recorded": self._t0})
+
+    def _write(self, event: dict[str, Any]) -> None:
+        """
+        Write one JSON line to the session file.
+
+        Parameters
+        ----------
+        event : dict[str, Any]
+            The event to write.
+        """
+        self._file.write(json.dumps(event) + "\n")
+        self._file.flush()
+
+    def _snapshot(self, defs: Defs) -> str:
+        """
+        Write a Defs snapshot unless the defs have not been synced since the last one.
+
+        Parameters
+        ----------
+        defs : ecflow.Defs
+            The definitions returned by the server.
+
+        Returns
+        -------
+        str
+            The snapshot path relative to the session directory.
+        """
+        if self._last_snapshot and not self._defs_dirty:
+            return self._last_snapshot
+        self._snapshot_count += 1
+        name = os.path.join(SNAPSHOT_DIR, f"{self._snapshot_count:05d}.check.gz")
+        with open(os.path.join(self.directory, name), "wb") as f:
+            f.write(dump_defs(defs))
+        self._last_snapshot = name
+        self._defs_dirty = False
+        return name
+
+    def record(
+        self,
+        method: str,
+        path: str | None,
+        start: float,
+        duration: float,
+        result: Any = None,
+        error: str | None = None,
+        args: tuple[Any, ...] = (),
+    ) -> None:
+        """
+        Record a call and its full response.
+
+        Parameters
+        ----------
+        method : str
+            The `EcflowClient` method name.
+        path : str | None
+            The node path the call targeted, if any.
+        start : float
+            Wall-clock start time in epoch seconds.
+        duration : float
+            Elapsed time of the call in seconds.
+        result : Any, optional
+            The call result, by default None.
+        error : str | None, optional
+            The error message if the call failed, by default None.
+        args : tuple[Any, ...], optional
+            The call arguments, by default ().
+        """
+        if self._tracer:
+            self._tracer.record(method, path, start, duration, result=result, error=error, args=args)
+
+        event: dict[str, Any] = {
+            "method": method,
+            "path": path,
+            "file_type": args[1] if method == "file" and len(args) > 1 else None,
+            "offset": round(start - self._t0, 6),
+            "duration": round(duration, 6),
+            "error": error,
+        }
+        with self._lock:
+            if method == "sync_local" and error is None:
+                self._defs_dirty = True
+            if method == "get_defs" and result is not None:
+                event["snapshot"] = self._snapshot(result)
+            elif isinstance(result, str):
+                event["result"] = result
+            self._write(event)
+
+    def close(self) -> None:
+        """Close the session file and any forwarded tracer."""
+        with self._lock:
+            self._file.close()
+        if self._tracer:
+            self._tracer.close()
+
+
+class _ReplayBackend:
+    """
+    Stand-in for `ecflow.Client` serving responses from a recorded session.
+
+    Calls are matched to recorded ones by method, path and file type, in
+    recording order. Once a key is exhausted its last response is repeated.
+    Control commands that were not recorded succeed without effect.
+
+    Each response is held back until its recorded completion time (offset
+    plus duration, divided by the speed) since the replay started, and for
+    at least the recorded duration, so both the pacing of the session and the
+    latency of each call are reproduced. Calls made under the client's state
+    lock are answered at once: `sync_local` is paced with `pace` by
+    `ReplayClient` before the lock is taken, and `get_defs` and suite
+    registrations are local replies.
+    """
+
+    def __init__(self, directory: str, events: list[dict[str, Any]], speed: float) -> None:
+        """
+        Initialize the backend.
+
+        Parameters
+        ----------
+        directory : str
+            The session directory.
+        events : list[dict[str, Any]]
+            The recorded call events, header excluded.
+        speed : float
+            Replay speed factor; 0 replays as fast as possible.
+        """
+        self._directory = directory
+        self._speed = speed
+        self._t0 = time.monotonic()
+        self._lock = threading.Lock()
+        self._queues: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._positions: dict[str, int] = defaultdict(int)
+        self._defs_cache: dict[str, Defs] = {}
+        self._last_defs: Defs | None = None
+        for event in events:
+            self._queues[_event_key(event["method"], event.get("path"), event.get("file_type"))].append(event)
+
+    def _next(
+        self, method: str, path: str | None = None, file_type: str | None = None, paced: bool = True
+    ) -> dict[str, Any] | None:
+        """
+        Pop the next recorded event for a call, applying the recorded timing.
+
+        Parameters
+        ----------
+        method : str
+            The `EcflowClient` method name.
+        path : str | None, optional
+            The node path, by default None.
+        file_type : str | None, optional
+            The file type for `file` calls, by default None.
+        paced : bool, optional
+            Whether to hold the response back by the recorded timing, by default True.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The recorded event, or None if the call was never recorded.
+
+        Raises
+        ------
+        RuntimeError
+            If the recorded call failed.
+        """
+        key = _event_key(method, path, file_type)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                return None
+            idx = min(self._positions[key], len(queue) - 1)
+            self._positions[key] += 1
+            event = queue[idx]
+
+        if paced and self._speed > 0:
+            time.sleep(self._delay(event))
+        if event.get("error"):
+            raise RuntimeError(event["error"])
+        return event
+
+    def pace(self, method: str) -> None:
+        """
+        Wait for the recorded timing of the next call of a method, without consuming it.
+
+        Parameters
+        ----------
+        method : str
+            The `EcflowClient` method name.
+        """
+        key = _event_key(method, None, None)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue or self._speed <= 0:
+                return
+            event = queue[min(self._positions[key], len(queue) - 1)]
+        time.sleep(self._delay(event))
+
+    def _delay(self, event: dict[str, Any]) -> float:
+        """
+        Compute how long to hold back a recorded response.
+
+        Parameters
+        ----------
+        event : dict[str, Any]
+            The recorded call event.
+
+        Returns
+        -------
+        float
+            The seconds until the scaled recorded completion time, and at
+            least the scaled recorded duration.
+        """
+        duration = event["duration"] / self._speed
+        due = self._t0 + (event.get("offset", 0.0) + event["duration"]) / self._speed
+        return max(due - time.monotonic(), duration)
+
+    def ping(self) -> None:
+        """Replay a ping."""
+        self._next("ping")
+
+    def sync_local(self) -> None:
+        """Replay a sync; `pace` has already waited for it."""
+        self._next("sync_local", paced=False)
+
+    def get_defs(self) -> Defs | None:
+        """Return the Defs snapshot recorded for this call."""
+        event = self._next("get_defs", paced=False)
+        if not event or "snapshot" not in event:
+            return None
+        name = event["snapshot"]
+        with self._lock:
+            if name not in self._defs_cache:
+                with open(os.path.join(self._directory, name), "rb") as f:
+                    self._defs_cache[name] = load_defs(f.read())
+            self._last_defs = self._defs_cache[name]
+            return self._last_defs
+
+    def get_file(self, path: str, file_type: str, max_lines: str | None = None) -> str:
+        """Return the recorded file content, or its last `max_lines` lines."""
+        event = self._next("file", path, file_type)
+        if event is None:
+            raise RuntimeError("not recorded in this session")
+        result = event.get("result", "")
+        if max_lines is not None:
+            return "\n".join(result.splitlines()[-int(max_lines) :])
+        return result
+
+    def get_log(self, max_lines: int | None = None) -> str:
+        """Return the recorded server log, or its last `max_lines` lines."""
+        event = self._next("get_log")
+        if event is None:
+            raise RuntimeError("not recorded in this session")
+        result = event.get("result", "")
+        if max_lines is not None:
+            return "\n".join(result.splitlines()[-max_lines:])
+        return result
+
+    def suites(self) -> list[str]:
+        """List the suites of the last replayed Defs snapshot."""
+        return [suite.name() for suite in self._last_defs.suites] if self._last_defs else []
+
+    def ch_register(self, auto_add: bool, suites: list[str]) -> None:
+        """Replay a suite registration; the recorded snapshots are already limited to the suites."""
+        self._next("register_suites", paced=False)
+
+    def ch_drop(self) -> None:
+        """Replay dropping a suite registration."""
+        self._next("register_suites", paced=False)
+
+    def query(self, query_type: str, path: str, attribute: str = "") -> str:
+        """Answer a node query from the last replayed Defs snapshot."""
+        return query_attribute(self._last_defs, path, query_type, attribute)
+
+    def version(self) -> str:
+        """Return the recorded client version."""
+        event = self._next("version")
+        return event.get("result", "replay") if event else "replay"
+
+    def server_version(self) -> str:
+        """Return the recorded server version."""
+        event = self._next("server_version")
+        return event.get("result", "replay") if event else "replay"
+
+    def suspend(self, path: str) -> None:
+        """Replay a suspend command."""
+        self._next("suspend", path)
+
+    def resume(self, path: str) -> None:
+        """Replay a resume command."""
+        self._next("resume", path)
+
+    def kill(self, path: str) -> None:
+        """Replay a kill command."""
+        self._next("kill", path)
+
+    def force_complete(self, path: str) -> None:
+        """Replay a force complete command."""
+        self._next("force_complete", path)
+
+    def requeue(self, path: str) -> None:
+        """Replay a requeue command."""
+        self._next("requeue", path)
+
+    def alter(self, path: str, alter_type: str, name: str, value: str = "") -> None:
+        """Replay an alter command."""
+        self._next("alter", path)
+
+    def restart_server(self) -> None:
+        """Replay a server restart."""
+        self._next("restart_server")
+
+    def halt_server(self) -> None:
+        """Replay a server halt."""
+        self._next("halt_server")
+
+
+class ReplayClient(EcflowClient):
+    """
+    An `EcflowClient` that serves a recorded session instead of talking to a server.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+    """
+
+    DETACH_DEFS = False
+    """The loaded definitions are never synchronized in place, so they are not copied."""
+
+    def __init__(self, directory: str, speed: float = 1.0, tracer: CallTracer | None = None) -> None:
+        """
+        Initialize the ReplayClient.
+
+        Parameters
+        ----------
+        directory : str
+            The session directory written by `SessionRecorder`.
+        speed : float, optional
+            Latency scale: 1.0 replays each call with its original duration,
+            2.0 twice as fast, and 0 as fast as possible, by default 1.0.
+        tracer : CallTracer | None, optional
+            Sink recording every replayed call, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If the session cannot be read.
+        """
+        try:
+            with open(os.path.join(directory, SESSION_FILE), encoding="utf-8") as f:
+                header, *events = (json.loads(line) for line in f if line.strip())
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"Failed to read recorded session in {directory}: {e}") from e
+
+        self.host: str = header.get("host", "replay")
+        self.port: int = header.get("port", 0)
+        self.tracer: CallTracer | None = tracer
+        self.client: Any = _ReplayBackend(directory, events, speed)
+        self._init_access(CLIENT_POOL_SIZE)
+
+    def _new_pool_client(self) -> Any:
+        """
+        Share the thread-safe replay backend with the pool.
+
+        Returns
+        -------
+        _ReplayBackend
+            The replay backend.
+        """
+        return self.client
+
+    def sync_local(self) -> None:
+        """
+        Replay a sync with its recorded timing.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RuntimeError
+            If the recorded sync failed.
+
+        Notes
+        -----
+        The wait happens before the state lock is taken, so `get_defs` callers
+        are not held up by a slow recorded sync.
+        """
+        self.client.pace("sync_local")
+        super().sync_local()
@@ -0,0 +1,267 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Rolling runtime statistics and completion predictions per node.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from ectop.constants import RUNTIME_WINDOW, SLOW_MIN_RUNS
+from ectop.transitions import Transition
+
+
+class RuntimeSummary(NamedTuple):
+    """Statistics of the recent completed runs of a node."""
+
+    count: int
+    """Number of runs in the window."""
+    mean: float
+    """Mean run time in seconds."""
+    p90: float
+    """90th percentile run time in seconds (nearest rank)."""
+    p95: float
+    """95th percentile run time in seconds (nearest rank)."""
+
+
+class SlowTask(NamedTuple):
+    """An active node running longer than it usually does."""
+
+    path: str
+    """The absolute node path."""
+    elapsed: float
+    """Seconds since the node was seen becoming active."""
+    p95: float
+    """The 95th percentile of its recent run times."""
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Get a nearest-rank percentile of sorted values."""
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def _ancestors(path: str) -> list[str]:
+    """List the paths of the families and suite above a node, nearest first."""
+    parts = path.strip("/").split("/")
+    return ["/" + "/".join(parts[:n]) for n in range(len(parts) - 1, 0, -1)]
+
+
+class RuntimeStats:
+    """
+    Run times of each node and the predicted completion of active nodes.
+
+    A run lasts from a transition to active to the next transition to
+    complete; requeues and aborts discard it. `update` consumes the
+    transitions of one synchronization: it only touches the nodes that
+    changed, keeping a window of the last `window` run times, their running
+    sum and, once there are `SLOW_MIN_RUNS` of them, their p95 per node.
+    Predictions are kept for active nodes that have statistics, as start
+    time plus mean run time, and propagated to every ancestor as the latest
+    prediction below it. An active node running longer than its p95 is
+    slow; `slow` finds these by revisiting only the active nodes.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    window : int
+        Number of recent runs kept per node.
+    """
+
+    def __init__(self, window: int = RUNTIME_WINDOW) -> None:
+        """
+        Initialize the RuntimeStats.
+
+        Parameters
+        ----------
+        window : int, optional
+            Number of recent runs kept per node, by default RUNTIME_WINDOW.
+        """
+        self.window: int = window
+        self._runs: dict[str, deque[float]] = {}
+        self._sums: dict[str, float] = {}
+        self._started: dict[str, float] = {}
+        self._etas: dict[str, float] = {}
+        self._p95: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _add_run(self, path: str, duration: float) -> None:
+        """Append a run time to the window of a node, keeping the running sum."""
+        runs = self._runs.get(path)
+        if runs is None:
+            runs = self._runs[path] = deque(maxlen=self.window)
+            self._sums[path] = 0.0
+        if len(runs) == runs.maxlen:
+            self._sums[path] -= runs[0]
+        runs.append(duration)
+        self._sums[path] += duration
+        if len(runs) >= SLOW_MIN_RUNS:
+            self._p95[path] = _percentile(sorted(runs), 0.95)
+
+    def update(self, transitions: Iterable[Transition]) -> None:
+        """
+        Account for the transitions of one synchronization.
+
+        Parameters
+        ----------
+        transitions : Iterable[Transition]
+            The new transitions, e.g. from `TransitionRecorder.observe`.
+        """
+        with self._lock:
+            changed = False
+            for t in transitions:
+                if t.new == "active":
+                    self._started[t.path] = t.time
+                    changed = True
+                elif t.old == "active" or t.path in self._started:
+                    start = self._started.pop(t.path, None)
+                    if start is not None and t.new == "complete":
+                        self._add_run(t.path, t.time - start)
+                    changed = True
+            if changed:
+                self._rebuild_etas()
+
+    def _rebuild_etas(self) -> None:
+        """Recompute the predictions from the active nodes, which are few compared to the tree."""
+        etas: dict[str, float] = {}
+        for path, start in self._started.items():
+            runs = self._runs.get(path)
+            if not runs:
+                continue
+            eta = start + self._sums[path] / len(runs)
+            for target in (path, *_ancestors(path)):
+                if etas.get(target, 0.0) < eta:
+                    etas[target] = eta
+        self._etas = etas
+
+    def seed(self, path: str, durations: Iterable[float]) -> None:
+        """
+        Provide past run times of a node that has no statistics yet.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+        durations : Iterable[float]
+            Run times in seconds, oldest first, e.g. from `HistoryStore.runs`.
+        """
+        with self._lock:
+            if path in self._runs:
+                return
+            for duration in durations:
+                self._add_run(path, duration)
+            if path in self._started:
+                self._rebuild_etas()
+
+    def summary(self, path: str) -> RuntimeSummary | None:
+        """
+        Get the run time statistics of a node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+
+        Returns
+        -------
+        RuntimeSummary | None
+            The statistics, or None if no complete run was seen.
+        """
+        with self._lock:
+            runs = self._runs.get(path)
+            if not runs:
+                return None
+            ordered = sorted(runs)
+            mean = self._sums[path] / len(runs)
+        return RuntimeSummary(len(ordered), mean, _percentile(ordered, 0.9), _percentile(ordered, 0.95))
+
+    def started(self, path: str) -> float | None:
+        """
+        Get the time an active node was seen starting.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+
+        Returns
+        -------
+        float | None
+            The start time, or None if the node was not seen becoming active.
+        """
+        return self._started.get(path)
+
+    def eta(self, path: str) -> float | None:
+        """
+        Get the predicted completion time of an active node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path of a task, family or suite.
+
+        Returns
+        -------
+        float | None
+            The latest predicted completion of the node and its active
+            descendants, in seconds since the epoch, or None if unknown.
+        """
+        return self._etas.get(path)
+
+    def is_slow(self, path: str, now: float | None = None) -> bool:
+        """
+        Check whether an active node runs longer than its p95.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+        now : float | None, optional
+            The current time, by default `time.time()`.
+
+        Returns
+        -------
+        bool
+            True if the node is slow.
+        """
+        start = self._started.get(path)
+        threshold = self._p95.get(path)
+        if start is None or threshold is None:
+            return False
+        return (time.time() if now is None else now) - start > threshold
+
+    def slow(self, now: float | None = None) -> list[SlowTask]:
+        """
+        List the active nodes running longer than their p95.
+
+        Parameters
+        ----------
+        now : float | None, optional
+            The current time, by default `time.time()`.
+
+        Returns
+        -------
+        list[SlowTask]
+            The slow nodes, most overdue relative to their p95 first.
+        """
+        stamp = time.time() if now is None else now
+        with self._lock:
+            found = [
+                SlowTask(path, stamp - start, self._p95[path])
+                for path, start in self._started.items()
+                if path in self._p95 and stamp - start > self._p95[path]
+            ]
+        found.sort(key=lambda task: task.elapsed / max(task.p95, 1.0), reverse=True)
+        return found
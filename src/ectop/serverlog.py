@@ -0,0 +1,243 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Incremental parsing and indexing of the ecFlow server log.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from bisect import bisect_left
+from typing import NamedTuple
+
+from ectop.constants import SERVER_LOG_MAX_RECORDS, SERVER_LOG_OVERLAP
+
+_LINE_RE = re.compile(r"^(?P<kind>[A-Z]{3}):\[(?P<time>[^\]]+)\]\s*(?P<rest>.*)$")
+"""A log line, e.g. ``MSG:[08:54:18 19.10.2026] --requeue force /s  :user``."""
+_USER_RE = re.compile(r"\s:(?P<user>[\w.@-]+)\s*$")
+"""The user suffix of a command line."""
+
+
+class LogRecord(NamedTuple):
+    """One parsed server log line."""
+
+    kind: str
+    """The line type, e.g. MSG, LOG, ERR or WAR; empty if the line could not be parsed."""
+    time: str
+    """The time stamp as written by the server."""
+    command: str
+    """The command or state, e.g. "requeue", "chd:complete" or "active"."""
+    path: str
+    """The first node path on the line, if any."""
+    user: str
+    """The user that sent the command, if recorded."""
+    line: str
+    """The full line."""
+
+
+def parse_line(line: str) -> LogRecord:
+    """
+    Parse a server log line.
+
+    Parameters
+    ----------
+    line : str
+        The raw line.
+
+    Returns
+    -------
+    LogRecord
+        The record; lines in an unknown format only keep `line`.
+    """
+    match = _LINE_RE.match(line)
+    if not match:
+        return LogRecord("", "", "", "", "", line)
+    rest = match["rest"]
+    user = ""
+    user_match = _USER_RE.search(rest)
+    if user_match:
+        user = user_match["user"]
+        rest = rest[: user_match.start()]
+    tokens = rest.split()
+    command = tokens[0] if tokens else ""
+    if command.startswith("--"):
+        command = command[2:].split("=", 1)[0]
+    command = command.rstrip(":")
+    path = next((token.rstrip(":,;") for token in tokens if token.startswith("/")), "")
+    return LogRecord(match["kind"], match["time"], command, path, user, line)
+
+
+class ServerLog:
+    """
+    Parsed server log lines, indexed by node path.
+
+    `feed` takes the tail of the log as returned by each poll and only
+    parses the lines that follow the last lines already seen, so repeated
+    polls of an overlapping tail cost little. Each record's number is
+    stored per node path, so the history of a node is found without
+    scanning the log. The oldest records are dropped once there are more
+    than `capacity`.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of records kept.
+    gaps : int
+        Number of polls whose tail did not overlap the lines seen before,
+        e.g. because more lines were written than fetched, or the log was
+        replaced.
+    """
+
+    def __init__(self, capacity: int = SERVER_LOG_MAX_RECORDS) -> None:
+        """
+        Initialize the ServerLog.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Maximum number of records kept, by default SERVER_LOG_MAX_RECORDS.
+        """
+        self.capacity: int = capacity
+        self.gaps: int = 0
+        self._records: list[LogRecord] = []
+        self._dropped: int = 0
+        self._by_path: dict[str, list[int]] = {}
+        self._tail: list[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Number of records kept.
+
+        Returns
+        -------
+        int
+            The record count.
+        """
+        return len(self._records)
+
+    def _new_lines(self, lines: list[str]) -> list[str]:
+        """
+        Find the lines of a tail that follow the last lines seen.
+
+        Parameters
+        ----------
+        lines : list[str]
+            The fetched tail.
+
+        Returns
+        -------
+        list[str]
+            The unseen lines, or all of them if the tail does not overlap.
+        """
+        if not self._tail:
+            return lines
+        seen = len(self._tail)
+        last = self._tail[-1]
+        for i in range(len(lines) - 1, -1, -1):
+            if lines[i] == last and lines[max(0, i - seen + 1) : i + 1] == self._tail[max(0, seen - i - 1) :]:
+                return lines[i + 1 :]
+        self.gaps += 1
+        return lines
+
+    def feed(self, text: str) -> int:
+        """
+        Parse the unseen lines of a log tail.
+
+        Parameters
+        ----------
+        text : str
+            The tail of the server log.
+
+        Returns
+        -------
+        int
+            The number of new records.
+        """
+        lines = [line for line in text.splitlines() if line.strip()]
+        with self._lock:
+            new = self._new_lines(lines)
+            for line in new:
+                record = parse_line(line)
+                if record.path:
+                    self._by_path.setdefault(record.path, []).append(self._dropped + len(self._records))
+                self._records.append(record)
+            if new:
+                self._tail = (self._tail + new)[-SERVER_LOG_OVERLAP:]
+            # Trim in chunks so the index is rebuilt rarely
+            if len(self._records) > self.capacity + self.capacity // 4:
+                self._trim()
+        return len(new)
+
+    def _trim(self) -> None:
+        """Drop the oldest records down to the capacity and rebuild the index."""
+        excess = len(self._records) - self.capacity
+        self._records = self._records[excess:]
+        self._dropped += excess
+        self._by_path = {}
+        for n, record in enumerate(self._records):
+            if record.path:
+                self._by_path.setdefault(record.path, []).append(self._dropped + n)
+
+    def records(self, path: str | None = None, descendants: bool = True) -> list[LogRecord]:
+        """
+        List the kept records, oldest first.
+
+        Parameters
+        ----------
+        path : str | None, optional
+            Only the records naming this node, by default None (all records).
+        descendants : bool, optional
+            With `path`, also the records naming nodes below it, by default True.
+
+        Returns
+        -------
+        list[LogRecord]
+            The records.
+        """
+        return self.records_since(0, path, descendants)[0]
+
+    def records_since(self, number: int, path: str | None = None, descendants: bool = True) -> tuple[list[LogRecord], int]:
+        """
+        List the kept records from a record number on, oldest first.
+
+        Records are numbered in the order they were fed, from 0, and keep
+        their number when older records are dropped.
+
+        Parameters
+        ----------
+        number : int
+            The number of the first record wanted.
+        path : str | None, optional
+            Only the records naming this node, by default None (all records).
+        descendants : bool, optional
+            With `path`, also the records naming nodes below it, by default True.
+
+        Returns
+        -------
+        tuple[list[LogRecord], int]
+            The records, and the number the next fed record will get.
+        """
+        with self._lock:
+            end = self._dropped + len(self._records)
+            first = max(number, self._dropped)
+            if path is None:
+                return self._records[first - self._dropped :], end
+            own = self._by_path.get(path, [])
+            numbers = own[bisect_left(own, first) :]
+            if descendants:
+                prefix = path.rstrip("/") + "/"
+                for key, found in self._by_path.items():
+                    if key.startswith(prefix):
+                        numbers.extend(found[bisect_left(found, first) :])
+                numbers.sort()
+            return [self._records[n - self._dropped] for n in numbers], end
@@ -0,0 +1,133 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Serialization helpers for ecFlow definition snapshots.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+from typing import TYPE_CHECKING
+
+import ecflow
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+
+def dump_defs(defs: Defs) -> bytes:
+    """
+    Serialize definitions, including node state, to compressed bytes.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs
+        The definitions to serialize.
+
+    Returns
+    -------
+    bytes
+        The gzip-compressed ecFlow checkpoint.
+
+    Raises
+    ------
+    RuntimeError
+        If ecFlow fails to write the checkpoint.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix=".check")
+    os.close(fd)
+    try:
+        defs.save_as_checkpt(tmp_path)
+        with open(tmp_path, "rb") as f:
+            return gzip.compress(f.read())
+    finally:
+        os.unlink(tmp_path)
+
+
+def copy_defs(defs: Defs) -> Defs:
+    """
+    Make a detached copy of definitions, including node state.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs
+        The definitions to copy.
+
+    Returns
+    -------
+    ecflow.Defs
+        A copy that later syncs of the client do not modify.
+
+    Raises
+    ------
+    RuntimeError
+        If ecFlow fails to write or read the checkpoint.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix=".check")
+    os.close(fd)
+    try:
+        defs.save_as_checkpt(tmp_path)
+        return load_defs_file(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+def load_defs(data: bytes) -> Defs:
+    """
+    Restore definitions from bytes produced by `dump_defs`.
+
+    Parameters
+    ----------
+    data : bytes
+        The gzip-compressed ecFlow checkpoint.
+
+    Returns
+    -------
+    ecflow.Defs
+        The restored definitions.
+
+    Raises
+    ------
+    RuntimeError
+        If the checkpoint cannot be parsed.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix=".check")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.decompress(data))
+        return load_defs_file(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+def load_defs_file(path: str) -> Defs:
+    """
+    Load definitions from a checkpoint or a `.def` file on disk.
+
+    Parameters
+    ----------
+    path : str
+        Path to a `.check` checkpoint or a `.def` definition file.
+
+    Returns
+    -------
+    ecflow.Defs
+        The loaded definitions.
+
+    Raises
+    ------
+    RuntimeError
+        If the file cannot be parsed.
+    """
+    if path.endswith(".def"):
+        return ecflow.Defs(path)
+    defs = ecflow.Defs()
+    defs.restore_from_checkpt(path)
+    return defs
@@ -0,0 +1,193 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Persisted per-server snapshot and UI state for instant startup.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+from ectop.constants import STATE_CACHE_SUBDIR
+from ectop.snapshot import dump_defs, load_defs
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+
+def default_cache_dir() -> str:
+    """
+    Get the directory that state caches are stored in.
+
+    Returns
+    -------
+    str
+        ``$XDG_CACHE_HOME/ectop``, or ``~/.cache/ectop`` if the variable is unset.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, STATE_CACHE_SUBDIR)
+
+
+def server_cache_path(host: str, port: int, suffix: str, directory: str | None = None) -> str:
+    """
+    Get the path of a per-server cache file.
+
+    Parameters
+    ----------
+    host : str
+        The ecFlow server hostname.
+    port : int
+        The ecFlow server port.
+    suffix : str
+        The file suffix, e.g. ".ui.json".
+    directory : str | None, optional
+        The cache directory, by default `default_cache_dir()`.
+
+    Returns
+    -------
+    str
+        The file path, with unsafe characters of the host replaced.
+    """
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", f"{host}_{port}")
+    return os.path.join(directory or default_cache_dir(), name + suffix)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Write a file so that readers never see a partial file.
+
+    Parameters
+    ----------
+    path : str
+        The destination path.
+    data : bytes
+        The content to write.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class StateCache:
+    """
+    The last definitions snapshot and tree UI state of one server.
+
+    The snapshot is stored as a gzip-compressed checkpoint (see
+    `ectop.snapshot`), the UI state as a small JSON document. Both files are
+    replaced atomically, so an interrupted write leaves the previous state.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    snapshot_path : str
+        Path of the compressed checkpoint.
+    ui_path : str
+        Path of the UI state document.
+    """
+
+    def __init__(self, host: str, port: int, directory: str | None = None) -> None:
+        """
+        Initialize the StateCache.
+
+        Parameters
+        ----------
+        host : str
+            The ecFlow server hostname.
+        port : int
+            The ecFlow server port.
+        directory : str | None, optional
+            The cache directory, by default `default_cache_dir()`.
+        """
+        self.snapshot_path: str = server_cache_path(host, port, ".check.gz", directory)
+        self.ui_path: str = server_cache_path(host, port, ".ui.json", directory)
+
+    def load_defs(self) -> tuple[Defs, float] | None:
+        """
+        Load the cached definitions.
+
+        Returns
+        -------
+        tuple[ecflow.Defs, float] | None
+            The definitions and the time they were saved, or None if there is
+            no usable snapshot.
+        """
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = f.read()
+            saved_at = os.path.getmtime(self.snapshot_path)
+            return load_defs(data), saved_at
+        except (OSError, RuntimeError, EOFError):
+            return None
+
+    def save_defs(self, defs: Defs) -> None:
+        """
+        Store a definitions snapshot.
+
+        Parameters
+        ----------
+        defs : ecflow.Defs
+            The synchronized definitions.
+
+        Raises
+        ------
+        RuntimeError
+            If the snapshot cannot be written.
+        """
+        try:
+            _write_atomic(self.snapshot_path, dump_defs(defs))
+        except OSError as e:
+            raise RuntimeError(f"Failed to save snapshot to {self.snapshot_path}: {e}") from e
+
+    def load_ui_state(self) -> dict[str, Any]:
+        """
+        Load the cached UI state.
+
+        Returns
+        -------
+        dict[str, Any]
+            The state saved by `save_ui_state`, or an empty dict.
+        """
+        try:
+            with open(self.ui_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def save_ui_state(self, state: dict[str, Any]) -> None:
+        """
+        Store the UI state.
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            A JSON-serializable state, e.g. from `SuiteTree.ui_state`.
+
+        Raises
+        ------
+        RuntimeError
+            If the state cannot be written.
+        """
+        try:
+            _write_atomic(self.ui_path, json.dumps({**state, "saved_at": time.time()}).encode("utf-8"))
+        except OSError as e:
+            raise RuntimeError(f"Failed to save UI state to {self.ui_path}: {e}") from e
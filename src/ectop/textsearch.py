@@ -0,0 +1,238 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Match finding and navigation for in-content search.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from ectop.constants import REGEX_SEARCH_PREFIX, SEARCH_MAX_MATCHES
+
+
+def compile_query(query: str, binary: bool = False) -> re.Pattern:
+    """
+    Compile a content search query into a case-insensitive pattern.
+
+    Parameters
+    ----------
+    query : str
+        The query. A query starting with REGEX_SEARCH_PREFIX is a regular
+        expression, anything else is matched literally.
+    binary : bool, optional
+        Compile a bytes pattern for searching memory-mapped files, by default False.
+        Case folding of bytes patterns only applies to ASCII letters.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern.
+
+    Raises
+    ------
+    ValueError
+        If the query is empty or not a valid regular expression.
+    """
+    if query.startswith(REGEX_SEARCH_PREFIX):
+        source = query[len(REGEX_SEARCH_PREFIX) :]
+    else:
+        source = re.escape(query)
+    if not source:
+        raise ValueError("Empty search query")
+    try:
+        if binary:
+            return re.compile(source.encode("utf-8"), re.IGNORECASE | re.MULTILINE)
+        return re.compile(source, re.IGNORECASE | re.MULTILINE)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression: {e}") from e
+
+
+class MatchSet:
+    """
+    Offsets of all matches of a query, with a selected match for navigation.
+
+    Offsets and lengths are character positions for text sources and byte
+    positions for memory-mapped files. They are stored in compact arrays and
+    are sorted, so matches within a line range are found by bisection.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    query : str
+        The query that produced the matches.
+    offsets : array[int]
+        Start offset of each match.
+    lengths : array[int]
+        Length of each match.
+    lines : array[int] | None
+        Zero-based line number of each match, when collected from text.
+    truncated : bool
+        Whether collection stopped at the match limit.
+    current : int
+        Index of the selected match, or -1 before navigation.
+    """
+
+    def __init__(self, query: str) -> None:
+        """
+        Initialize an empty MatchSet.
+
+        Parameters
+        ----------
+        query : str
+            The query that produced the matches.
+        """
+        self.query: str = query
+        self.offsets: array[int] = array("Q")
+        self.lengths: array[int] = array("L")
+        self.lines: array[int] | None = None
+        self.truncated: bool = False
+        self.current: int = -1
+
+    @classmethod
+    def collect(
+        cls,
+        query: str,
+        matches: Iterable[re.Match],
+        text: str | None = None,
+        limit: int = SEARCH_MAX_MATCHES,
+    ) -> MatchSet:
+        """
+        Record the matches produced by a pattern scan.
+
+        Parameters
+        ----------
+        query : str
+            The query that produced the matches.
+        matches : Iterable[re.Match]
+            The matches, in increasing offset order. Empty matches are skipped.
+        text : str | None, optional
+            The scanned text. When given, line numbers are counted between
+            consecutive matches in the same pass, by default None.
+        limit : int, optional
+            Maximum number of matches to record, by default SEARCH_MAX_MATCHES.
+
+        Returns
+        -------
+        MatchSet
+            The collected matches.
+        """
+        result = cls(query)
+        if text is not None:
+            result.lines = array("L")
+        line = 0
+        last = 0
+        for match in matches:
+            start, end = match.span()
+            if start == end:
+                continue
+            if len(result.offsets) >= limit:
+                result.truncated = True
+                break
+            result.offsets.append(start)
+            result.lengths.append(end - start)
+            if text is not None and result.lines is not None:
+                line += text.count("\n", last, start)
+                last = start
+                result.lines.append(line)
+        return result
+
+    def __len__(self) -> int:
+        """
+        Number of recorded matches.
+
+        Returns
+        -------
+        int
+            The match count.
+        """
+        return len(self.offsets)
+
+    def select(self, index: int) -> int:
+        """
+        Select a match, wrapping around at both ends.
+
+        Parameters
+        ----------
+        index : int
+            The index of the match to select.
+
+        Returns
+        -------
+        int
+            The selected index, or -1 if there are no matches.
+        """
+        if not self.offsets:
+            self.current = -1
+        else:
+            self.current = index % len(self.offsets)
+        return self.current
+
+    def next(self) -> int:
+        """
+        Select the next match.
+
+        Returns
+        -------
+        int
+            The selected index, or -1 if there are no matches.
+        """
+        return self.select(self.current + 1)
+
+    def previous(self) -> int:
+        """
+        Select the previous match.
+
+        Returns
+        -------
+        int
+            The selected index, or -1 if there are no matches.
+        """
+        return self.select(self.current - 1 if self.current >= 0 else -1)
+
+    def in_range(self, start: int, end: int) -> list[tuple[int, int, bool]]:
+        """
+        List the matches that begin within an offset range.
+
+        Parameters
+        ----------
+        start : int
+            First offset of the range.
+        end : int
+            Offset just past the range.
+
+        Returns
+        -------
+        list[tuple[int, int, bool]]
+            ``(offset, length, is_current)`` for each match in the range.
+        """
+        i = bisect_left(self.offsets, start)
+        out: list[tuple[int, int, bool]] = []
+        while i < len(self.offsets) and self.offsets[i] < end:
+            out.append((self.offsets[i], self.lengths[i], i == self.current))
+            i += 1
+        return out
+
+    def status(self) -> str:
+        """
+        Describe the selected match for a notification.
+
+        Returns
+        -------
+        str
+            A message such as "Match 3/120 for 'error'".
+        """
+        if not self.offsets:
+            return f"No matches for '{self.query}'"
+        total = f"{len(self.offsets)}+" if self.truncated else str(len(self.offsets))
+        return f"Match {self.current + 1}/{total} for '{self.query}'"
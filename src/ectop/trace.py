@@ -0,0 +1,162 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Structured tracing of ecFlow client calls.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+import ecflow
+
+from ectop.constants import DEFAULT_TRACE_BACKUP_COUNT, DEFAULT_TRACE_MAX_BYTES
+
+
+def response_size(result: Any) -> int | None:
+    """
+    Estimate the size of a server response.
+
+    Parameters
+    ----------
+    result : Any
+        The value returned by the ecFlow client call.
+
+    Returns
+    -------
+    int | None
+        The length of string or bytes responses, or None if it cannot be measured cheaply.
+    """
+    if isinstance(result, (str, bytes)):
+        return len(result)
+    return None
+
+
+def response_nodes(result: Any) -> int | None:
+    """
+    Count the nodes of a definitions response.
+
+    Parameters
+    ----------
+    result : Any
+        The value returned by the ecFlow client call.
+
+    Returns
+    -------
+    int | None
+        The number of suites, families and tasks of a `Defs` result, or None for other results.
+
+    Notes
+    -----
+    Serializing the definitions to measure them in bytes would cost as much
+    as the call itself, so their size is reported as a node count. This is
+    a walk over the nodes, done only while tracing is enabled.
+    """
+    if not isinstance(result, ecflow.Defs):
+        return None
+    return sum(len(suite.get_all_nodes()) for suite in result.suites)
+
+
+class CallTracer:
+    """
+    A JSON-lines sink recording every call made through an `EcflowClient`.
+
+    Each line is a JSON object with the keys ``method``, ``path``, ``start``
+    (epoch seconds), ``duration`` (seconds), ``size`` (characters of text
+    responses), ``nodes`` (node count of definitions responses) and
+    ``error``. The file is rotated once it exceeds ``max_bytes``.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    path : str
+        The trace file path.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_TRACE_MAX_BYTES,
+        backup_count: int = DEFAULT_TRACE_BACKUP_COUNT,
+    ) -> None:
+        """
+        Initialize the CallTracer.
+
+        Parameters
+        ----------
+        path : str
+            The file to append trace records to.
+        max_bytes : int, optional
+            Size at which the file is rotated, by default DEFAULT_TRACE_MAX_BYTES.
+        backup_count : int, optional
+            Number of rotated files to keep, by default DEFAULT_TRACE_BACKUP_COUNT.
+        """
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def record(
+        self,
+        method: str,
+        path: str | None,
+        start: float,
+        duration: float,
+        result: Any = None,
+        error: str | None = None,
+        args: tuple[Any, ...] = (),
+    ) -> None:
+        """
+        Append a single call record to the trace.
+
+        Parameters
+        ----------
+        method : str
+            The `EcflowClient` method name.
+        path : str | None
+            The node path the call targeted, if any.
+        start : float
+            Wall-clock start time in epoch seconds.
+        duration : float
+            Elapsed time of the call in seconds.
+        result : Any, optional
+            The call result, used to derive the response size, by default None.
+        error : str | None, optional
+            The error message if the call failed, by default None.
+        args : tuple[Any, ...], optional
+            The call arguments. Not written to the trace, but part of the sink
+            interface so recording sinks can key responses, by default ().
+
+        Notes
+        -----
+        This method is thread-safe and may be called from any worker.
+        """
+        line = json.dumps(
+            {
+                "method": method,
+                "path": path,
+                "start": round(start, 6),
+                "duration": round(duration, 6),
+                "size": response_size(result),
+                "nodes": response_nodes(result),
+                "error": error,
+            }
+        )
+        with self._lock:
+            self._handler.emit(logging.makeLogRecord({"msg": line}))
+
+    def close(self) -> None:
+        """Flush and close the underlying file."""
+        with self._lock:
+            self._handler.close()
@@ -0,0 +1,250 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Node state transitions derived from successive synchronizations.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+from ectop.constants import STATE_MAP, TRANSITION_BUFFER_SIZE
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+
+class Transition(NamedTuple):
+    """A node changing state between two synchronizations."""
+
+    time: float
+    """Time of the synchronization that observed the change, in seconds since the epoch."""
+    path: str
+    """The absolute node path."""
+    old: str
+    """The previous state."""
+    new: str
+    """The new state."""
+
+
+def node_states(defs: Defs | None) -> dict[str, str]:
+    """
+    Map every node of a definition to its state.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+
+    Returns
+    -------
+    dict[str, str]
+        The state of each suite, family and task by absolute path.
+    """
+    states: dict[str, str] = {}
+    if not defs:
+        return states
+    for suite in defs.suites:
+        states[suite.get_abs_node_path()] = str(suite.get_state())
+        for node in suite.get_all_nodes():
+            states[node.get_abs_node_path()] = str(node.get_state())
+    return states
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration compactly.
+
+    Parameters
+    ----------
+    seconds : float
+        The duration in seconds.
+
+    Returns
+    -------
+    str
+        E.g. "42s", "3m05s" or "2h07m".
+    """
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+class TransitionRecorder:
+    """
+    A fixed-size ring buffer of state transitions.
+
+    Each `observe` call diffs the node states of a synchronization against
+    the previous one. Transitions are stored as one float and three small
+    integers in preallocated arrays, with node paths and state names
+    interned in lookup tables. Paths that are no longer referenced are
+    dropped from the table when it outgrows the buffer, so memory stays
+    bounded however long ectop runs. The oldest transitions are overwritten
+    first.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of transitions kept.
+    """
+
+    def __init__(self, capacity: int = TRANSITION_BUFFER_SIZE) -> None:
+        """
+        Initialize the TransitionRecorder.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Maximum number of transitions kept, by default TRANSITION_BUFFER_SIZE.
+        """
+        self.capacity: int = capacity
+        self._times: array[float] = array("d", [0.0]) * capacity
+        self._paths: array[int] = array("L", [0]) * capacity
+        self._old: array[int] = array("B", [0]) * capacity
+        self._new: array[int] = array("B", [0]) * capacity
+        self._count: int = 0
+        self._head: int = 0
+        self._path_ids: dict[str, int] = {}
+        self._path_names: list[str] = []
+        self._state_ids: dict[str, int] = {state: i for i, state in enumerate(STATE_MAP)}
+        self._state_names: list[str] = list(STATE_MAP)
+        self._previous: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def _intern_path(self, path: str) -> int:
+        """Get the table index of a path, adding it if needed."""
+        idx = self._path_ids.get(path)
+        if idx is None:
+            if len(self._path_names) >= 2 * self.capacity:
+                self._compact_paths()
+            idx = self._path_ids[path] = len(self._path_names)
+            self._path_names.append(path)
+        return idx
+
+    def _compact_paths(self) -> None:
+        """Drop paths no longer referenced by the buffer, e.g. of suites that were replaced."""
+        start = (self._head - self._count) % self.capacity
+        slots = [(start + n) % self.capacity for n in range(self._count)]
+        remap: dict[int, int] = {}
+        names: list[str] = []
+        for slot in slots:
+            old_id = self._paths[slot]
+            if old_id not in remap:
+                remap[old_id] = len(names)
+                names.append(self._path_names[old_id])
+            self._paths[slot] = remap[old_id]
+        self._path_names = names
+        self._path_ids = {name: i for i, name in enumerate(names)}
+
+    def _intern_state(self, state: str) -> int:
+        """Get the table index of a state name, adding it if needed."""
+        idx = self._state_ids.get(state)
+        if idx is None:
+            idx = self._state_ids[state] = len(self._state_names)
+            self._state_names.append(state)
+        return idx
+
+    def observe(self, defs: Defs | None, now: float | None = None) -> list[Transition]:
+        """
+        Record the state changes since the previous synchronization.
+
+        The first observation only sets the baseline. Nodes that appear or
+        disappear between observations are not recorded.
+
+        Parameters
+        ----------
+        defs : ecflow.Defs | None
+            The freshly synchronized definitions.
+        now : float | None, optional
+            The synchronization time, by default the current time.
+
+        Returns
+        -------
+        list[Transition]
+            The new transitions, in path order.
+        """
+        states = node_states(defs)
+        stamp = time.time() if now is None else now
+        found: list[Transition] = []
+        with self._lock:
+            previous, self._previous = self._previous, states
+            if previous is None:
+                return found
+            for path, new in states.items():
+                old = previous.get(path)
+                if old is None or old == new:
+                    continue
+                found.append(Transition(stamp, path, old, new))
+                slot = self._head
+                self._times[slot] = stamp
+                self._paths[slot] = self._intern_path(path)
+                self._old[slot] = self._intern_state(old)
+                self._new[slot] = self._intern_state(new)
+                self._head = (slot + 1) % self.capacity
+                self._count = min(self._count + 1, self.capacity)
+        return found
+
+    def __len__(self) -> int:
+        """
+        Number of transitions kept.
+
+        Returns
+        -------
+        int
+            The transition count.
+        """
+        return self._count
+
+    def for_path(self, path: str, descendants: bool = False) -> list[Transition]:
+        """
+        List the kept transitions of a node, oldest first.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+        descendants : bool, optional
+            Also include the nodes below `path`, by default False.
+
+        Returns
+        -------
+        list[Transition]
+            The transitions of the node, in the order they were observed.
+        """
+        with self._lock:
+            if descendants:
+                prefix = path.rstrip("/") + "/"
+                wanted = {i for i, name in enumerate(self._path_names) if name == path or name.startswith(prefix)}
+            else:
+                idx = self._path_ids.get(path)
+                wanted = set() if idx is None else {idx}
+            if not wanted:
+                return []
+            start = (self._head - self._count) % self.capacity
+            out: list[Transition] = []
+            for n in range(self._count):
+                slot = (start + n) % self.capacity
+                if self._paths[slot] in wanted:
+                    out.append(
+                        Transition(
+                            self._times[slot],
+                            self._path_names[self._paths[slot]],
+                            self._state_names[self._old[slot]],
+                            self._state_names[self._new[slot]],
+                        )
+                    )
+            return out
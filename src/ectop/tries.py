@@ -0,0 +1,294 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Job output history across task tries.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from ectop.constants import OUTPUT_HISTORY_MAX_BYTES, OUTPUT_HISTORY_SIZE
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+    from ectop.aio import AsyncEcflowClient
+
+
+def generated_variables(defs: Defs | None, path: str) -> dict[str, str]:
+    """
+    Collect the generated variables of a node.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the node.
+
+    Returns
+    -------
+    dict[str, str]
+        Generated variable values by name, empty if the node is unknown.
+    """
+    if not defs:
+        return {}
+    node = defs.find_abs_node(path)
+    if not node:
+        return {}
+    return {var.name(): var.value() for var in node.get_generated_variables()}
+
+
+def try_number(defs: Defs | None, path: str) -> int:
+    """
+    Get the current try number of a task.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the task.
+
+    Returns
+    -------
+    int
+        The value of the generated ECF_TRYNO variable, or 0 if unknown.
+    """
+    try:
+        return int(generated_variables(defs, path).get("ECF_TRYNO", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def try_output_paths(defs: Defs | None, path: str) -> dict[int, str]:
+    """
+    Resolve the job output file of every try of a task.
+
+    The generated ECF_JOBOUT variable holds the output file of the current
+    try, conventionally ``<name>.<ECF_TRYNO>``. Earlier tries are found by
+    substituting the try number in that suffix.
+
+    Parameters
+    ----------
+    defs : ecflow.Defs | None
+        The synchronized definitions.
+    path : str
+        The absolute path to the task.
+
+    Returns
+    -------
+    dict[int, str]
+        Output file path by try number. Only the current try is returned if
+        ECF_JOBOUT does not end with the try number.
+    """
+    variables = generated_variables(defs, path)
+    jobout = variables.get("ECF_JOBOUT", "")
+    try:
+        current = int(variables.get("ECF_TRYNO", 0))
+    except (TypeError, ValueError):
+        current = 0
+    if not jobout or current < 1:
+        return {}
+    suffix = f".{current}"
+    if not jobout.endswith(suffix):
+        return {current: jobout}
+    stem = jobout[: -len(suffix)]
+    return {n: f"{stem}.{n}" for n in range(1, current + 1)}
+
+
+def read_output(file_path: str) -> str:
+    """
+    Read a job output file from the local file system.
+
+    Parameters
+    ----------
+    file_path : str
+        The output file path.
+
+    Returns
+    -------
+    str
+        The file content.
+
+    Raises
+    ------
+    RuntimeError
+        If the file cannot be read, e.g. because the job ran on another host.
+    """
+    try:
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError as e:
+        raise RuntimeError(f"Output file {file_path} is not accessible: {e}") from e
+
+
+class OutputHistory:
+    """
+    A thread-safe LRU store of job outputs keyed by node path and try number.
+
+    Both the number of outputs and their total size are bounded; outputs
+    larger than the whole size budget are not kept.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of stored outputs.
+    max_bytes : int
+        Maximum total size of stored outputs in characters.
+    """
+
+    def __init__(self, maxsize: int = OUTPUT_HISTORY_SIZE, max_bytes: int = OUTPUT_HISTORY_MAX_BYTES) -> None:
+        """
+        Initialize the OutputHistory.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of stored outputs, by default OUTPUT_HISTORY_SIZE.
+        max_bytes : int, optional
+            Maximum total size of stored outputs, by default OUTPUT_HISTORY_MAX_BYTES.
+        """
+        self.maxsize: int = maxsize
+        self.max_bytes: int = max_bytes
+        self._entries: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._size: int = 0
+        self._lock = threading.Lock()
+
+    def put(self, path: str, try_no: int, content: str) -> None:
+        """
+        Store the output of a try, evicting least recently used outputs beyond the budgets.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the task.
+        try_no : int
+            The try number.
+        content : str
+            The job output.
+        """
+        if len(content) > self.max_bytes:
+            return
+        key = (path, try_no)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = content
+            self._size += len(content)
+            while len(self._entries) > self.maxsize or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def get(self, path: str, try_no: int) -> str | None:
+        """
+        Look up the output of a try.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the task.
+        try_no : int
+            The try number.
+
+        Returns
+        -------
+        str | None
+            The stored output, or None if it is not known.
+        """
+        with self._lock:
+            content = self._entries.get((path, try_no))
+            if content is not None:
+                self._entries.move_to_end((path, try_no))
+            return content
+
+    def tries(self, path: str) -> list[int]:
+        """
+        List the try numbers stored for a task.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the task.
+
+        Returns
+        -------
+        list[int]
+            The stored try numbers in increasing order.
+        """
+        with self._lock:
+            return sorted(t for p, t in self._entries if p == path)
+
+
+async def fetch_try_outputs(
+    client: AsyncEcflowClient,
+    history: OutputHistory,
+    path: str,
+    files: dict[int, str],
+    current: int,
+    tries: Iterable[int],
+) -> dict[int, str | RuntimeError]:
+    """
+    Fetch the outputs of several tries concurrently, using the history as a cache.
+
+    The current try is always fetched from the server. Earlier tries are read from
+    their output files, which requires them to be on a file system visible
+    to ectop. Fetched outputs are stored in the history.
+
+    Parameters
+    ----------
+    client : AsyncEcflowClient
+        The client used for the current try.
+    history : OutputHistory
+        The output cache.
+    path : str
+        The absolute path to the task.
+    files : dict[int, str]
+        Output file path by try number, from `try_output_paths`.
+    current : int
+        The current try number.
+    tries : Iterable[int]
+        The tries to fetch.
+
+    Returns
+    -------
+    dict[int, str | RuntimeError]
+        The output of each try, or the error raised while fetching it.
+    """
+
+    async def fetch(try_no: int) -> str:
+        # The current try may still be running, so only earlier tries are served from the cache
+        cached = history.get(path, try_no) if try_no != current else None
+        if cached is not None:
+            return cached
+        if try_no == current:
+            content = await client.file(path, "jobout")
+        elif try_no in files:
+            content = await asyncio.to_thread(read_output, files[try_no])
+        else:
+            raise RuntimeError(f"Output file of try {try_no} is unknown")
+        history.put(path, try_no, content)
+        return content
+
+    wanted = list(tries)
+    results = await asyncio.gather(*(fetch(t) for t in wanted), return_exceptions=True)
+    out: dict[int, str | RuntimeError] = {}
+    for try_no, result in zip(wanted, results, strict=True):
+        if isinstance(result, BaseException) and not isinstance(result, RuntimeError):
+            raise result
+        out[try_no] = result
+    return out
@@ -0,0 +1,75 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Targeted polling of the nodes on the watch list.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from ecflow import Defs
+
+    from ectop.aio import AsyncEcflowClient
+
+
+class WatchStatus(NamedTuple):
+    """The polled status of a watched node."""
+
+    path: str
+    """The absolute node path."""
+    state: str
+    """The node state, or an empty string if the query failed."""
+    meters: tuple[tuple[str, str, int], ...] = ()
+    """Name, value and maximum of each meter."""
+    labels: tuple[tuple[str, str], ...] = ()
+    """Name and value of each label."""
+    error: str = ""
+    """The error of a failed query."""
+
+
+async def fetch_status(client: AsyncEcflowClient, defs: Defs | None, path: str) -> WatchStatus:
+    """
+    Query the state, meters and labels of one node.
+
+    The attribute names and meter ranges are taken from the last synchronized
+    definitions; only their values are queried, concurrently.
+
+    Parameters
+    ----------
+    client : AsyncEcflowClient
+        The awaitable ecFlow client.
+    defs : ecflow.Defs | None
+        The last synchronized definitions.
+    path : str
+        The absolute node path.
+
+    Returns
+    -------
+    WatchStatus
+        The status; on failure only `error` is set.
+    """
+    node = defs.find_abs_node(path) if defs else None
+    meters = [(meter.name(), meter.max()) for meter in getattr(node, "meters", ())]
+    labels = [label.name() for label in getattr(node, "labels", ())]
+    try:
+        state, *values = await asyncio.gather(
+            client.query(path, "state"),
+            *(client.query(path, "meter", name) for name, _ in meters),
+            *(client.query(path, "label", name) for name in labels),
+        )
+    except RuntimeError as e:
+        return WatchStatus(path, "", error=str(e))
+    return WatchStatus(
+        path,
+        state,
+        tuple((name, value, maximum) for (name, maximum), value in zip(meters, values, strict=False)),
+        tuple(zip(labels, values[len(meters) :], strict=True)),
+    )
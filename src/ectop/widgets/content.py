@@ -11,14 +11,45 @@ Main content area for displaying ecFlow node information.
 
 from __future__ import annotations
 
+import re
+import time
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
 
-from rich.syntax import Syntax
+from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
-from textual.widgets import Input, RichLog, Static, TabbedContent, TabPane
-
-from ectop.constants import SYNTAX_THEME
+from textual.widgets import DataTable, Input, RichLog, Static, TabbedContent, TabPane
+
+from ectop.constants import (
+    COLOR_LATE,
+    COLOR_METER_BAR,
+    COLOR_SEARCH_MATCH,
+    ICON_ETA,
+    ICON_UNKNOWN_STATE,
+    LARGE_LOG_THRESHOLD,
+    METER_BAR_WIDTH,
+    STATE_MAP,
+    SYNTAX_HIGHLIGHT_MAX_SIZE,
+    SYNTAX_INLINE_MAX_SIZE,
+    TIMELINE_MAX_ROWS,
+)
+from ectop.diff import diff_lines
+from ectop.highlight import content_key, highlight_cache, render_code, rendered_spans
+from ectop.history import Run
+from ectop.nodes import NodeDetails
+from ectop.runtimes import RuntimeSummary
+from ectop.textsearch import MatchSet, compile_query
+from ectop.transitions import Transition, format_duration
+from ectop.widgets.diffview import DiffView
+from ectop.widgets.logview import LargeLogView
+from ectop.workers import call_on_main, limited
+
+TAB_CONTENT_KEYS: dict[str, str] = {"tab_output": "output", "tab_script": "script", "tab_job": "job"}
+"""Content cache key of each tab."""
 
 
 class MainContent(Vertical):
@@ -34,8 +65,17 @@ class MainContent(Vertical):
         Whether live log updates are enabled.
     last_log_size : int
         The size of the log content at the last update.
+    large_log : bool
+        Whether the Output tab is using the windowed large log viewer.
+    timeline_path : str | None
+        The node whose transitions the Timeline tab shows.
     """
 
+    BINDINGS = [
+        Binding("n", "next_match", "Next Match"),
+        Binding("N", "previous_match", "Previous Match"),
+    ]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """
         Initialize the MainContent widget.
@@ -50,7 +90,12 @@ class MainContent(Vertical):
         super().__init__(*args, **kwargs)
         self.is_live: bool = False
         self.last_log_size: int = 0
+        self.large_log: bool = False
         self._content_cache: dict[str, str] = {}
+        self._matches: dict[str, MatchSet] = {}
+        self._code_digests: dict[str, str] = {}
+        self.details: NodeDetails | None = None
+        self.timeline_path: str | None = None
 
     def compose(self) -> ComposeResult:
         """
@@ -61,16 +106,39 @@ class MainContent(Vertical):
         ComposeResult
             The UI components for the tabs.
         """
-        yield Input(placeholder="Search in content...", id="content_search", classes="hidden")
+        yield Input(placeholder="Search in content (re: for regex)...", id="content_search", classes="hidden")
         with TabbedContent(id="content_tabs"):
             with TabPane("Output", id="tab_output"):
+                yield Input(placeholder="Jump to: line number, N% or end", id="log_jump", classes="hidden")
                 yield RichLog(markup=True, highlight=True, id="log_output")
+                yield LargeLogView(id="log_large", classes="hidden")
             with TabPane("Script (.ecf)", id="tab_script"):
                 with VerticalScroll():
                     yield Static("", id="view_script", classes="code_view")
             with TabPane("Job (Processed)", id="tab_job"):
                 with VerticalScroll():
                     yield Static("", id="view_job", classes="code_view")
+            with TabPane("Diff", id="tab_diff"):
+                yield Static("No diff loaded. Press d (Script vs Job) or D (previous try vs current).", id="diff_title")
+                yield DiffView(id="view_diff")
+            with TabPane("Timeline", id="tab_timeline"):
+                yield Static("No node loaded.", id="timeline_title")
+                yield Static("", id="timeline_runtime")
+                yield Static("", id="timeline_runs")
+                yield DataTable(id="view_timeline", cursor_type="row")
+            with TabPane("Details", id="tab_details"):
+                with VerticalScroll():
+                    yield Static("No node loaded.", id="view_details", classes="code_view")
+
+    def on_mount(self) -> None:
+        """
+        Set up the columns of the Timeline table.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#view_timeline", DataTable).add_columns("Time", "Node", "From", "To", "After")
 
     @property
     def active(self) -> str | None:
@@ -100,6 +168,9 @@ class MainContent(Vertical):
         """
         Update the Output log tab.
 
+        Outputs larger than LARGE_LOG_THRESHOLD are shown in the windowed
+        `LargeLogView` instead of the `RichLog`.
+
         Parameters
         ----------
         content : str
@@ -110,18 +181,42 @@ class MainContent(Vertical):
         widget = self.query_one("#log_output", RichLog)
         self._content_cache["output"] = content
         if not append:
-            widget.clear()
+            self._matches.pop("output", None)
             self.last_log_size = len(content)
+            if len(content) > LARGE_LOG_THRESHOLD:
+                self._set_large_log(True)
+                self.query_one("#log_large", LargeLogView).load(content)
+                return
+            self._set_large_log(False)
+            widget.clear()
             widget.write(content)
         else:
             new_content = content[self.last_log_size :]
             if new_content:
-                widget.write(new_content)
+                if self.large_log:
+                    self.query_one("#log_large", LargeLogView).append(new_content)
+                else:
+                    widget.write(new_content)
                 self.last_log_size = len(content)
 
+    def _set_large_log(self, enabled: bool) -> None:
+        """
+        Switch the Output tab between the RichLog and the large log viewer.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to show the large log viewer.
+        """
+        if enabled == self.large_log:
+            return
+        self.large_log = enabled
+        self.query_one("#log_large", LargeLogView).set_class(not enabled, "hidden")
+        self.query_one("#log_output", RichLog).set_class(enabled, "hidden")
+
     def update_script(self, content: str) -> None:
         """
-        Update the Script tab with syntax highlighting.
+        Update the Script tab with (cached) syntax highlighting.
 
         Parameters
         ----------
@@ -129,13 +224,12 @@ class MainContent(Vertical):
             The script content.
         """
         self._content_cache["script"] = content
-        widget = self.query_one("#view_script", Static)
-        syntax = Syntax(content, "bash", theme=SYNTAX_THEME, line_numbers=True)
-        widget.update(syntax)
+        self._matches.pop("script", None)
+        self._render_code("script")
 
     def update_job(self, content: str) -> None:
         """
-        Update the Job tab with syntax highlighting.
+        Update the Job tab with (cached) syntax highlighting.
 
         Parameters
         ----------
@@ -143,9 +237,310 @@ class MainContent(Vertical):
             The job content.
         """
         self._content_cache["job"] = content
-        widget = self.query_one("#view_job", Static)
-        syntax = Syntax(content, "bash", theme=SYNTAX_THEME, line_numbers=True)
-        widget.update(syntax)
+        self._matches.pop("job", None)
+        self._render_code("job")
+
+    def _render_code(self, key: str) -> None:
+        """
+        Render the Script or Job tab from the highlight cache.
+
+        Small files are highlighted immediately. Larger ones are shown as
+        plain text at once and repainted when the `_highlight_worker` has
+        finished; files above SYNTAX_HIGHLIGHT_MAX_SIZE stay plain. Renderings
+        are cached by content digest, so re-selecting a node is free.
+
+        Parameters
+        ----------
+        key : str
+            The content cache key, "script" or "job".
+        """
+        content = self._content_cache.get(key, "")
+        digest = content_key(content)
+        self._code_digests[key] = digest
+        text = highlight_cache.get(digest)
+        if text is None:
+            if len(content) <= SYNTAX_INLINE_MAX_SIZE:
+                text = render_code(content)
+                highlight_cache.put(digest, text)
+            elif len(content) > SYNTAX_HIGHLIGHT_MAX_SIZE:
+                text = render_code(content, highlight=False)
+                highlight_cache.put(digest, text)
+            else:
+                text = render_code(content, highlight=False)
+                self._highlight_worker(key, content, digest)
+
+        matches = self._matches.get(key)
+        if matches and matches.lines is not None:
+            text = text.copy()
+            for offset, length, line in zip(matches.offsets, matches.lengths, matches.lines, strict=True):
+                for start, end in rendered_spans(content, offset, length, line):
+                    text.stylize(COLOR_SEARCH_MATCH, start, end)
+        self.query_one(f"#view_{key}", Static).update(text)
+
+    @work(thread=True)
+    @limited("highlight")
+    def _highlight_worker(self, key: str, content: str, digest: str) -> None:
+        """
+        Highlight a file in the background and repaint its tab when done.
+
+        Parameters
+        ----------
+        key : str
+            The content cache key, "script" or "job".
+        content : str
+            The file content.
+        digest : str
+            The content digest used as cache key.
+
+        Notes
+        -----
+        This is a background worker.
+        """
+        highlight_cache.put(digest, render_code(content))
+        call_on_main(self.app, self._highlight_ready, key, digest)
+
+    def _highlight_ready(self, key: str, digest: str) -> None:
+        """
+        Repaint a tab once its highlighting is cached, unless its content changed.
+
+        Parameters
+        ----------
+        key : str
+            The content cache key, "script" or "job".
+        digest : str
+            The digest of the highlighted content.
+        """
+        if self._code_digests.get(key) == digest:
+            self._render_code(key)
+
+    def show_diff(self, title: str, old: str, new: str) -> None:
+        """
+        Diff two files in the background and show the result in the Diff tab.
+
+        Parameters
+        ----------
+        title : str
+            Description of the two sides, e.g. "Script → Job".
+        old : str
+            The old content.
+        new : str
+            The new content.
+        """
+        self.active = "tab_diff"
+        self.query_one("#diff_title", Static).update(f"{title}: computing diff...")
+        self._diff_worker(title, old, new)
+
+    @work(thread=True, exclusive=True, group="diff")
+    @limited("diff")
+    def _diff_worker(self, title: str, old: str, new: str) -> None:
+        """
+        Compute a line diff off the main thread.
+
+        Parameters
+        ----------
+        title : str
+            Description of the two sides.
+        old : str
+            The old content.
+        new : str
+            The new content.
+
+        Notes
+        -----
+        This is a background worker.
+        """
+        old_lines = old.splitlines()
+        new_lines = new.splitlines()
+        opcodes = diff_lines(old_lines, new_lines)
+        call_on_main(self.app, self._show_diff_result, title, old_lines, new_lines, opcodes)
+
+    def _show_diff_result(self, title: str, old_lines: list[str], new_lines: list[str], opcodes: list[Any]) -> None:
+        """
+        Display a computed diff.
+
+        Parameters
+        ----------
+        title : str
+            Description of the two sides.
+        old_lines : list[str]
+            The old lines.
+        new_lines : list[str]
+            The new lines.
+        opcodes : list[Any]
+            The diff opcodes.
+        """
+        view = self.query_one("#view_diff", DiffView)
+        view.set_diff(old_lines, new_lines, opcodes)
+        removed = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag in ("replace", "delete"))
+        added = sum(j2 - j1 for tag, _, _, j1, j2 in opcodes if tag in ("replace", "insert"))
+        if not view.hunks:
+            summary = "identical"
+        else:
+            summary = f"{len(view.hunks)} changes, -{removed} +{added} lines ([ and ] to navigate)"
+        self.query_one("#diff_title", Static).update(f"{title}: {summary}")
+
+    def show_timeline(self, path: str, transitions: Sequence[Transition]) -> None:
+        """
+        Show the recorded state transitions of a node and its descendants, newest first.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path of the node.
+        transitions : Sequence[Transition]
+            The transitions, oldest first, e.g. from `TransitionRecorder.for_path`.
+        """
+        self.timeline_path = path
+        table = self.query_one("#view_timeline", DataTable)
+        table.clear()
+        # Time since the previous transition of the same node, i.e. how long it stayed in the old state
+        previous: dict[str, float] = {}
+        rows: list[tuple[Any, ...]] = []
+        for t in transitions:
+            since = previous.get(t.path)
+            previous[t.path] = t.time
+            after = format_duration(t.time - since) if since is not None else ""
+            name = t.path[len(path) :].lstrip("/") or "."
+            rows.append(
+                (
+                    datetime.fromtimestamp(t.time).strftime("%Y-%m-%d %H:%M:%S"),
+                    name,
+                    f"{STATE_MAP.get(t.old, '')} {t.old}",
+                    f"{STATE_MAP.get(t.new, '')} {t.new}",
+                    after,
+                )
+            )
+        shown = rows[::-1][:TIMELINE_MAX_ROWS]
+        table.add_rows(shown)
+        if not rows:
+            title = f"{path}: no state changes observed yet (transitions are recorded on each refresh)"
+        elif len(rows) > len(shown):
+            title = f"{path}: latest {len(shown)} of {len(rows)} state changes"
+        else:
+            title = f"{path}: {len(rows)} state changes"
+        self.query_one("#timeline_title", Static).update(title)
+
+    def show_runtime(self, summary: RuntimeSummary | None, eta: float | None = None, now: float | None = None) -> None:
+        """
+        Show the run time statistics and predicted completion of a node.
+
+        Parameters
+        ----------
+        summary : RuntimeSummary | None
+            The statistics from `RuntimeStats.summary`, or None if unknown.
+        eta : float | None, optional
+            The predicted completion from `RuntimeStats.eta`, by default None.
+        now : float | None, optional
+            The current time, by default `time.time()`.
+        """
+        parts: list[str] = []
+        if summary:
+            parts.append(
+                f"Run time over last {summary.count} runs: mean {format_duration(summary.mean)}, p90 {format_duration(summary.p90)}"
+            )
+        if eta is not None:
+            remaining = eta - (time.time() if now is None else now)
+            when = datetime.fromtimestamp(eta).strftime("%H:%M:%S")
+            if remaining >= 0:
+                parts.append(f"{ICON_ETA} expected to complete at {when} (in {format_duration(remaining)})")
+            else:
+                parts.append(f"{ICON_ETA} expected to complete at {when} (overdue by {format_duration(-remaining)})")
+        self.query_one("#timeline_runtime", Static).update(" | ".join(parts))
+
+    def show_run_history(self, runs: Sequence[Run]) -> None:
+        """
+        Summarize the past run times of a node above its timeline.
+
+        Parameters
+        ----------
+        runs : Sequence[Run]
+            The runs, oldest first, e.g. from `HistoryStore.runs`.
+        """
+        widget = self.query_one("#timeline_runs", Static)
+        if not runs:
+            widget.update("")
+            return
+        durations = [run.duration for run in runs]
+        aborted = sum(1 for run in runs if run.state == "aborted")
+        summary = (
+            f"Last {len(runs)} runs: mean {format_duration(sum(durations) / len(durations))}, "
+            f"min {format_duration(min(durations))}, max {format_duration(max(durations))}, "
+            f"latest {format_duration(durations[-1])}"
+        )
+        if aborted:
+            summary += f", {aborted} aborted"
+        widget.update(summary)
+
+    def show_details(self, details: NodeDetails | None) -> bool:
+        """
+        Show the attributes of a node in the Details tab.
+
+        Parameters
+        ----------
+        details : NodeDetails | None
+            The attributes from `ectop.nodes.node_details`, or None if the node is unknown.
+
+        Returns
+        -------
+        bool
+            Whether the tab was repainted; it is not when the details are unchanged.
+        """
+        if details == self.details:
+            return False
+        self.details = details
+        widget = self.query_one("#view_details", Static)
+        if details is None:
+            widget.update("Node not found in the synchronized definitions.")
+            return True
+
+        text = Text()
+        text.append(details.path, style="bold")
+        text.append(f"  {details.kind}, {STATE_MAP.get(details.state, ICON_UNKNOWN_STATE)} {details.state}\n")
+
+        def section(title: str) -> None:
+            text.append(f"\n{title}\n", style="bold underline")
+
+        if details.events:
+            section("Events")
+            for name, value in details.events:
+                text.append(f"  {'●' if value else '○'} {name}", style="bold" if value else "")
+                text.append(f"  {'set' if value else 'clear'}\n")
+        if details.meters:
+            section("Meters")
+            width = max(len(name) for name, *_ in details.meters)
+            for name, minimum, maximum, value in details.meters:
+                span = maximum - minimum
+                fraction = min(1.0, max(0.0, (value - minimum) / span)) if span > 0 else 1.0
+                filled = round(fraction * METER_BAR_WIDTH)
+                text.append(f"  {name:<{width}} ")
+                text.append("█" * filled, style=COLOR_METER_BAR)
+                text.append("░" * (METER_BAR_WIDTH - filled), style="dim")
+                text.append(f" {value} / {maximum}\n")
+        if details.labels:
+            section("Labels")
+            for name, value in details.labels:
+                text.append(f"  {name}: {value}\n")
+        if details.repeat:
+            section("Repeat")
+            name, value, start, end, step = details.repeat
+            text.append(f"  {name} = {value}  ({start} .. {end}, step {step})\n")
+        if details.limits:
+            section("Limits")
+            for name, used, maximum in details.limits:
+                text.append(f"  {name}  {used} / {maximum}\n")
+        if details.inlimits:
+            section("In limits")
+            for name, path, tokens in details.inlimits:
+                text.append(f"  {path}:{name}  {tokens} token{'s' if tokens != 1 else ''}\n")
+        if details.late:
+            section("Late")
+            text.append(f"  {details.late}")
+            text.append("  late!\n" if details.is_late else "\n", style=COLOR_LATE if details.is_late else "")
+        if details.flags:
+            section("Flags")
+            text.append(f"  {details.flags}\n")
+        widget.update(text)
+        return True
 
     def action_search(self) -> None:
         """
@@ -164,11 +559,57 @@ class MainContent(Vertical):
             # Refocus the active tab's content
             active_tab = self.active
             if active_tab == "tab_output":
-                self.query_one("#log_output").focus()
+                self.query_one("#log_large" if self.large_log else "#log_output").focus()
+
+    def action_jump(self) -> None:
+        """
+        Toggle the jump input of the Output tab.
+
+        Returns
+        -------
+        None
+        """
+        self.active = "tab_output"
+        jump_input = self.query_one("#log_jump", Input)
+        if "hidden" in jump_input.classes:
+            jump_input.remove_class("hidden")
+            jump_input.focus()
+        else:
+            jump_input.add_class("hidden")
+
+    def jump_log(self, target: str) -> None:
+        """
+        Scroll the Output tab to a line, a percentage or the end.
+
+        Parameters
+        ----------
+        target : str
+            A one-based line number, a percentage such as "50%", or "end".
+        """
+        target = target.strip().lower()
+        if self.large_log:
+            view = self.query_one("#log_large", LargeLogView)
+            if target in ("end", "$"):
+                view.action_jump_end()
+            elif target.endswith("%"):
+                view.jump_to_percent(float(target[:-1]))
+            else:
+                view.jump_to_line(int(target) - 1)
+            view.focus()
+            return
+
+        log = self.query_one("#log_output", RichLog)
+        if target in ("end", "$"):
+            log.scroll_end(animate=False)
+        elif target.endswith("%"):
+            log.scroll_to(y=int(log.max_scroll_y * float(target[:-1]) / 100), animate=False)
+        else:
+            log.scroll_to(y=int(target) - 1, animate=False)
+        log.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """
-        Handle content search submission.
+        Handle content search and jump submissions.
 
         Parameters
         ----------
@@ -179,21 +620,180 @@ class MainContent(Vertical):
         -------
         None
         """
+        if event.input.id == "log_jump":
+            event.input.add_class("hidden")
+            try:
+                self.jump_log(event.value)
+            except ValueError:
+                self.app.notify(f"Invalid jump target '{event.value}'", severity="warning")
+            event.input.value = ""
+            return
+
         if event.input.id == "content_search":
             query = event.value
             if not query:
                 return
+            key = self._active_key()
+            current = self._matches.get(key)
+            if current and current.query == query:
+                # Submitting the same query again moves to the next match
+                self.action_next_match()
+            else:
+                self.search(query)
+
+    def _active_key(self) -> str:
+        """
+        Get the content cache key of the active tab.
 
-            active_tab = self.active
-            cache_key = "output"
-            if active_tab == "tab_script":
-                cache_key = "script"
-            elif active_tab == "tab_job":
-                cache_key = "job"
+        Returns
+        -------
+        str
+            "output", "script" or "job".
+        """
+        return TAB_CONTENT_KEYS.get(self.active or "", "output")
+
+    def search(self, query: str) -> None:
+        """
+        Search the content of the active tab and highlight the matches.
 
-            content = self._content_cache.get(cache_key, "")
-            matches = content.lower().count(query.lower())
-            self.app.notify(f"Found {matches} matches for '{query}' in {cache_key}")
+        Parameters
+        ----------
+        query : str
+            The query, matched case-insensitively. Prefix it with "re:" to
+            use a regular expression.
+        """
+        key = self._active_key()
+        large = key == "output" and self.large_log
+        try:
+            pattern = compile_query(query, binary=large)
+        except ValueError as e:
+            self.app.notify(str(e), severity="warning")
+            return
+        if large:
+            self._search_worker(key, query, pattern, self.query_one("#log_large", LargeLogView).index)
+        else:
+            self._search_worker(key, query, pattern, self._content_cache.get(key, ""))
+
+    @work(thread=True, exclusive=True, group="content_search")
+    @limited("search")
+    def _search_worker(self, key: str, query: str, pattern: re.Pattern, source: Any) -> None:
+        """
+        Collect all match offsets in one streaming pass.
+
+        Parameters
+        ----------
+        key : str
+            The content cache key being searched.
+        query : str
+            The original query.
+        pattern : re.Pattern
+            The compiled query; a bytes pattern for the large log viewer.
+        source : Any
+            The content string, or the `LineIndex` of the large log viewer.
+
+        Notes
+        -----
+        This is a background worker. Large logs are scanned over a memory
+        mapping, so the log is never copied or lowercased in memory.
+        """
+        try:
+            if isinstance(source, str):
+                matches = MatchSet.collect(query, pattern.finditer(source), text=source)
+            elif source is not None:
+                matches = MatchSet.collect(query, source.finditer(pattern))
+            else:
+                return
+        except (OSError, ValueError) as e:
+            call_on_main(self.app, self.app.notify, f"Search failed: {e}", severity="error")
+            return
+        call_on_main(self.app, self._show_matches, key, matches, source)
+
+    def _show_matches(self, key: str, matches: MatchSet, source: Any) -> None:
+        """
+        Store the results of a search, highlight them and select the first match.
+
+        Parameters
+        ----------
+        key : str
+            The content cache key that was searched.
+        matches : MatchSet
+            The collected matches.
+        source : Any
+            The searched content, used to discard results for replaced content.
+        """
+        if key == "output" and self.large_log:
+            if source is not self.query_one("#log_large", LargeLogView).index:
+                return
+        elif source is not self._content_cache.get(key, ""):
+            return
+
+        self._matches[key] = matches
+        matches.select(0)
+        if key == "output" and not self.large_log:
+            content = self._content_cache.get(key, "")
+            text = Text(content)
+            for offset, length in zip(matches.offsets, matches.lengths, strict=True):
+                text.stylize(COLOR_SEARCH_MATCH, offset, offset + length)
+            log = self.query_one("#log_output", RichLog)
+            log.clear()
+            log.write(text)
+        elif key in ("script", "job"):
+            self._render_code(key)
+        self._goto_match(key)
+
+    def _goto_match(self, key: str) -> None:
+        """
+        Scroll to the selected match of a tab and report its position.
+
+        Parameters
+        ----------
+        key : str
+            The content cache key.
+        """
+        matches = self._matches.get(key)
+        if matches is None:
+            return
+        if key == "output" and self.large_log:
+            self.query_one("#log_large", LargeLogView).highlight(matches)
+        elif matches.current >= 0 and matches.lines is not None:
+            line = matches.lines[matches.current]
+            if key == "output":
+                self.query_one("#log_output", RichLog).scroll_to(y=line, animate=False)
+            else:
+                scroll = self.query_one(f"#view_{key}", Static).parent
+                if isinstance(scroll, VerticalScroll):
+                    scroll.scroll_to(y=line, animate=False)
+        self.app.notify(f"{matches.status()} in {key}")
+
+    def action_next_match(self) -> None:
+        """
+        Jump to the next search match in the active tab.
+
+        Returns
+        -------
+        None
+        """
+        key = self._active_key()
+        if key not in self._matches:
+            self.app.notify("No search results, press Ctrl+F to search", severity="warning")
+            return
+        self._matches[key].next()
+        self._goto_match(key)
+
+    def action_previous_match(self) -> None:
+        """
+        Jump to the previous search match in the active tab.
+
+        Returns
+        -------
+        None
+        """
+        key = self._active_key()
+        if key not in self._matches:
+            self.app.notify("No search results, press Ctrl+F to search", severity="warning")
+            return
+        self._matches[key].previous()
+        self._goto_match(key)
 
     def show_error(self, widget_id: str, message: str) -> None:
         """
@@ -206,6 +806,8 @@ class MainContent(Vertical):
         message : str
             The error message to display.
         """
+        if widget_id == "#log_output":
+            self._set_large_log(False)
         widget = self.query_one(widget_id)
         if isinstance(widget, RichLog):
             widget.write(f"[italic red]{message}[/]")
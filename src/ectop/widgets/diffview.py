@@ -0,0 +1,192 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Virtualized viewer for line diffs.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import Any
+
+from rich.text import Text
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from ectop.constants import COLOR_DIFF_DELETE, COLOR_DIFF_FOLD, COLOR_DIFF_INSERT, DIFF_CONTEXT_LINES
+from ectop.diff import Opcode
+
+ROW_EQUAL = " "
+ROW_DELETE = "-"
+ROW_INSERT = "+"
+ROW_FOLD = "~"
+
+
+class DiffView(ScrollView, can_focus=True):
+    """
+    A unified diff view that renders only the visible rows.
+
+    The opcodes are turned into a compact plan of row blocks, one per run of
+    equal, removed, added or folded lines. Rendering a row bisects the plan,
+    so the cost of a repaint does not depend on the size of the files.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    hunks : list[int]
+        The first row of each change, for hunk navigation.
+    """
+
+    BINDINGS = [
+        Binding("]", "next_hunk", "Next Change"),
+        Binding("[", "previous_hunk", "Previous Change"),
+    ]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the DiffView.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments for ScrollView.
+        **kwargs : Any
+            Keyword arguments for ScrollView.
+        """
+        super().__init__(*args, **kwargs)
+        self.hunks: list[int] = []
+        self._old: Sequence[str] = ()
+        self._new: Sequence[str] = ()
+        self._row_starts: list[int] = []
+        self._blocks: list[tuple[str, int, int, int]] = []
+        self._rows: int = 0
+        self._number_width: int = 1
+
+    def set_diff(self, old: Sequence[str], new: Sequence[str], opcodes: list[Opcode], context: int = DIFF_CONTEXT_LINES) -> None:
+        """
+        Show a diff.
+
+        Parameters
+        ----------
+        old : Sequence[str]
+            The old lines.
+        new : Sequence[str]
+            The new lines.
+        opcodes : list[Opcode]
+            The opcodes from `ectop.diff.diff_lines`.
+        context : int, optional
+            Unchanged lines kept around each change, by default DIFF_CONTEXT_LINES.
+        """
+        self._old, self._new = old, new
+        self._row_starts, self._blocks, self.hunks = [], [], []
+        self._rows = 0
+        self._number_width = len(str(max(len(old), len(new), 1)))
+
+        def add(kind: str, i: int, j: int, count: int) -> None:
+            if count > 0:
+                self._row_starts.append(self._rows)
+                self._blocks.append((kind, i, j, count))
+                self._rows += count if kind != ROW_FOLD else 1
+
+        last = len(opcodes) - 1
+        for n, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+            if tag == "equal":
+                head = 0 if n == 0 else context
+                tail = 0 if n == last else context
+                if i2 - i1 <= head + tail + 1:
+                    add(ROW_EQUAL, i1, j1, i2 - i1)
+                    continue
+                add(ROW_EQUAL, i1, j1, head)
+                add(ROW_FOLD, i1 + head, j1 + head, i2 - i1 - head - tail)
+                add(ROW_EQUAL, i2 - tail, j2 - tail, tail)
+                continue
+            self.hunks.append(self._rows)
+            add(ROW_DELETE, i1, j1, i2 - i1)
+            add(ROW_INSERT, i2, j1, j2 - j1)
+
+        width = max((len(line) for line in (*old[:1000], *new[:1000])), default=0)
+        self.virtual_size = Size(width + 2 * self._number_width + 5, self._rows)
+        self.scroll_to(0, 0, animate=False)
+        self.refresh()
+
+    @property
+    def row_count(self) -> int:
+        """
+        Number of rows of the diff.
+
+        Returns
+        -------
+        int
+            The row count, with folded regions counting as one row.
+        """
+        return self._rows
+
+    def row_text(self, row: int) -> Text:
+        """
+        Build the text of one diff row.
+
+        Parameters
+        ----------
+        row : int
+            The row number.
+
+        Returns
+        -------
+        Text
+            The styled row with old and new line numbers.
+        """
+        if row < 0 or row >= self._rows:
+            return Text()
+        block = bisect_right(self._row_starts, row) - 1
+        kind, i, j, count = self._blocks[block]
+        offset = row - self._row_starts[block]
+        w = self._number_width
+        if kind == ROW_FOLD:
+            return Text(f"{'':>{w}} {'':>{w}} ⋯ {count} unchanged lines", style=COLOR_DIFF_FOLD)
+        if kind == ROW_DELETE:
+            return Text(f"{i + offset + 1:>{w}} {'':>{w}} - {self._old[i + offset]}", style=COLOR_DIFF_DELETE)
+        if kind == ROW_INSERT:
+            return Text(f"{'':>{w}} {j + offset + 1:>{w}} + {self._new[j + offset]}", style=COLOR_DIFF_INSERT)
+        return Text(f"{i + offset + 1:>{w}} {j + offset + 1:>{w}}   {self._old[i + offset]}")
+
+    def render_line(self, y: int) -> Strip:
+        """
+        Render one visible row.
+
+        Parameters
+        ----------
+        y : int
+            The row within the widget.
+
+        Returns
+        -------
+        Strip
+            The rendered, horizontally cropped row.
+        """
+        scroll_x, scroll_y = self.scroll_offset
+        text = self.row_text(scroll_y + y)
+        text.expand_tabs(8)
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        return strip.crop_extend(scroll_x, scroll_x + self.size.width, self.rich_style)
+
+    def action_next_hunk(self) -> None:
+        """Scroll to the next change."""
+        idx = bisect_right(self.hunks, self.scroll_offset.y)
+        if idx < len(self.hunks):
+            self.scroll_to(y=self.hunks[idx], animate=False)
+
+    def action_previous_hunk(self) -> None:
+        """Scroll to the previous change."""
+        idx = bisect_left(self.hunks, self.scroll_offset.y) - 1
+        if idx >= 0:
+            self.scroll_to(y=self.hunks[idx], animate=False)
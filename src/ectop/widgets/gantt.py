@@ -0,0 +1,191 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Virtualized Gantt chart of task execution phases.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from ectop.constants import (
+    COLOR_GANTT_ABORTED,
+    COLOR_GANTT_ACTIVE,
+    COLOR_GANTT_COMPLETE,
+    COLOR_GANTT_QUEUED,
+    COLOR_GANTT_SUBMITTED,
+    GANTT_LABEL_WIDTH,
+)
+from ectop.gantt import Bar
+
+BLOCK_QUEUED = "░"
+BLOCK_SUBMITTED = "▒"
+BLOCK_RUN = "█"
+
+
+class GanttView(ScrollView, can_focus=True):
+    """
+    A Gantt chart that renders only the visible rows.
+
+    Each row shows a task or group name followed by its queue wait,
+    submission lag and run time on a time axis fitted to the widget width.
+    Rendering a row only maps the bar's few timestamps to columns, so the
+    cost of a repaint does not depend on the number of rows.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    bars : Sequence[Bar]
+        The rows of the chart.
+    start : float
+        Time at the left edge of the chart.
+    end : float
+        Time at the right edge of the chart.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the GanttView.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments for ScrollView.
+        **kwargs : Any
+            Keyword arguments for ScrollView.
+        """
+        super().__init__(*args, **kwargs)
+        self.bars: Sequence[Bar] = ()
+        self.start: float = 0.0
+        self.end: float = 0.0
+        self._root: str = "/"
+        self._now: float = 0.0
+
+    def set_bars(self, bars: Sequence[Bar], root: str, now: float | None = None) -> None:
+        """
+        Show a chart.
+
+        Parameters
+        ----------
+        bars : Sequence[Bar]
+            The rows, from `ectop.gantt.task_bars` or `ectop.gantt.aggregate`.
+        root : str
+            The family path, stripped from row names.
+        now : float | None, optional
+            The end of running phases, by default the current time.
+        """
+        self.bars = bars
+        self._root = root.rstrip("/")
+        self._now = time.time() if now is None else now
+        self.start = min((bar.start for bar in bars), default=self._now)
+        self.end = max((bar.end if bar.end is not None else self._now for bar in bars), default=self._now)
+        self.virtual_size = Size(0, len(bars))
+        self.scroll_to(0, 0, animate=False)
+        self.refresh()
+
+    def _phases(self, bar: Bar) -> list[tuple[float, float, str, str]]:
+        """
+        Get the drawable phases of a bar.
+
+        Parameters
+        ----------
+        bar : Bar
+            The row.
+
+        Returns
+        -------
+        list[tuple[float, float, str, str]]
+            Start, end, block character and style of each known phase.
+        """
+        running = self._now if bar.end is None else bar.end
+        run_style = {"complete": COLOR_GANTT_COMPLETE, "aborted": COLOR_GANTT_ABORTED}.get(bar.state, COLOR_GANTT_ACTIVE)
+        phases: list[tuple[float, float, str, str]] = []
+        if bar.queued is not None:
+            until = bar.submitted or bar.active or running
+            phases.append((bar.queued, until, BLOCK_QUEUED, COLOR_GANTT_QUEUED))
+        if bar.submitted is not None:
+            phases.append((bar.submitted, bar.active or running, BLOCK_SUBMITTED, COLOR_GANTT_SUBMITTED))
+        if bar.active is not None:
+            phases.append((bar.active, running, BLOCK_RUN, run_style))
+        return phases
+
+    def row_segments(self, row: int, width: int) -> list[Segment]:
+        """
+        Build the segments of one row.
+
+        Parameters
+        ----------
+        row : int
+            The row number.
+        width : int
+            The width in cells available for the row.
+
+        Returns
+        -------
+        list[Segment]
+            The name column followed by the bar.
+        """
+        if row < 0 or row >= len(self.bars):
+            return []
+        bar = self.bars[row]
+        name = bar.path[len(self._root) :].lstrip("/") or bar.path.rsplit("/", 1)[-1]
+        if bar.count > 1:
+            name = f"{name}/ ({bar.count})"
+        label = name[-(GANTT_LABEL_WIDTH - 1) :].ljust(GANTT_LABEL_WIDTH)
+        segments = [Segment(label, self.rich_style)]
+
+        columns = max(width - GANTT_LABEL_WIDTH, 1)
+        span = max(self.end - self.start, 1e-9)
+        cells: list[tuple[str, str] | None] = [None] * columns
+        for begin, finish, block, style in self._phases(bar):
+            first = min(int((begin - self.start) / span * columns), columns - 1)
+            last = max(min(int((finish - self.start) / span * columns), columns), first + 1)
+            for col in range(first, last):
+                cells[col] = (block, style)
+
+        # Merge runs of equal cells into one segment each
+        col = 0
+        while col < columns:
+            cell = cells[col]
+            stop = col + 1
+            while stop < columns and cells[stop] == cell:
+                stop += 1
+            if cell is None:
+                segments.append(Segment(" " * (stop - col), self.rich_style))
+            else:
+                segments.append(Segment(cell[0] * (stop - col), self.rich_style + Style.parse(cell[1])))
+            col = stop
+        return segments
+
+    def render_line(self, y: int) -> Strip:
+        """
+        Render one visible row.
+
+        Parameters
+        ----------
+        y : int
+            The row within the widget.
+
+        Returns
+        -------
+        Strip
+            The rendered row.
+        """
+        width = self.size.width
+        segments = self.row_segments(self.scroll_offset.y + y, width)
+        return Strip(segments).crop_extend(0, width, self.rich_style)
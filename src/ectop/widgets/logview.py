@@ -0,0 +1,540 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Windowed viewer for very large log files.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+from rich.text import Text
+from textual import work
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from ectop.constants import COLOR_SEARCH_CURRENT, COLOR_SEARCH_MATCH, LOG_INDEX_CHUNK_SIZE
+from ectop.textsearch import MatchSet
+from ectop.workers import call_on_main, limited
+
+
+class LineIndex:
+    """
+    Line start offsets of a memory-mapped file, built incrementally.
+
+    Offsets are kept in a compact ``array('Q')`` so the index of a file with
+    millions of lines costs a few tens of megabytes at most. Only complete
+    lines are reported while indexing is in progress.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    path : str
+        The indexed file.
+    max_line_length : int
+        Length in bytes of the longest line indexed so far.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the LineIndex.
+
+        Parameters
+        ----------
+        path : str
+            The file to index.
+        """
+        self.path: str = path
+        self.max_line_length: int = 0
+        self._offsets: array[int] = array("Q", [0])
+        self._indexed_to: int = 0
+        self._size: int = 0
+        self._mm: mmap.mmap | None = None
+        self._lock = threading.Lock()
+        self.remap()
+
+    def remap(self) -> None:
+        """Map the file again, picking up data appended since the last mapping."""
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+            self._size = os.path.getsize(self.path)
+            if self._size:
+                with open(self.path, "rb") as f:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def build(self, chunk_size: int = LOG_INDEX_CHUNK_SIZE) -> bool:
+        """
+        Index the next chunk of unindexed data.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of bytes to scan, by default LOG_INDEX_CHUNK_SIZE.
+
+        Returns
+        -------
+        bool
+            True if more data remains to be indexed.
+        """
+        with self._lock:
+            if self._mm is None or self._indexed_to >= self._size:
+                return False
+            end = min(self._indexed_to + chunk_size, self._size)
+            data = self._mm[self._indexed_to : end]
+            base = self._indexed_to
+
+        offsets = self._offsets
+        pos = data.find(b"\n")
+        while pos != -1:
+            start = base + pos + 1
+            self.max_line_length = max(self.max_line_length, start - offsets[-1] - 1)
+            offsets.append(start)
+            pos = data.find(b"\n", pos + 1)
+        self._indexed_to = end
+        return end < self._size
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether the whole mapped file has been indexed.
+
+        Returns
+        -------
+        bool
+            True if indexing has reached the end of the file.
+        """
+        return self._indexed_to >= self._size
+
+    @property
+    def indexed_bytes(self) -> int:
+        """
+        Number of bytes scanned so far.
+
+        Returns
+        -------
+        int
+            The indexing progress in bytes.
+        """
+        return self._indexed_to
+
+    @property
+    def line_count(self) -> int:
+        """
+        Number of lines available for display.
+
+        Returns
+        -------
+        int
+            The number of indexed lines, including a final unterminated line once indexing is complete.
+        """
+        count = len(self._offsets) - 1
+        if self.complete and self._offsets[-1] < self._size:
+            count += 1
+        return count
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the mapped file in bytes.
+
+        Returns
+        -------
+        int
+            The file size.
+        """
+        return self._size
+
+    def line(self, number: int) -> str:
+        """
+        Read a single line.
+
+        Parameters
+        ----------
+        number : int
+            Zero-based line number.
+
+        Returns
+        -------
+        str
+            The decoded line without its terminator, or "" if out of range.
+        """
+        return self.line_bytes(number).decode("utf-8", errors="replace").rstrip("\r")
+
+    def line_span(self, number: int) -> tuple[int, int]:
+        """
+        Get the byte range of a line, excluding its newline.
+
+        Parameters
+        ----------
+        number : int
+            Zero-based line number.
+
+        Returns
+        -------
+        tuple[int, int]
+            The start and end offsets, or (0, 0) if out of range.
+        """
+        if number < 0 or number >= self.line_count:
+            return 0, 0
+        start = self._offsets[number]
+        end = self._offsets[number + 1] - 1 if number + 1 < len(self._offsets) else self._size
+        return start, end
+
+    def line_bytes(self, number: int) -> bytes:
+        """
+        Read the raw bytes of a single line.
+
+        Parameters
+        ----------
+        number : int
+            Zero-based line number.
+
+        Returns
+        -------
+        bytes
+            The line without its newline, or b"" if out of range.
+        """
+        start, end = self.line_span(number)
+        with self._lock:
+            if self._mm is None or start == end:
+                return b""
+            return self._mm[start:end]
+
+    def finditer(self, pattern: re.Pattern) -> Iterator[re.Match]:
+        """
+        Scan the whole file for a bytes pattern without copying it into memory.
+
+        The scan uses its own mapping, so it can run in a worker while the
+        index is remapped for appended data.
+
+        Parameters
+        ----------
+        pattern : re.Pattern
+            A compiled bytes pattern.
+
+        Yields
+        ------
+        re.Match
+            The matches in file order.
+        """
+        if not os.path.getsize(self.path):
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from pattern.finditer(mm)
+
+    def line_at(self, offset: int) -> int:
+        """
+        Find the line containing a byte offset.
+
+        Parameters
+        ----------
+        offset : int
+            A byte offset into the file.
+
+        Returns
+        -------
+        int
+            The zero-based line number.
+        """
+        return max(0, bisect_right(self._offsets, offset) - 1)
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+
+
+class LargeLogView(ScrollView, can_focus=True):
+    """
+    A log viewer that renders only the visible window of a spooled file.
+
+    The content is written to a temporary file, memory-mapped, and indexed in
+    a background worker, so the UI thread never handles the whole log. Lines
+    become scrollable as soon as they are indexed.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    index : LineIndex | None
+        The line index of the spooled file.
+    matches : MatchSet | None
+        Content search matches (byte offsets) to highlight.
+    """
+
+    BINDINGS = [
+        Binding("g", "jump_start", "Top"),
+        Binding("G", "jump_end", "Bottom"),
+    ]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the LargeLogView.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments for ScrollView.
+        **kwargs : Any
+            Keyword arguments for ScrollView.
+        """
+        super().__init__(*args, **kwargs)
+        self.index: LineIndex | None = None
+        self.matches: MatchSet | None = None
+        self._spool_path: str | None = None
+        self._pending_offset: int | None = None
+        self._loaded: bool = False
+        self._generation: int = 0
+        self._writes: deque[tuple[int, str]] = deque()
+        self._spool_lock = threading.Lock()
+        self._target: tuple[int, str, LineIndex] | None = None
+
+    def load(self, content: str) -> None:
+        """
+        Replace the content, spooling and indexing it in the background.
+
+        Parameters
+        ----------
+        content : str
+            The full log content.
+        """
+        self._release()
+        self._loaded = True
+        self.virtual_size = Size(0, 0)
+        self.scroll_to(0, 0, animate=False)
+        self._writes.append((self._generation, content))
+        self._spool_worker()
+
+    def append(self, content: str) -> None:
+        """
+        Append new content to the spooled file and index it in the background.
+
+        Parameters
+        ----------
+        content : str
+            The text to append.
+        """
+        if not self._loaded:
+            self.load(content)
+            return
+        self._writes.append((self._generation, content))
+        self._spool_worker()
+
+    @work(thread=True)
+    @limited("index")
+    def _spool_worker(self) -> None:
+        """
+        Write the queued content to the spool file and index it.
+
+        Notes
+        -----
+        This is a background worker, so the UI thread never encodes or writes
+        the whole log. Queued writes are applied in order; those of a log that
+        has been replaced meanwhile are discarded. The virtual size is updated
+        on the main thread after every chunk so the visible window can be drawn
+        early.
+        """
+        with self._spool_lock:
+            while self._writes:
+                generation, content = self._writes.popleft()
+                if generation != self._generation:
+                    continue
+                data = content.encode("utf-8", errors="replace")
+                try:
+                    if self._target is not None and self._target[0] == generation:
+                        _, path, index = self._target
+                        with open(path, "ab") as f:
+                            f.write(data)
+                        index.remap()
+                    else:
+                        with tempfile.NamedTemporaryFile(prefix="ectop-log-", suffix=".log", delete=False) as f:
+                            f.write(data)
+                        index = LineIndex(f.name)
+                        self._target = (generation, f.name, index)
+                        call_on_main(self.app, self._show_spool, generation, f.name, index)
+                except OSError:
+                    # The spool file of a replaced log was already deleted
+                    if generation == self._generation:
+                        raise
+            target = self._target
+
+        if target is None:
+            return
+        index = target[2]
+        while index.build():
+            if index is not self.index:
+                return
+            call_on_main(self.app, self._update_extent)
+        call_on_main(self.app, self._update_extent)
+
+    def _show_spool(self, generation: int, path: str, index: LineIndex) -> None:
+        """Show a freshly spooled file, or delete it if the log was replaced meanwhile."""
+        if generation != self._generation:
+            index.close()
+            os.unlink(path)
+            return
+        self.index = index
+        self._spool_path = path
+
+    def _update_extent(self) -> None:
+        """Update the scrollable area from the index and honour a pending jump."""
+        if not self.index:
+            return
+        self.virtual_size = Size(self.index.max_line_length, self.index.line_count)
+        if self._pending_offset is not None:
+            self.jump_to_offset(self._pending_offset)
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        """
+        Render one visible line.
+
+        Parameters
+        ----------
+        y : int
+            The row within the widget.
+
+        Returns
+        -------
+        Strip
+            The rendered, horizontally cropped line.
+        """
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        text = self._line_text(scroll_y + y) if self.index else Text()
+        text.expand_tabs(8)
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+
+    def _line_text(self, number: int) -> Text:
+        """
+        Decode a line and highlight the search matches it contains.
+
+        Parameters
+        ----------
+        number : int
+            Zero-based line number.
+
+        Returns
+        -------
+        Text
+            The styled line.
+        """
+        assert self.index is not None
+        raw = self.index.line_bytes(number)
+        text = Text(raw.decode("utf-8", errors="replace").rstrip("\r"), style=self.rich_style)
+        if self.matches and raw:
+            start, end = self.index.line_span(number)
+            for offset, length, current in self.matches.in_range(start, end):
+                # Convert byte offsets within the line to character offsets
+                col = len(raw[: offset - start].decode("utf-8", errors="replace"))
+                stop = len(raw[: offset - start + length].decode("utf-8", errors="replace"))
+                text.stylize(COLOR_SEARCH_CURRENT if current else COLOR_SEARCH_MATCH, col, stop)
+        return text
+
+    def highlight(self, matches: MatchSet | None) -> None:
+        """
+        Highlight search matches and scroll to the selected one.
+
+        Parameters
+        ----------
+        matches : MatchSet | None
+            Matches with byte offsets into the spooled file, or None to clear.
+        """
+        self.matches = matches
+        if matches and matches.current >= 0:
+            self.jump_to_offset(matches.offsets[matches.current])
+        self.refresh()
+
+    def jump_to_line(self, line: int) -> None:
+        """
+        Scroll so that a line is at the top of the view.
+
+        Parameters
+        ----------
+        line : int
+            Zero-based line number, clamped to the lines indexed so far.
+        """
+        if not self.index:
+            return
+        self.scroll_to(y=max(0, min(line, self.index.line_count - 1)), animate=False)
+
+    def jump_to_offset(self, offset: int) -> None:
+        """
+        Scroll to the line containing a byte offset.
+
+        Parameters
+        ----------
+        offset : int
+            Byte offset into the file. If it has not been indexed yet, the
+            jump is deferred until indexing reaches it.
+        """
+        if not self.index:
+            return
+        if offset >= self.index.indexed_bytes and not self.index.complete:
+            self._pending_offset = offset
+            return
+        self._pending_offset = None
+        self.jump_to_line(self.index.line_at(offset))
+
+    def jump_to_percent(self, percent: float) -> None:
+        """
+        Scroll to a relative position in the file.
+
+        Parameters
+        ----------
+        percent : float
+            Position between 0 and 100, measured in bytes so it works before indexing completes.
+        """
+        if not self.index:
+            return
+        self.jump_to_offset(int(self.index.size * max(0.0, min(percent, 100.0)) / 100))
+
+    def action_jump_start(self) -> None:
+        """Scroll to the first line."""
+        self.jump_to_line(0)
+
+    def action_jump_end(self) -> None:
+        """Scroll to the last line, once it has been indexed."""
+        if self.index:
+            self.jump_to_offset(self.index.size)
+
+    def _release(self) -> None:
+        """Close the index, delete the spool file and discard pending writes."""
+        self._generation += 1
+        self._loaded = False
+        if self.index:
+            self.index.close()
+            self.index = None
+        if self._spool_path and os.path.exists(self._spool_path):
+            os.unlink(self._spool_path)
+        self._spool_path = None
+        self._pending_offset = None
+        self.matches = None
+
+    def on_unmount(self) -> None:
+        """Release the spool file when the widget is removed."""
+        self._release()
@@ -0,0 +1,164 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Modal screen showing a Gantt chart of a family's last cycle.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+from ectop.constants import (
+    COLOR_GANTT_ABORTED,
+    COLOR_GANTT_ACTIVE,
+    COLOR_GANTT_COMPLETE,
+    COLOR_GANTT_QUEUED,
+    COLOR_GANTT_SUBMITTED,
+)
+from ectop.gantt import aggregate, depth_of, task_bars
+from ectop.transitions import Transition, format_duration
+from ectop.widgets.gantt import BLOCK_QUEUED, BLOCK_RUN, BLOCK_SUBMITTED, GanttView
+
+
+class GanttScreen(ModalScreen[None]):
+    """
+    A modal screen charting the queue wait, submission lag and run time of a family's tasks.
+
+    The chart starts with one row per task. Zooming out merges the tasks
+    into one row per sub-family, one level at a time, until only the
+    family's direct children are left.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    path : str
+        The charted family.
+    depth : int
+        Number of path levels shown below the family.
+    max_depth : int
+        The depth at which every task has its own row.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close"),
+        Binding("T", "close", "Close"),
+        Binding("minus", "zoom_out", "Zoom Out"),
+        Binding("plus,equals_sign", "zoom_in", "Zoom In"),
+    ]
+
+    def __init__(self, path: str, transitions: Sequence[Transition]) -> None:
+        """
+        Initialize the GanttScreen.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path of the family.
+        transitions : Sequence[Transition]
+            The transitions of the family and its descendants, oldest first.
+        """
+        super().__init__()
+        self.path: str = path
+        self._tasks = task_bars(transitions, path)
+        self.max_depth: int = depth_of(self._tasks, path)
+        self.depth: int = self.max_depth
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the modal UI.
+
+        Returns
+        -------
+        ComposeResult
+            The UI components for the modal.
+        """
+        legend = Text.assemble(
+            (BLOCK_QUEUED * 2, COLOR_GANTT_QUEUED),
+            " queue wait  ",
+            (BLOCK_SUBMITTED * 2, COLOR_GANTT_SUBMITTED),
+            " submission lag  ",
+            (BLOCK_RUN * 2, COLOR_GANTT_ACTIVE),
+            " running  ",
+            (BLOCK_RUN * 2, COLOR_GANTT_COMPLETE),
+            " complete  ",
+            (BLOCK_RUN * 2, COLOR_GANTT_ABORTED),
+            " aborted    - / + zoom out / in",
+        )
+        with Vertical(id="gantt_container"):
+            yield Static("", id="gantt_title")
+            yield GanttView(id="gantt_view")
+            yield Static(legend, id="gantt_legend")
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to draw the chart.
+
+        Returns
+        -------
+        None
+        """
+        self._show()
+        self.query_one("#gantt_view", GanttView).focus()
+
+    def _show(self) -> None:
+        """Draw the chart at the current zoom level."""
+        view = self.query_one("#gantt_view", GanttView)
+        title = self.query_one("#gantt_title", Static)
+        if not self._tasks:
+            view.set_bars([], self.path)
+            title.update(f"{self.path}: no task state changes observed yet (transitions are recorded on each refresh)")
+            return
+        bars = self._tasks if self.depth >= self.max_depth else aggregate(self._tasks, self.path, self.depth)
+        view.set_bars(bars, self.path)
+        span = f"{datetime.fromtimestamp(view.start):%H:%M:%S} → {datetime.fromtimestamp(view.end):%H:%M:%S}"
+        grouping = "" if bars is self._tasks else f" in {len(bars)} groups (level {self.depth} of {self.max_depth})"
+        title.update(f"{self.path}: {len(self._tasks)} tasks{grouping}, {span} ({format_duration(view.end - view.start)})")
+
+    def action_zoom_out(self) -> None:
+        """
+        Merge rows into their parent families.
+
+        Returns
+        -------
+        None
+        """
+        if self.depth > 1:
+            self.depth -= 1
+            self._show()
+
+    def action_zoom_in(self) -> None:
+        """
+        Split merged rows into their sub-families or tasks.
+
+        Returns
+        -------
+        None
+        """
+        if self.depth < self.max_depth:
+            self.depth += 1
+            self._show()
+
+    def action_close(self) -> None:
+        """
+        Close the modal.
+
+        Returns
+        -------
+        None
+        """
+        self.app.pop_screen()
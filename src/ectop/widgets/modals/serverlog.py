@@ -0,0 +1,312 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Modal screen tailing the ecFlow server log.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import DataTable, Input, Static
+
+from ectop.constants import SERVER_LOG_MAX_ROWS, SERVER_LOG_POLL_INTERVAL, SERVER_LOG_TAIL_LINES
+from ectop.workers import call_on_main, limited
+
+if TYPE_CHECKING:
+    from textual.widgets.data_table import RowKey
+
+    from ectop.aio import AsyncEcflowClient
+    from ectop.serverlog import LogRecord, ServerLog
+
+
+class ServerLogScreen(ModalScreen[None]):
+    """
+    A modal screen listing the server log as structured records, oldest first.
+
+    While the screen is open the tail of the log is fetched every
+    SERVER_LOG_POLL_INTERVAL seconds; only its new lines are parsed and
+    appended to the table, which follows them while the cursor is on the
+    last row. The list can be narrowed to the selected node and its
+    descendants, and to lines containing a text; changing a filter lists the
+    records again from a background worker.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    path : str | None
+        The node selected in the tree when the screen was opened.
+    node_only : bool
+        Whether only the records of `path` and its descendants are listed.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close"),
+        Binding("n", "toggle_node", "Selected Node Only"),
+        Binding("slash", "focus_filter", "Filter"),
+    ]
+
+    def __init__(self, client: AsyncEcflowClient, server_log: ServerLog, path: str | None = None) -> None:
+        """
+        Initialize the ServerLogScreen.
+
+        Parameters
+        ----------
+        client : AsyncEcflowClient
+            The awaitable ecFlow client.
+        server_log : ServerLog
+            The records kept across openings of the screen.
+        path : str | None, optional
+            The selected node, by default None.
+        """
+        super().__init__()
+        self.client: AsyncEcflowClient = client
+        self.server_log: ServerLog = server_log
+        self.path: str | None = path
+        self.node_only: bool = path is not None
+        self._shown: list[LogRecord] = []
+        self._row_keys: deque[RowKey] = deque()
+        self._next: int = 0
+        self._total: int = 0
+        self._filtering: bool = False
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the modal UI.
+
+        Returns
+        -------
+        ComposeResult
+            The UI components for the modal.
+        """
+        with Vertical(id="server_log_container"):
+            yield Static("Server log", id="server_log_title")
+            yield Input(placeholder="Filter lines containing...", id="server_log_filter")
+            yield DataTable(id="server_log_table", cursor_type="row")
+            yield Static("", id="server_log_line", markup=False)
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to show the kept records and start polling.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#server_log_table", DataTable).add_columns("Time", "Type", "Command", "Node", "User")
+        self.show_records()
+        self.query_one("#server_log_table", DataTable).focus()
+        self.poll_log()
+        self.set_interval(SERVER_LOG_POLL_INTERVAL, self.poll_log)
+
+    @work(exclusive=True, group="server_log")
+    async def poll_log(self) -> None:
+        """
+        Fetch the tail of the server log and list its new lines.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker, cancelled when the screen is dismissed.
+        """
+        try:
+            text = await self.client.get_log(max_lines=SERVER_LOG_TAIL_LINES)
+        except RuntimeError as e:
+            self.query_one("#server_log_title", Static).update(f"Server log not available: {e}")
+            return
+        self.server_log.feed(text)
+        self._add_new_records()
+
+    def _filters(self) -> tuple[str | None, str]:
+        """Return the node and the lowercased text the records are filtered by."""
+        return self.path if self.node_only else None, self.query_one("#server_log_filter", Input).value.strip().lower()
+
+    def show_records(self) -> None:
+        """
+        List the records matching the node and text filters again, oldest first.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The records are filtered in a background worker; the table is
+        replaced when it is done.
+        """
+        self._filtering = True
+        path, query = self._filters()
+        self._filter_worker(path, query)
+
+    @work(thread=True, exclusive=True, group="server_log_filter")
+    @limited("modal")
+    def _filter_worker(self, path: str | None, query: str) -> None:
+        """
+        Collect the records matching the filters in a background thread.
+
+        Parameters
+        ----------
+        path : str | None
+            Only the records of this node and its descendants, if given.
+        query : str
+            Only the records whose line contains this lowercased text, if not empty.
+
+        Returns
+        -------
+        None
+        """
+        records, end = self.server_log.records_since(0, path)
+        if query:
+            records = [record for record in records if query in record.line.lower()]
+        call_on_main(self.app, self._fill, path, query, records, end)
+
+    def _fill(self, path: str | None, query: str, records: list[LogRecord], end: int) -> None:
+        """
+        Replace the table with filtered records, moving the cursor to the latest one.
+
+        Parameters
+        ----------
+        path : str | None
+            The node filter the records were collected with.
+        query : str
+            The text filter the records were collected with.
+        records : list[LogRecord]
+            The matching records, oldest first.
+        end : int
+            The number of the first record not included.
+        """
+        if (path, query) != self._filters():
+            # The filters changed while collecting; a newer worker is on its way
+            return
+        self._filtering = False
+        self._next = end
+        self._total = len(records)
+        table = self.query_one("#server_log_table", DataTable)
+        table.clear()
+        self._shown = records[-SERVER_LOG_MAX_ROWS:]
+        self._row_keys = deque(table.add_row(r.time, r.kind, r.command, r.path, r.user) for r in self._shown)
+        if self._shown:
+            table.move_cursor(row=len(self._shown) - 1)
+        self._add_new_records()
+
+    def _add_new_records(self) -> None:
+        """Append the records fed since the table was filled, keeping the cursor on its record."""
+        if self._filtering:
+            return
+        path, query = self._filters()
+        records, self._next = self.server_log.records_since(self._next, path)
+        if query:
+            records = [record for record in records if query in record.line.lower()]
+        table = self.query_one("#server_log_table", DataTable)
+        follow = not self._shown or table.cursor_row >= len(self._shown) - 1
+        row = table.cursor_row
+        for r in records:
+            self._row_keys.append(table.add_row(r.time, r.kind, r.command, r.path, r.user))
+        self._shown.extend(records)
+        self._total += len(records)
+        excess = len(self._shown) - SERVER_LOG_MAX_ROWS
+        if excess > 0:
+            for _ in range(excess):
+                table.remove_row(self._row_keys.popleft())
+            del self._shown[:excess]
+        if self._shown:
+            table.move_cursor(row=len(self._shown) - 1 if follow else max(0, row - max(excess, 0)))
+        self._show_title(path)
+        self._show_line()
+
+    def _show_title(self, path: str | None) -> None:
+        """Show the number of matching records and the active filters."""
+        scope = f" of {path}" if path else ""
+        title = f"Server log{scope}: {self._total} lines"
+        if self._total > len(self._shown):
+            title += f", latest {len(self._shown)} shown"
+        if self.path:
+            title += f" (n: show {'all nodes' if self.node_only else 'selected node only'})"
+        if self.server_log.gaps:
+            title += f", {self.server_log.gaps} gaps"
+        self.query_one("#server_log_title", Static).update(title)
+
+    def _show_line(self) -> None:
+        """Show the full text of the highlighted record below the table."""
+        table = self.query_one("#server_log_table", DataTable)
+        row = table.cursor_row
+        line = self._shown[row].line if 0 <= row < len(self._shown) else ""
+        self.query_one("#server_log_line", Static).update(line)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """
+        Show the full line when the cursor moves.
+
+        Parameters
+        ----------
+        event : DataTable.RowHighlighted
+            The row highlight event.
+
+        Returns
+        -------
+        None
+        """
+        self._show_line()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """
+        Apply the text filter as it is typed.
+
+        Parameters
+        ----------
+        event : Input.Changed
+            The input change event.
+
+        Returns
+        -------
+        None
+        """
+        self.show_records()
+
+    def action_toggle_node(self) -> None:
+        """
+        Switch between the records of the selected node and all records.
+
+        Returns
+        -------
+        None
+        """
+        if self.path:
+            self.node_only = not self.node_only
+            self.show_records()
+
+    def action_focus_filter(self) -> None:
+        """
+        Move the focus to the text filter.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#server_log_filter", Input).focus()
+
+    def action_close(self) -> None:
+        """
+        Close the modal.
+
+        Returns
+        -------
+        None
+        """
+        self.app.pop_screen()
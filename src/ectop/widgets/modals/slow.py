@@ -0,0 +1,158 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Modal screen listing active tasks that run longer than usual.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Static
+
+from ectop.transitions import format_duration
+
+if TYPE_CHECKING:
+    from ectop.runtimes import RuntimeStats
+    from ectop.widgets.sidebar import SuiteTree
+
+
+class SlowTasks(ModalScreen[None]):
+    """
+    A modal screen listing active nodes past the 95th percentile of their run times.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close"),
+        Binding("L", "close", "Close"),
+        Binding("r", "rescan", "Rescan"),
+    ]
+
+    def __init__(self, runtime_stats: RuntimeStats, suite_tree: SuiteTree) -> None:
+        """
+        Initialize the SlowTasks.
+
+        Parameters
+        ----------
+        runtime_stats : RuntimeStats
+            The runtime statistics of the session.
+        suite_tree : SuiteTree
+            The suite tree that selected tasks are revealed in.
+        """
+        super().__init__()
+        self.runtime_stats: RuntimeStats = runtime_stats
+        self.suite_tree: SuiteTree = suite_tree
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the modal UI.
+
+        Returns
+        -------
+        ComposeResult
+            The UI components for the modal.
+        """
+        with Vertical(id="slow_container"):
+            yield Static("Slow tasks", id="slow_title")
+            yield DataTable(id="slow_table")
+            with Horizontal(id="slow_actions"):
+                yield Button("Close", variant="primary", id="close_btn")
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to initialize the table.
+
+        Returns
+        -------
+        None
+        """
+        table = self.query_one("#slow_table", DataTable)
+        table.add_columns("Task", "Running", "p95", "Over by")
+        table.cursor_type = "row"
+        self.action_rescan()
+
+    def action_rescan(self, now: float | None = None) -> None:
+        """
+        List the slow nodes again.
+
+        Parameters
+        ----------
+        now : float | None, optional
+            The current time, by default `time.time()`.
+
+        Returns
+        -------
+        None
+        """
+        slow = self.runtime_stats.slow(now)
+        table = self.query_one("#slow_table", DataTable)
+        table.clear()
+        for task in slow:
+            table.add_row(
+                task.path,
+                format_duration(task.elapsed),
+                format_duration(task.p95),
+                format_duration(task.elapsed - task.p95),
+                key=task.path,
+            )
+        if slow:
+            title = f"Slow tasks ({len(slow)}): running longer than 95% of their recent runs"
+        else:
+            title = "No slow tasks: every active node with known run times is within its p95"
+        self.query_one("#slow_title", Static).update(title)
+
+    def action_close(self) -> None:
+        """
+        Close the modal.
+
+        Returns
+        -------
+        None
+        """
+        self.app.pop_screen()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """
+        Handle button press events.
+
+        Parameters
+        ----------
+        event : Button.Pressed
+            The button press event.
+
+        Returns
+        -------
+        None
+        """
+        if event.button.id == "close_btn":
+            self.app.pop_screen()
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """
+        Reveal the selected task in the suite tree.
+
+        Parameters
+        ----------
+        event : DataTable.RowSelected
+            The row selection event.
+
+        Returns
+        -------
+        None
+        """
+        path = event.row_key.value
+        if path:
+            self.suite_tree.select_by_path(path)
+            self.app.pop_screen()
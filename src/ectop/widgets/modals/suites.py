@@ -0,0 +1,163 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Modal screen choosing the suites to synchronize.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, SelectionList, Static
+
+if TYPE_CHECKING:
+    from ectop.aio import AsyncEcflowClient
+
+
+class SuitePicker(ModalScreen[None]):
+    """
+    A modal screen listing the suites of the server to choose which are synchronized.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Cancel"),
+        Binding("a", "apply", "Apply"),
+        Binding("x", "all_suites", "All Suites"),
+    ]
+
+    def __init__(self, client: AsyncEcflowClient, selected: list[str] | None, callback: Callable[[list[str]], None]) -> None:
+        """
+        Initialize the SuitePicker.
+
+        Parameters
+        ----------
+        client : AsyncEcflowClient
+            The awaitable ecFlow client.
+        selected : list[str] | None
+            The suites synchronized now, or None for all suites.
+        callback : Callable[[list[str]], None]
+            Called with the chosen suites when applied; an empty list means all suites.
+        """
+        super().__init__()
+        self.client: AsyncEcflowClient = client
+        self.selected: list[str] = list(selected or ())
+        self.callback: Callable[[list[str]], None] = callback
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the modal UI.
+
+        Returns
+        -------
+        ComposeResult
+            The UI components for the modal.
+        """
+        with Vertical(id="suites_container"):
+            yield Static("Loading suites...", id="suites_title")
+            yield SelectionList[str](id="suites_list")
+            with Horizontal(id="suites_actions"):
+                yield Button("Apply (a)", variant="primary", id="apply_btn")
+                yield Button("All Suites (x)", id="all_btn")
+                yield Button("Cancel", id="cancel_btn")
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to list the suites.
+
+        Returns
+        -------
+        None
+        """
+        self.query_one("#suites_list", SelectionList).focus()
+        self.load_suites()
+
+    @work(exclusive=True, group="suite_picker")
+    async def load_suites(self) -> None:
+        """
+        Fetch the suite names from the server and list them.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker, cancelled when the screen is dismissed.
+        """
+        try:
+            names = await self.client.suite_names()
+        except RuntimeError as e:
+            self.query_one("#suites_title", Static).update(f"Suites not available: {e}")
+            return
+        chosen = set(self.selected)
+        selection = self.query_one("#suites_list", SelectionList)
+        selection.clear_options()
+        selection.add_options([(name, name, name in chosen) for name in names])
+        scope = f"{len(chosen)} synchronized" if chosen else "all synchronized"
+        self.query_one("#suites_title", Static).update(f"Suites on the server: {len(names)}, {scope} (space: toggle)")
+
+    def action_apply(self) -> None:
+        """
+        Synchronize the checked suites, or all suites if none is checked.
+
+        Returns
+        -------
+        None
+        """
+        self.callback(list(self.query_one("#suites_list", SelectionList).selected))
+        self.app.pop_screen()
+
+    def action_all_suites(self) -> None:
+        """
+        Synchronize all suites again.
+
+        Returns
+        -------
+        None
+        """
+        self.callback([])
+        self.app.pop_screen()
+
+    def action_close(self) -> None:
+        """
+        Close the modal without changing the suites.
+
+        Returns
+        -------
+        None
+        """
+        self.app.pop_screen()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """
+        Handle button press events.
+
+        Parameters
+        ----------
+        event : Button.Pressed
+            The button press event.
+
+        Returns
+        -------
+        None
+        """
+        if event.button.id == "apply_btn":
+            self.action_apply()
+        elif event.button.id == "all_btn":
+            self.action_all_suites()
+        else:
+            self.action_close()
@@ -0,0 +1,291 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Modal screen for triaging all aborted tasks at once.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Static
+from textual.widgets.data_table import ColumnKey
+
+from ectop.constants import TRIAGE_MAX_FETCHES, TRIAGE_TAIL_LINES
+from ectop.nodes import abort_reason, tasks_in_state
+from ectop.tries import try_number
+
+if TYPE_CHECKING:
+    from ectop.aio import AsyncEcflowClient
+    from ectop.widgets.sidebar import SuiteTree
+
+
+class AbortedTriage(ModalScreen[None]):
+    """
+    A modal screen listing every aborted task with its reason, try and output tail.
+
+    The rows come from a single scan of the synchronized definitions and
+    appear at once. The last lines of each job output are then fetched
+    concurrently, at most TRIAGE_MAX_FETCHES at a time, and filled in as
+    each fetch completes.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close"),
+        Binding("A", "close", "Close"),
+        Binding("R", "requeue", "Requeue"),
+        Binding("r", "rescan", "Rescan"),
+    ]
+
+    def __init__(self, client: AsyncEcflowClient, suite_tree: SuiteTree) -> None:
+        """
+        Initialize the AbortedTriage.
+
+        Parameters
+        ----------
+        client : AsyncEcflowClient
+            The awaitable ecFlow client.
+        suite_tree : SuiteTree
+            The suite tree that selected tasks are revealed in.
+        """
+        super().__init__()
+        self.client: AsyncEcflowClient = client
+        self.suite_tree: SuiteTree = suite_tree
+        self.tails: dict[str, str | RuntimeError] = {}
+        self._last_column: ColumnKey | None = None
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the modal UI.
+
+        Returns
+        -------
+        ComposeResult
+            The UI components for the modal.
+        """
+        with Vertical(id="triage_container"):
+            yield Static("Aborted tasks", id="triage_title")
+            yield DataTable(id="triage_table")
+            with VerticalScroll(id="triage_tail_scroll"):
+                yield Static("", id="triage_tail", markup=False)
+            with Horizontal(id="triage_actions"):
+                yield Button("Close", variant="primary", id="close_btn")
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to initialize the table and start the scan.
+
+        Returns
+        -------
+        None
+        """
+        table = self.query_one("#triage_table", DataTable)
+        _, _, _, self._last_column = table.add_columns("Task", "Try", "Reason", "Last Line")
+        table.cursor_type = "row"
+        self.load_aborted()
+
+    def action_close(self) -> None:
+        """
+        Close the modal.
+
+        Returns
+        -------
+        None
+        """
+        self.app.pop_screen()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """
+        Handle button press events.
+
+        Parameters
+        ----------
+        event : Button.Pressed
+            The button press event.
+
+        Returns
+        -------
+        None
+        """
+        if event.button.id == "close_btn":
+            self.app.pop_screen()
+
+    def action_rescan(self) -> None:
+        """
+        Scan for aborted tasks again.
+
+        Returns
+        -------
+        None
+        """
+        self.load_aborted()
+
+    @work(exclusive=True, group="triage")
+    async def load_aborted(self) -> None:
+        """
+        List the aborted tasks and stream in the tails of their outputs.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker, cancelled when the screen is dismissed;
+        fetches still running are cancelled with it.
+        """
+        try:
+            await self.client.sync_local()
+            defs = await self.client.get_defs()
+        except RuntimeError as e:
+            self.app.notify(f"Error scanning aborted tasks: {e}", severity="error")
+            return
+
+        paths = tasks_in_state(defs, "aborted")
+        table = self.query_one("#triage_table", DataTable)
+        table.clear()
+        self.tails = {}
+        self.query_one("#triage_title", Static).update(f"Aborted tasks ({len(paths)})")
+        for path in paths:
+            table.add_row(path, str(try_number(defs, path) or "-"), abort_reason(defs, path), "loading...", key=path)
+        self._show_tail()
+        if not paths:
+            self.app.notify("No aborted tasks")
+            return
+
+        semaphore = asyncio.Semaphore(TRIAGE_MAX_FETCHES)
+
+        async def fetch_tail(path: str) -> tuple[str, str | RuntimeError]:
+            async with semaphore:
+                try:
+                    return path, await self.client.file(path, "jobout", max_lines=TRIAGE_TAIL_LINES)
+                except RuntimeError as e:
+                    return path, e
+
+        tasks = [asyncio.ensure_future(fetch_tail(path)) for path in paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                path, result = await next_done
+                self.tails[path] = result
+                if isinstance(result, str):
+                    lines = result.rstrip("\n").rsplit("\n", 1)
+                    last = Text(lines[-1])
+                else:
+                    last = Text(str(result), style="red")
+                table.update_cell(path, self._last_column, last)
+                if path == self._selected_path():
+                    self._show_tail()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _selected_path(self) -> str | None:
+        """
+        Get the path of the highlighted row.
+
+        Returns
+        -------
+        str | None
+            The task path, or None if the table is empty.
+        """
+        table = self.query_one("#triage_table", DataTable)
+        if table.row_count == 0:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return row_key.value
+
+    def _show_tail(self) -> None:
+        """
+        Show the output tail of the highlighted task below the table.
+
+        Returns
+        -------
+        None
+        """
+        path = self._selected_path()
+        tail = self.tails.get(path) if path else None
+        if path is None:
+            text = ""
+        elif tail is None:
+            text = f"Fetching the last {TRIAGE_TAIL_LINES} lines of {path}..."
+        elif isinstance(tail, RuntimeError):
+            text = f"Output not available: {tail}"
+        else:
+            text = tail
+        self.query_one("#triage_tail", Static).update(text)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """
+        Update the output tail when the cursor moves.
+
+        Parameters
+        ----------
+        event : DataTable.RowHighlighted
+            The row highlight event.
+
+        Returns
+        -------
+        None
+        """
+        self._show_tail()
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """
+        Reveal the selected task in the suite tree.
+
+        Parameters
+        ----------
+        event : DataTable.RowSelected
+            The row selection event.
+
+        Returns
+        -------
+        None
+        """
+        path = event.row_key.value
+        if path:
+            self.suite_tree.select_by_path(path)
+            self.app.pop_screen()
+
+    @work(group="triage_requeue")
+    async def action_requeue(self) -> None:
+        """
+        Requeue the highlighted task and drop it from the list.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker.
+        """
+        path = self._selected_path()
+        if not path:
+            return
+        try:
+            await self.client.command("requeue", path)
+        except RuntimeError as e:
+            self.app.notify(f"Command Error: {e}", severity="error")
+            return
+        self.app.notify(f"Requeue: {path}")
+        table = self.query_one("#triage_table", DataTable)
+        table.remove_row(path)
+        self.tails.pop(path, None)
+        self.query_one("#triage_title", Static).update(f"Aborted tasks ({table.row_count})")
+        self._show_tail()
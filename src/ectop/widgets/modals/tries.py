@@ -0,0 +1,220 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Modal screen for browsing the outputs of all tries of a task.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Static
+from textual.widgets.data_table import ColumnKey
+
+from ectop.tries import OutputHistory, fetch_try_outputs, try_output_paths
+
+if TYPE_CHECKING:
+    from ectop.aio import AsyncEcflowClient
+    from ectop.widgets.content import MainContent
+
+
+class TryHistory(ModalScreen[None]):
+    """
+    A modal screen listing the job outputs of every try of a task.
+
+    All outputs are fetched concurrently when the screen opens and kept in
+    the shared `OutputHistory`, so reopening it costs no downloads.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close"),
+        Binding("o", "close", "Close"),
+        Binding("d", "diff_selected", "Diff with Current"),
+    ]
+
+    def __init__(
+        self,
+        node_path: str,
+        client: AsyncEcflowClient,
+        history: OutputHistory,
+        content_area: MainContent,
+    ) -> None:
+        """
+        Initialize the TryHistory.
+
+        Parameters
+        ----------
+        node_path : str
+            The absolute path to the task.
+        client : AsyncEcflowClient
+            The awaitable ecFlow client.
+        history : OutputHistory
+            The shared output cache.
+        content_area : MainContent
+            The content area that selected outputs are shown in.
+        """
+        super().__init__()
+        self.node_path: str = node_path
+        self.client: AsyncEcflowClient = client
+        self.history: OutputHistory = history
+        self.content_area: MainContent = content_area
+        self.current_try: int = 0
+        self.outputs: dict[int, str | RuntimeError] = {}
+        self._lines_column: ColumnKey | None = None
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the modal UI.
+
+        Returns
+        -------
+        ComposeResult
+            The UI components for the modal.
+        """
+        with Vertical(id="tries_container"):
+            yield Static(f"Output tries of {self.node_path}", id="tries_title")
+            yield DataTable(id="tries_table")
+            with Horizontal(id="tries_actions"):
+                yield Button("Close", variant="primary", id="close_btn")
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to initialize the table and start fetching.
+
+        Returns
+        -------
+        None
+        """
+        table = self.query_one("#tries_table", DataTable)
+        _, self._lines_column, _ = table.add_columns("Try", "Lines", "File")
+        table.cursor_type = "row"
+        self.load_tries()
+
+    def action_close(self) -> None:
+        """
+        Close the modal.
+
+        Returns
+        -------
+        None
+        """
+        self.app.pop_screen()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """
+        Handle button press events.
+
+        Parameters
+        ----------
+        event : Button.Pressed
+            The button press event.
+
+        Returns
+        -------
+        None
+        """
+        if event.button.id == "close_btn":
+            self.app.pop_screen()
+
+    @work(exclusive=True, group="tries")
+    async def load_tries(self) -> None:
+        """
+        Resolve the output file of every try and fetch them all concurrently.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is an async worker, cancelled when the screen is dismissed.
+        """
+        try:
+            await self.client.sync_local()
+            defs = await self.client.get_defs()
+        except RuntimeError as e:
+            self.app.notify(f"Error fetching tries: {e}", severity="error")
+            return
+
+        files = try_output_paths(defs, self.node_path)
+        if not files:
+            self.app.notify("No job output known for this node", severity="warning")
+            return
+        self.current_try = max(files)
+        table = self.query_one("#tries_table", DataTable)
+        table.clear()
+        for try_no in sorted(files, reverse=True):
+            table.add_row(str(try_no), "loading...", files[try_no], key=str(try_no))
+
+        self.outputs = await fetch_try_outputs(self.client, self.history, self.node_path, files, self.current_try, files)
+        for try_no, result in self.outputs.items():
+            status = f"{result.count(chr(10)) + 1}" if isinstance(result, str) else f"[red]{result}[/]"
+            table.update_cell(str(try_no), self._lines_column, status)
+
+    def _selected_try(self) -> int | None:
+        """
+        Get the try number of the highlighted row.
+
+        Returns
+        -------
+        int | None
+            The try number, or None if no row is highlighted.
+        """
+        table = self.query_one("#tries_table", DataTable)
+        if table.row_count == 0:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return int(row_key.value) if row_key.value else None
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """
+        Show the output of the selected try in the Output tab.
+
+        Parameters
+        ----------
+        event : DataTable.RowSelected
+            The row selection event.
+
+        Returns
+        -------
+        None
+        """
+        try_no = int(event.row_key.value or 0)
+        output = self.outputs.get(try_no)
+        if not isinstance(output, str):
+            self.app.notify(f"Output of try {try_no} is not available", severity="warning")
+            return
+        self.content_area.update_log(output)
+        self.content_area.active = "tab_output"
+        self.app.notify(f"Showing output of try {try_no}")
+        self.app.pop_screen()
+
+    def action_diff_selected(self) -> None:
+        """
+        Diff the output of the highlighted try against the current try.
+
+        Returns
+        -------
+        None
+        """
+        try_no = self._selected_try()
+        old = self.outputs.get(try_no) if try_no else None
+        new = self.outputs.get(self.current_try)
+        if not isinstance(old, str) or not isinstance(new, str):
+            self.app.notify("Both outputs must be available to diff", severity="warning")
+            return
+        self.content_area.show_diff(f"{self.node_path}: Try {try_no} → Try {self.current_try}", old, new)
+        self.app.pop_screen()
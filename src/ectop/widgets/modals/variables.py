@@ -25,6 +25,7 @@ from ectop.constants import (
     VAR_TYPE_INHERITED,
     VAR_TYPE_USER,
 )
+from ectop.workers import limited
 
 
 class VariableTweaker(ModalScreen[None]):
@@ -119,6 +120,7 @@ class VariableTweaker(ModalScreen[None]):
             self.app.pop_screen()
 
     @work(thread=True)
+    @limited("modal")
     def refresh_vars(self) -> None:
         """
         Fetch variables from the server and refresh the table in a background worker.
@@ -256,6 +258,7 @@ class VariableTweaker(ModalScreen[None]):
             self._submit_variable_worker(event.value)
 
     @work(thread=True)
+    @limited("control")
     def _submit_variable_worker(self, value: str) -> None:
         """
         Worker to submit a new or updated variable in a background thread.
@@ -365,6 +368,7 @@ class VariableTweaker(ModalScreen[None]):
                 self._delete_variable_worker(row_key)
 
     @work(thread=True)
+    @limited("control")
     def _delete_variable_worker(self, row_key: str) -> None:
         """
         Worker to delete a variable from the server in a background thread.
@@ -35,6 +35,7 @@ from ectop.constants import (
     ICON_TIME,
     ICON_UNKNOWN,
 )
+from ectop.workers import limited
 
 if TYPE_CHECKING:
     from ecflow import Defs, Node
@@ -160,6 +161,7 @@ class WhyInspector(ModalScreen[None]):
         self._refresh_deps_worker(tree)
 
     @work(thread=True)
+    @limited("modal")
     def _refresh_deps_worker(self, tree: Tree) -> None:
         """
         Worker to fetch dependencies from the server and rebuild the tree in a background thread.
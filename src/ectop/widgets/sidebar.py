@@ -11,8 +11,8 @@ Sidebar widget for the ecFlow suite tree.
 
 from __future__ import annotations
 
-import threading
 from collections.abc import Callable
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import ecflow
@@ -22,18 +22,24 @@ from textual.widgets import Tree
 from textual.widgets.tree import TreeNode
 
 from ectop.constants import (
+    COLOR_SLOW,
+    ICON_ETA,
     ICON_FAMILY,
     ICON_SERVER,
+    ICON_SLOW,
     ICON_TASK,
     ICON_UNKNOWN_STATE,
     LOADING_PLACEHOLDER,
     STATE_MAP,
     TREE_FILTERS,
 )
+from ectop.workers import call_on_main, limited
 
 if TYPE_CHECKING:
     from ecflow import Defs, Node
 
+    from ectop.runtimes import RuntimeStats
+
 
 class SuiteTree(Tree[str]):
     """
@@ -64,8 +70,9 @@ class SuiteTree(Tree[str]):
         self.filters: list[str | None] = TREE_FILTERS
         self.host: str = ""
         self.port: int = 0
+        self.runtime_stats: RuntimeStats | None = None
 
-    def update_tree(self, client_host: str, client_port: int, defs: Defs | None) -> None:
+    def update_tree(self, client_host: str, client_port: int, defs: Defs | None, ui_state: dict[str, Any] | None = None) -> None:
         """
         Rebuild the tree from ecFlow definitions using lazy loading.
 
@@ -77,6 +84,9 @@ class SuiteTree(Tree[str]):
             The port of the ecFlow server.
         defs : ecflow.Defs | None
             The ecFlow definitions to display.
+        ui_state : dict[str, Any] | None, optional
+            Expanded nodes, cursor and filter to restore after the rebuild,
+            as returned by `ui_state`, by default None.
 
         Returns
         -------
@@ -89,6 +99,8 @@ class SuiteTree(Tree[str]):
         self.host = client_host
         self.port = client_port
         self.defs = defs
+        if ui_state and ui_state.get("filter") in self.filters:
+            self.current_filter = ui_state["filter"]
         self._all_paths_cache: list[str] | None = None
         self.clear()
         if not defs:
@@ -99,16 +111,22 @@ class SuiteTree(Tree[str]):
         self.root.label = f"{ICON_SERVER} {client_host}:{client_port}{filter_str}"
 
         # Start background worker for tree population to avoid blocking UI
-        self._populate_tree_worker()
+        self._populate_tree_worker(ui_state)
 
         # Trigger background cache building for search
         self._build_all_paths_cache_worker()
 
     @work(thread=True)
-    def _populate_tree_worker(self) -> None:
+    @limited("tree")
+    def _populate_tree_worker(self, ui_state: dict[str, Any] | None = None) -> None:
         """
         Worker to populate the tree root with suites in a background thread.
 
+        Parameters
+        ----------
+        ui_state : dict[str, Any] | None, optional
+            Expanded nodes and cursor to restore once the suites are added, by default None.
+
         Returns
         -------
         None
@@ -122,6 +140,62 @@ class SuiteTree(Tree[str]):
         for suite in self.defs.suites:
             if self._should_show_node(suite):
                 self._safe_call(self._add_node_to_ui, self.root, suite)
+        if ui_state:
+            self._restore_ui_state_logic(ui_state)
+
+    def ui_state(self) -> dict[str, Any]:
+        """
+        Capture the expanded nodes, cursor and filter of the tree.
+
+        Returns
+        -------
+        dict[str, Any]
+            A JSON-serializable state for `update_tree`.
+        """
+        expanded: list[str] = []
+        stack = list(self.root.children)
+        while stack:
+            node = stack.pop()
+            if node.is_expanded and node.children and node.data:
+                expanded.append(node.data)
+                stack.extend(node.children)
+        cursor = self.cursor_node
+        return {
+            "expanded": sorted(expanded),
+            "cursor": cursor.data if cursor is not None else None,
+            "filter": self.current_filter,
+        }
+
+    def _restore_ui_state_logic(self, ui_state: dict[str, Any]) -> None:
+        """
+        Expand the saved nodes and move the cursor back, skipping nodes that no longer exist.
+
+        Parameters
+        ----------
+        ui_state : dict[str, Any]
+            The state from `ui_state`.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This method should be called from a background thread as it performs
+        synchronous child loading.
+        """
+        # Parents sort before their children, so each path only expands one more level
+        for path in sorted(ui_state.get("expanded") or []):
+            node = self._reveal_path(path)
+            if node is not None:
+                self._load_children(node, sync=True)
+                self._safe_call(node.expand)
+        cursor = ui_state.get("cursor")
+        if cursor:
+            node = self._reveal_path(cursor)
+            if node is not None:
+                # Only move the cursor: selecting would toggle the node and load its files
+                self._safe_call(self.call_after_refresh, self.move_cursor, node)
 
     def _should_show_node(self, node: Node) -> bool:
         """
@@ -150,6 +224,7 @@ class SuiteTree(Tree[str]):
         return False
 
     @work(thread=True)
+    @limited("tree")
     def _build_all_paths_cache_worker(self) -> None:
         """
         Worker to build the node path cache in a background thread.
@@ -216,6 +291,14 @@ class SuiteTree(Tree[str]):
 
         label = Text(f"{icon} {type_icon} {ecflow_node.name()} ")
         label.append(f"[{state}]", style="bold italic")
+        if state == "active" and self.runtime_stats:
+            path = ecflow_node.get_abs_node_path()
+            if self.runtime_stats.is_slow(path):
+                label.stylize(COLOR_SLOW)
+                label.append(f" {ICON_SLOW}")
+            eta = self.runtime_stats.eta(path)
+            if eta is not None:
+                label.append(f" {ICON_ETA} {datetime.fromtimestamp(eta):%H:%M}", style="dim")
 
         new_ui_node = parent_ui_node.add(
             label,
@@ -296,6 +379,7 @@ class SuiteTree(Tree[str]):
                 self._load_children_worker(ui_node, ui_node.data)
 
     @work(thread=True)
+    @limited("tree")
     def _load_children_worker(self, ui_node: TreeNode[str], node_path: str) -> None:
         """
         Worker to load children nodes in a background thread.
@@ -325,6 +409,7 @@ class SuiteTree(Tree[str]):
                     self.app.call_from_thread(self._add_node_to_ui, ui_node, child)
 
     @work(exclusive=True, thread=True)
+    @limited("tree")
     def find_and_select(self, query: str) -> None:
         """
         Find nodes matching query in the ecFlow definitions and select them.
@@ -415,18 +500,10 @@ class SuiteTree(Tree[str]):
         Any
             The result of the call if synchronous, or None if scheduled.
         """
-        try:
-            # Check if we are on the main thread.
-            # Using private access as Textual doesn't provide a public way yet.
-            if self.app._thread_id == threading.get_ident():
-                return callback(*args, **kwargs)
-        except (AttributeError, RuntimeError):
-            # App might not be fully initialized in some tests
-            pass
-
-        return self.app.call_from_thread(callback, *args, **kwargs)
+        return call_on_main(self.app, callback, *args, **kwargs)
 
     @work(thread=True)
+    @limited("tree")
     def select_by_path(self, path: str) -> None:
         """
         Select a node by its absolute ecFlow path, expanding parents as needed.
@@ -469,6 +546,29 @@ class SuiteTree(Tree[str]):
             self.app.call_from_thread(self.select_node, self.root)
             return
 
+        node = self._reveal_path(path)
+        if node is not None:
+            self._safe_call(self._select_and_reveal, node)
+
+    def _reveal_path(self, path: str) -> TreeNode[str] | None:
+        """
+        Load and expand the ancestors of a node.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path of the node.
+
+        Returns
+        -------
+        TreeNode[str] | None
+            The UI node, or None if it is not in the tree.
+
+        Notes
+        -----
+        This method should be called from a background thread as it performs
+        synchronous child loading.
+        """
         parts = path.strip("/").split("/")
         current_ui_node = self.root
 
@@ -486,9 +586,8 @@ class SuiteTree(Tree[str]):
                     found = True
                     break
             if not found:
-                return
-
-        self._safe_call(self._select_and_reveal, current_ui_node)
+                return None
+        return current_ui_node
 
     def _select_and_reveal(self, node: TreeNode[str]) -> None:
         """
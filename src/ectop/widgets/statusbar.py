@@ -17,7 +17,15 @@ from typing import Any
 from rich.text import Text
 from textual.widgets import Static
 
-from ectop.constants import COLOR_STATUS_HALTED
+from ectop.constants import (
+    COLOR_STATUS_HALTED,
+    COLOR_STATUS_STALE,
+    CONN_CONNECTED,
+    CONN_STATE_COLORS,
+    STATUS_STALE,
+    WORKER_STATUS_INTERVAL,
+)
+from ectop.workers import worker_limiter
 
 
 class StatusBar(Static):
@@ -44,8 +52,68 @@ class StatusBar(Static):
         self.last_sync: str = "Never"
         self.status: str = "Unknown"
         self.server_version: str = "Unknown"
+        self.running_jobs: int = 0
+        self.queued_jobs: int = 0
+        self.connection: str = CONN_CONNECTED
+        self.retry_in: float | None = None
 
-    def update_status(self, host: str, port: int, status: str = "Connected", version: str = "Unknown") -> None:
+    def on_mount(self) -> None:
+        """
+        Start polling the worker limiter for queue depth.
+
+        Returns
+        -------
+        None
+        """
+        self.set_interval(WORKER_STATUS_INTERVAL, self._poll_workers)
+
+    def _poll_workers(self) -> None:
+        """Refresh the job counters if they changed since the last poll."""
+        self.update_workers(worker_limiter.running, worker_limiter.queued)
+
+    def update_workers(self, running: int, queued: int) -> None:
+        """
+        Update the background job counters.
+
+        Parameters
+        ----------
+        running : int
+            Number of jobs holding a worker slot.
+        queued : int
+            Number of jobs waiting for a worker slot.
+        """
+        if (running, queued) == (self.running_jobs, self.queued_jobs):
+            return
+        self.running_jobs = running
+        self.queued_jobs = queued
+        self._refresh_content()
+
+    def update_connection(self, state: str, retry_in: float | None = None) -> None:
+        """
+        Update the connection health indicator.
+
+        Parameters
+        ----------
+        state : str
+            The connection state (connected, degraded, probing or down).
+        retry_in : float | None, optional
+            Seconds until the next reconnect attempt, by default None.
+        """
+        retry = None if retry_in is None else round(retry_in)
+        if (state, retry) == (self.connection, self.retry_in):
+            return
+        self.connection = state
+        self.retry_in = retry
+        self._refresh_content()
+
+    def update_status(
+        self,
+        host: str,
+        port: int,
+        status: str = "Connected",
+        version: str = "Unknown",
+        synced_at: datetime | None = None,
+    ) -> None:
         """
         Update the status bar information.
 
@@ -59,11 +127,13 @@ class StatusBar(Static):
             The server status message, by default "Connected".
         version : str, optional
             The ecFlow server version, by default "Unknown".
+        synced_at : datetime | None, optional
+            When the shown data was synchronized, by default now.
         """
         self.server_info = f"{host}:{port}"
         self.status = str(status)
         self.server_version = str(version)
-        self.last_sync = datetime.now().strftime("%H:%M:%S")
+        self.last_sync = (synced_at or datetime.now()).strftime("%H:%M:%S")
         self._refresh_content()
 
     def _refresh_content(self) -> None:
@@ -86,6 +156,15 @@ class StatusBar(Static):
             status_color = COLOR_STATUS_HALTED
         elif "Connected" in self.status:
             status_color = "green"
+        elif self.status.startswith(STATUS_STALE):
+            status_color = COLOR_STATUS_STALE
+
+        link: list[tuple[str, str]] = [
+            (" | Link: ", "bold"),
+            (self.connection, CONN_STATE_COLORS.get(self.connection, "red")),
+        ]
+        if self.retry_in is not None:
+            link.append((f" (retry in {self.retry_in:.0f}s)", "yellow"))
 
         return Text.assemble(
             (" Server: ", "bold"),
@@ -95,6 +174,11 @@ class StatusBar(Static):
             (")", "bold"),
             (" | Status: ", "bold"),
             (self.status, status_color),
+            *link,
             (" | Last Sync: ", "bold"),
             (self.last_sync, "yellow"),
+            (" | Jobs: ", "bold"),
+            (f"{self.running_jobs}", "cyan"),
+            (" Queue: ", "bold"),
+            (f"{self.queued_jobs}", "red" if self.queued_jobs else "dim"),
         )
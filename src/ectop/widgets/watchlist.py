@@ -0,0 +1,171 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Watch list panel for ectop.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from textual.widgets import DataTable
+
+from ectop.constants import ICON_UNKNOWN_STATE, STATE_MAP, WATCH_MAX_NODES
+from ectop.transitions import format_duration
+from ectop.watch import WatchStatus
+
+
+class WatchList(DataTable):
+    """
+    A panel of pinned nodes with their state, elapsed time, meters and labels.
+
+    The app polls the watched nodes with per-node queries, independently of
+    the full synchronization, and passes the results to `update_status`. The
+    elapsed time counts from the last observed state change. The panel is
+    hidden while no node is watched.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    paths : list[str]
+        The watched node paths, in the order they were added.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the WatchList.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments for the DataTable widget.
+        **kwargs : Any
+            Keyword arguments for the DataTable widget.
+        """
+        kwargs.setdefault("cursor_type", "row")
+        super().__init__(*args, **kwargs)
+        self.paths: list[str] = []
+        self._status: dict[str, WatchStatus] = {}
+        self._since: dict[str, float] = {}
+
+    def on_mount(self) -> None:
+        """
+        Handle the mount event to set up the columns.
+
+        Returns
+        -------
+        None
+        """
+        self.add_columns("Node", "State", "Elapsed", "Meters", "Labels")
+        self.display = False
+
+    def toggle(self, path: str, since: float | None = None) -> bool:
+        """
+        Add a node to the watch list, or remove it if it is watched.
+
+        Parameters
+        ----------
+        path : str
+            The absolute node path.
+        since : float | None, optional
+            When the node entered its current state, if known, by default None.
+
+        Returns
+        -------
+        bool
+            Whether the node is now watched.
+
+        Raises
+        ------
+        RuntimeError
+            If WATCH_MAX_NODES nodes are already watched.
+        """
+        if path in self.paths:
+            self.paths.remove(path)
+            self._status.pop(path, None)
+            self._since.pop(path, None)
+            watched = False
+        else:
+            if len(self.paths) >= WATCH_MAX_NODES:
+                raise RuntimeError(f"At most {WATCH_MAX_NODES} nodes can be watched")
+            self.paths.append(path)
+            if since is not None:
+                self._since[path] = since
+            watched = True
+        self.display = bool(self.paths)
+        self._show()
+        return watched
+
+    def update_status(self, statuses: list[WatchStatus], now: float | None = None) -> None:
+        """
+        Show freshly polled statuses.
+
+        Parameters
+        ----------
+        statuses : list[WatchStatus]
+            The polled statuses; those of nodes no longer watched are ignored.
+        now : float | None, optional
+            The poll time, by default `time.time()`.
+
+        Returns
+        -------
+        None
+        """
+        stamp = time.time() if now is None else now
+        for status in statuses:
+            if status.path not in self.paths:
+                continue
+            previous = self._status.get(status.path)
+            if status.state and previous is not None and previous.state and previous.state != status.state:
+                self._since[status.path] = stamp
+            self._status[status.path] = status
+        self._show(stamp)
+
+    def _show(self, now: float | None = None) -> None:
+        """Rebuild the rows, keeping the cursor position."""
+        stamp = time.time() if now is None else now
+        row = self.cursor_row
+        self.clear()
+        for path in self.paths:
+            status = self._status.get(path)
+            if status is None:
+                self.add_row(path, "…", "", "", "")
+                continue
+            if status.error:
+                self.add_row(path, "⚠ query failed", "", "", status.error)
+                continue
+            since = self._since.get(path)
+            self.add_row(
+                path,
+                f"{STATE_MAP.get(status.state, ICON_UNKNOWN_STATE)} {status.state}",
+                format_duration(stamp - since) if since is not None else "",
+                " ".join(f"{name} {value}/{maximum}" for name, value, maximum in status.meters),
+                " ".join(f"{name}: {value}" for name, value in status.labels),
+            )
+        if self.row_count:
+            self.move_cursor(row=min(row, self.row_count - 1))
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """
+        Reveal the selected node in the tree.
+
+        Parameters
+        ----------
+        event : DataTable.RowSelected
+            The row selection event.
+
+        Returns
+        -------
+        None
+        """
+        event.stop()
+        if 0 <= event.cursor_row < len(self.paths):
+            self.app.query_one("#suite_tree").select_by_path(self.paths[event.cursor_row])
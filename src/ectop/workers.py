@@ -0,0 +1,258 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Bounded concurrency for background workers.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ectop.constants import DEFAULT_WORKER_LIMIT, WORKER_LIMITS
+
+if TYPE_CHECKING:
+    from textual.app import App
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class WorkerLimiter:
+    """
+    Per-category concurrency limits for blocking background work.
+
+    Limits are applied when a job is submitted. A job runs at once if its
+    category has a free slot. Otherwise it is parked in the category queue
+    without holding a thread, and the thread that frees the next slot runs
+    it, so no more than the limit of threads ever work on a category. An
+    identical job already waiting is not queued twice. Coalescing jobs are
+    dropped instead of queued. Slots are re-entrant per thread, so a job
+    that calls another function of the same category runs it inline.
+
+    .. note::
+        If you modify features, API, or usage, you MUST update the documentation immediately.
+
+    Attributes
+    ----------
+    dropped : int
+        Number of coalescing jobs dropped because their category was busy.
+    last_error : BaseException | None
+        The last exception raised by a job that ran from the queue.
+    """
+
+    def __init__(self, limits: dict[str, int], default_limit: int = DEFAULT_WORKER_LIMIT) -> None:
+        """
+        Initialize the WorkerLimiter.
+
+        Parameters
+        ----------
+        limits : dict[str, int]
+            Maximum number of concurrent jobs per category.
+        default_limit : int, optional
+            Limit for categories not listed in `limits`, by default DEFAULT_WORKER_LIMIT.
+        """
+        self.limits: dict[str, int] = dict(limits)
+        self.default_limit: int = default_limit
+        self._lock = threading.Lock()
+        self._pending: dict[str, deque[functools.partial[Any]]] = defaultdict(deque)
+        self._running: dict[str, int] = defaultdict(int)
+        self._local = threading.local()
+        self.dropped: int = 0
+        self.last_error: BaseException | None = None
+
+    def run(self, category: str, job: functools.partial[Any], coalesce: bool = False) -> Any:
+        """
+        Run a job in a category slot, or queue it until a slot is free.
+
+        Parameters
+        ----------
+        category : str
+            The job category.
+        job : functools.partial[Any]
+            The job, with its arguments bound.
+        coalesce : bool, optional
+            Drop the job instead of queuing it if the category is busy, by default False.
+
+        Returns
+        -------
+        Any
+            The result of the job, or None if it was queued or dropped.
+        """
+        held: set[str] = getattr(self._local, "held", set())
+        self._local.held = held
+        if category in held:
+            return job()
+
+        with self._lock:
+            if self._running[category] >= self.limits.get(category, self.default_limit):
+                if coalesce:
+                    self.dropped += 1
+                elif not any(_same_job(job, other) for other in self._pending[category]):
+                    self._pending[category].append(job)
+                return None
+            self._running[category] += 1
+
+        try:
+            return self._hold(held, category, job)
+        finally:
+            while (queued := self._release(category)) is not None:
+                try:
+                    self._hold(held, category, queued)
+                except Exception as e:
+                    self.last_error = e
+
+    def _hold(self, held: set[str], category: str, job: functools.partial[Any]) -> Any:
+        """Run a job while marking its category as held by this thread."""
+        held.add(category)
+        try:
+            return job()
+        finally:
+            held.discard(category)
+
+    def _release(self, category: str) -> functools.partial[Any] | None:
+        """
+        Free a slot, or hand it over to the next queued job.
+
+        Parameters
+        ----------
+        category : str
+            The job category.
+
+        Returns
+        -------
+        functools.partial[Any] | None
+            The queued job the caller now runs in the slot, or None.
+        """
+        with self._lock:
+            if self._pending[category]:
+                return self._pending[category].popleft()
+            self._running[category] -= 1
+            return None
+
+    @property
+    def queued(self) -> int:
+        """
+        Number of jobs waiting for a slot across all categories.
+
+        Returns
+        -------
+        int
+            The queue depth.
+        """
+        with self._lock:
+            return sum(len(jobs) for jobs in self._pending.values())
+
+    @property
+    def running(self) -> int:
+        """
+        Number of jobs currently holding a slot across all categories.
+
+        Returns
+        -------
+        int
+            The number of running jobs.
+        """
+        with self._lock:
+            return sum(self._running.values())
+
+    def busy(self, exclude: tuple[str, ...] = ()) -> bool:
+        """
+        Whether any job outside the given categories is running or waiting.
+
+        Parameters
+        ----------
+        exclude : tuple[str, ...], optional
+            Categories to ignore, by default ().
+
+        Returns
+        -------
+        bool
+            True if other work is in progress.
+        """
+        with self._lock:
+            return any(count > 0 for category, count in self._running.items() if category not in exclude) or any(
+                jobs for category, jobs in self._pending.items() if category not in exclude
+            )
+
+
+def _same_job(job: functools.partial[Any], other: functools.partial[Any]) -> bool:
+    """Whether two jobs call the same function with the same arguments."""
+    try:
+        return bool(job.func == other.func and job.args == other.args and job.keywords == other.keywords)
+    except Exception:
+        return False
+
+
+worker_limiter = WorkerLimiter(WORKER_LIMITS)
+"""Process-wide limiter shared by all ectop workers."""
+
+
+def limited(category: str, coalesce: bool = False) -> Callable[[F], F]:
+    """
+    Run the decorated function inside a `worker_limiter` slot.
+
+    Apply it beneath ``@work(thread=True)``. If the category is full, the
+    call is queued and its worker thread ends at once; the call then runs in
+    the thread of the worker that frees the next slot.
+
+    Parameters
+    ----------
+    category : str
+        The job category, a key of `WORKER_LIMITS`.
+    coalesce : bool, optional
+        Skip the call if the category is full, by default False.
+
+    Returns
+    -------
+    Callable[[F], F]
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return worker_limiter.run(category, functools.partial(func, *args, **kwargs), coalesce=coalesce)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def call_on_main(app: App, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call a UI-related function from either the main thread or a worker.
+
+    Parameters
+    ----------
+    app : App
+        The running Textual app.
+    callback : Callable[..., Any]
+        The function to call.
+    *args : Any
+        Positional arguments.
+    **kwargs : Any
+        Keyword arguments.
+
+    Returns
+    -------
+    Any
+        The result of the call.
+    """
+    try:
+        # Check if we are on the main thread.
+        # Using private access as Textual doesn't provide a public way yet.
+        if app._thread_id == threading.get_ident():
+            return callback(*args, **kwargs)
+    except (AttributeError, RuntimeError):
+        # App might not be fully initialized in some tests
+        pass
+
+    return app.call_from_thread(callback, *args, **kwargs)
@@ -5,6 +5,8 @@
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 
 # Create dummy types for ecflow classes so isinstance() works
 class MockNode:
@@ -32,11 +34,23 @@ class MockSuite(MockNode):
         self.nodes = []
 
 
+class MockDefs:
+    def __init__(self):
+        self.suites = []
+
+    def save_as_checkpt(self, path: str) -> None:
+        pass
+
+    def restore_from_checkpt(self, path: str) -> None:
+        pass
+
+
 # Mock ecflow globally
 mock_ecflow = MagicMock()
 mock_ecflow.Node = MockNode
 mock_ecflow.Family = MockFamily
 mock_ecflow.Suite = MockSuite
+mock_ecflow.Defs = MockDefs
 sys.modules["ecflow"] = mock_ecflow
 
 
@@ -50,3 +64,10 @@ def mock_work(*args, **kwargs):
 import textual  # noqa: E402, I001
 
 textual.work = mock_work
+
+
+@pytest.fixture(autouse=True)
+def isolated_state_cache(tmp_path, monkeypatch):
+    """Keep persisted snapshots, UI state and configuration of test apps out of the user directories."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
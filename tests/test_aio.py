@@ -0,0 +1,126 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the asyncio client facade.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ectop.aio import AsyncEcflowClient
+from ectop.workers import worker_limiter
+
+
+@pytest.mark.asyncio
+async def test_async_file_runs_off_loop() -> None:
+    """Test that calls run on the executor, not the event loop thread."""
+    client = MagicMock()
+    loop_thread = threading.get_ident()
+    client.file.side_effect = lambda path, file_type: f"{file_type}@{threading.get_ident() != loop_thread}"
+    aclient = AsyncEcflowClient(client)
+    try:
+        assert await aclient.file("/s/t", "jobout") == "jobout@True"
+    finally:
+        aclient.close()
+
+
+@pytest.mark.asyncio
+async def test_async_files_fan_out() -> None:
+    """Test that several files are fetched concurrently and errors are returned per file."""
+    client = MagicMock()
+    barrier = threading.Barrier(3, timeout=2)
+
+    def fetch(path: str, file_type: str) -> str:
+        barrier.wait()
+        if file_type == "job":
+            raise RuntimeError("no job")
+        return file_type
+
+    client.file.side_effect = fetch
+    aclient = AsyncEcflowClient(client)
+    try:
+        results = await aclient.files("/s/t", ["jobout", "script", "job"])
+    finally:
+        aclient.close()
+    assert results["jobout"] == "jobout"
+    assert results["script"] == "script"
+    assert isinstance(results["job"], RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_async_timeout() -> None:
+    """Test that slow calls raise RuntimeError after the timeout."""
+    client = MagicMock()
+    client.sync_local.side_effect = lambda: time.sleep(0.5)
+    aclient = AsyncEcflowClient(client, timeout=0.05)
+    try:
+        with pytest.raises(RuntimeError, match="sync_local timed out"):
+            await aclient.sync_local()
+    finally:
+        aclient.close()
+
+
+@pytest.mark.asyncio
+async def test_async_cancellation() -> None:
+    """Test that cancelling the awaiting task returns immediately."""
+    client = MagicMock()
+    client.get_defs.side_effect = lambda: time.sleep(0.5)
+    aclient = AsyncEcflowClient(client)
+    try:
+        task = asyncio.create_task(aclient.get_defs())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        start = time.perf_counter()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.perf_counter() - start < 0.25
+    finally:
+        aclient.close()
+
+
+@pytest.mark.asyncio
+async def test_async_command() -> None:
+    """Test that named node commands are dispatched to the client."""
+    client = MagicMock()
+    aclient = AsyncEcflowClient(client)
+    try:
+        await aclient.command("suspend", "/s")
+        await aclient.alter("/s", "change", "VAR", "1")
+    finally:
+        aclient.close()
+    client.suspend.assert_called_once_with("/s")
+    client.alter.assert_called_once_with("/s", "change", "VAR", "1")
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_the_worker_limiter() -> None:
+    """Test that calls beyond the async limit are queued in the shared limiter."""
+    client = MagicMock()
+    release = threading.Event()
+    client.file.side_effect = lambda path, file_type: (release.wait(2), file_type)[1]
+    aclient = AsyncEcflowClient(client, max_workers=4)
+    try:
+        with patch.dict(worker_limiter.limits, {"async": 2}):
+            tasks = [asyncio.create_task(aclient.file("/s/t", t)) for t in ("jobout", "script", "job")]
+            for _ in range(50):
+                if worker_limiter.queued == 1:
+                    break
+                await asyncio.sleep(0.01)
+            assert worker_limiter.running == 2
+            assert worker_limiter.queued == 1
+            release.set()
+            assert await asyncio.gather(*tasks) == ["jobout", "script", "job"]
+    finally:
+        aclient.close()
+    assert worker_limiter.running == 0
@@ -0,0 +1,183 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the alert rules and engine.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import ecflow
+import pytest
+
+from ectop.alerts import Alert, AlertEngine, AlertRule, default_alerts_path, load_rules, run_command
+from ectop.app import Ectop
+from ectop.transitions import Transition
+
+RULES = """
+[[rule]]
+name = "oper aborted"
+path = "/oper"
+state = "aborted"
+actions = ["bell", "notify"]
+
+[[rule]]
+name = "main late"
+type = "deadline"
+path = "/oper/main"
+by = "06:30"
+
+[[rule]]
+name = "limit full"
+type = "limit"
+path = "/oper"
+limit = "hpc"
+for = "10m"
+actions = ["command"]
+command = "notify-send 'ectop alert' {message}"
+"""
+
+
+def _defs(nodes: dict[str, object]) -> MagicMock:
+    """Build definitions resolving the given paths."""
+    defs = MagicMock()
+    defs.find_abs_node.side_effect = nodes.get
+    return defs
+
+
+def _limit(value: int, maximum: int) -> MagicMock:
+    """Build an `hpc` limit."""
+    limit = MagicMock()
+    limit.name.return_value = "hpc"
+    limit.value.return_value = value
+    limit.limit.return_value = maximum
+    return limit
+
+
+def test_load_rules(tmp_path) -> None:
+    """Test that rules are parsed and invalid rules are reported."""
+    path = tmp_path / "alerts.toml"
+    path.write_text(RULES)
+    state, deadline, limit = load_rules(str(path))
+    assert state == AlertRule("oper aborted", "state", "/oper", state="aborted", actions=("bell", "notify"))
+    assert (deadline.by, deadline.state) == ("06:30", "complete")
+    assert (limit.limit, limit.duration, limit.actions) == ("hpc", 600.0, ("command",))
+
+    path.write_text('[[rule]]\ntype = "deadline"\npath = "/s"\nby = "6h"\n')
+    with pytest.raises(RuntimeError, match="HH:MM"):
+        load_rules(str(path))
+    path.write_text('[[rule]]\npath = "/s"\nstate = "aborted"\nactions = ["command"]\ncommand = "echo \'{path}"\n')
+    with pytest.raises(RuntimeError, match="invalid 'command'"):
+        load_rules(str(path))
+    path.write_text('[[rule]]\npath = "/s"\nstate = "aborted"\nactions = ["email"]\n')
+    with pytest.raises(RuntimeError, match="unknown actions"):
+        load_rules(str(path))
+    with pytest.raises(RuntimeError, match="Invalid alert rules"):
+        load_rules(str(tmp_path / "missing.toml"))
+
+    with patch.dict(os.environ, {"XDG_CONFIG_HOME": "/cfg"}):
+        assert default_alerts_path() == "/cfg/ectop/alerts.toml"
+
+
+def test_state_rules_match_changed_descendants() -> None:
+    """Test that state rules fire for changed tasks below their path only."""
+    family = ecflow.Family()
+    defs = _defs({"/oper/f/t": MagicMock(), "/oper/f": family, "/test/t": MagicMock()})
+    rule = AlertRule("oper aborted", "state", "/oper", state="aborted")
+    engine = AlertEngine([rule])
+    alerts = engine.evaluate(
+        defs,
+        [
+            Transition(0.0, "/oper/f/t", "active", "aborted"),
+            Transition(0.0, "/oper/f", "active", "aborted"),
+            Transition(0.0, "/test/t", "active", "aborted"),
+            Transition(0.0, "/oper/f/u", "active", "complete"),
+        ],
+    )
+    assert alerts == [Alert(rule, "/oper/f/t", "oper aborted: /oper/f/t is aborted (was active)")]
+    # Only the nodes of the change set are looked up
+    assert [c.args[0] for c in defs.find_abs_node.call_args_list] == ["/oper/f/t", "/oper/f"]
+
+    engine = AlertEngine([rule._replace(tasks_only=False)])
+    assert len(engine.evaluate(defs, [Transition(0.0, "/oper/f", "active", "aborted")])) == 1
+
+
+def test_deadline_fires_once_a_day() -> None:
+    """Test that a deadline fires once past its time while the node is not complete."""
+    node = MagicMock()
+    node.get_state.return_value = "active"
+    defs = _defs({"/oper/main": node})
+    engine = AlertEngine([AlertRule("main late", "deadline", "/oper/main", state="complete", by="06:30")])
+
+    def at(day: int, hour: int, minute: int) -> float:
+        return datetime(2026, 10, day, hour, minute).timestamp()
+
+    assert engine.evaluate(defs, [], now=at(19, 6, 29)) == []
+    assert "is active, not complete by 06:30" in engine.evaluate(defs, [], now=at(19, 6, 31))[0].message
+    assert engine.evaluate(defs, [], now=at(19, 7, 0)) == []
+    node.get_state.return_value = "complete"
+    assert engine.evaluate(defs, [], now=at(20, 7, 0)) == []
+    node.get_state.return_value = "queued"
+    assert len(engine.evaluate(defs, [], now=at(20, 7, 1))) == 1
+
+
+def test_limit_full_for_duration() -> None:
+    """Test that a limit fires once it has been full long enough, and again after it freed up."""
+    node = MagicMock()
+    node.limits = [_limit(4, 4)]
+    engine = AlertEngine([AlertRule("limit full", "limit", "/oper", limit="hpc", duration=600.0)])
+    defs = _defs({"/oper": node})
+
+    assert engine.evaluate(defs, [], now=0.0) == []
+    assert engine.evaluate(defs, [], now=599.0) == []
+    alerts = engine.evaluate(defs, [], now=600.0)
+    assert alerts[0].message == "limit full: limit hpc on /oper full (4/4) for 10 min"
+    assert engine.evaluate(defs, [], now=1200.0) == []
+
+    node.limits = [_limit(3, 4)]
+    assert engine.evaluate(defs, [], now=1300.0) == []
+    node.limits = [_limit(4, 4)]
+    assert engine.evaluate(defs, [], now=1400.0) == []
+    assert len(engine.evaluate(defs, [], now=2000.0)) == 1
+
+
+def test_run_command() -> None:
+    """Test that the command hook is started with the alert substituted, without a shell."""
+    rule = AlertRule("r", "state", "/s", state="aborted", actions=("command",), command="notify-send 'ectop {name}' {message}")
+    alert = Alert(rule, "/s/t", "/s/t is aborted")
+    with patch("ectop.alerts.subprocess.Popen") as popen:
+        run_command(alert)
+    assert popen.call_args.args[0] == ["notify-send", "ectop r", "/s/t is aborted"]
+    # Only the known placeholders are substituted, other braces are passed through
+    awk = rule._replace(command="awk '{print $1}' {path} {other} {message}")
+    with patch("ectop.alerts.subprocess.Popen") as popen:
+        run_command(Alert(awk, "/s/t", "{path}"))
+    assert popen.call_args.args[0] == ["awk", "{print $1}", "/s/t", "{other}", "{path}"]
+    with patch("ectop.alerts.subprocess.Popen", side_effect=FileNotFoundError("missing")):
+        with pytest.raises(RuntimeError, match="Failed to run alert command"):
+            run_command(alert)
+
+
+def test_app_dispatches_alert_actions(tmp_path) -> None:
+    """Test that the app loads its rules file and takes the actions of fired alerts."""
+    path = tmp_path / "alerts.toml"
+    path.write_text(RULES)
+    app = Ectop(alerts_path=str(path))
+    app._load_alert_rules()
+    assert len(app.alert_engine.rules) == 3
+
+    app.call_from_thread = MagicMock()
+    rule = app.alert_engine.rules[0]
+    with patch("ectop.app.run_command") as run:
+        app._dispatch_alerts([Alert(rule, "/oper/t", "aborted")])
+    run.assert_not_called()
+    called = [c.args[0] for c in app.call_from_thread.call_args_list]
+    assert called == [app.bell, app.notify]
@@ -16,6 +16,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ectop.app import Ectop
+from ectop.transitions import Transition
 
 
 @pytest.fixture
@@ -72,3 +73,27 @@ async def test_action_refresh_logic(app: Ectop) -> None:
         calls = [c.args for c in mock_call.call_args_list]
         # One of the calls should be status_bar.update_status
         assert any(mock_sb.update_status in call for call in calls)
+
+
+def test_action_refresh_updates_timeline_off_ui_thread(app: Ectop) -> None:
+    """Test that the timeline is looked up in the refresh worker, only when the shown subtree changed."""
+    content = MagicMock(timeline_path="/s/f", details=None)
+    app.ecflow_client.get_defs.return_value = None
+
+    def query_one(selector, type=None):
+        return content if "#main_content" in selector else MagicMock()
+
+    with (
+        patch.object(app, "query_one", side_effect=query_one),
+        patch.object(app, "call_from_thread") as mock_call,
+        patch.object(app.transitions, "for_path", return_value=["t"]) as for_path,
+    ):
+        with patch.object(app.transitions, "observe", return_value=[Transition(1.0, "/s/g/t", "queued", "active")]):
+            app.action_refresh()
+        for_path.assert_not_called()
+        assert not any(c.args[0] is content.show_timeline for c in mock_call.call_args_list)
+
+        with patch.object(app.transitions, "observe", return_value=[Transition(1.0, "/s/f/t", "queued", "active")]):
+            app.action_refresh()
+        for_path.assert_called_once_with("/s/f", descendants=True)
+        mock_call.assert_any_call(content.show_timeline, "/s/f", ["t"])
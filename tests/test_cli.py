@@ -8,10 +8,32 @@ from ectop.cli import main
 def test_cli_args():
     """Test that CLI arguments are correctly passed to the App."""
     with patch("argparse.ArgumentParser.parse_args") as mock_args:
-        mock_args.return_value = MagicMock(host="otherhost", port=9999, refresh=5.0)
+        mock_args.return_value = MagicMock(
+            host="otherhost",
+            port=9999,
+            refresh=5.0,
+            trace="/tmp/trace.jsonl",
+            record=None,
+            replay="/tmp/session",
+            replay_speed=0.0,
+            offline=None,
+            alerts=None,
+            suites=None,
+        )
         with patch("ectop.cli.Ectop") as mock_app:
             main()
-            mock_app.assert_called_once_with(host="otherhost", port=9999, refresh_interval=5.0)
+            mock_app.assert_called_once_with(
+                host="otherhost",
+                port=9999,
+                refresh_interval=5.0,
+                trace_path="/tmp/trace.jsonl",
+                record_dir=None,
+                replay_dir="/tmp/session",
+                replay_speed=0.0,
+                offline_path=None,
+                alerts_path=None,
+                suites=None,
+            )
             mock_app.return_value.run.assert_called_once()
 
 
@@ -23,4 +45,15 @@ def test_cli_env_vars():
         with patch("sys.argv", ["ectop"]):
             with patch("ectop.cli.Ectop") as mock_app:
                 main()
-                mock_app.assert_called_once_with(host="envhost", port=8888, refresh_interval=3.0)
+                mock_app.assert_called_once_with(
+                    host="envhost",
+                    port=8888,
+                    refresh_interval=3.0,
+                    trace_path=None,
+                    record_dir=None,
+                    replay_dir=None,
+                    replay_speed=1.0,
+                    offline_path=None,
+                    alerts_path=None,
+                    suites=None,
+                )
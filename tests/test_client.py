@@ -1,6 +1,7 @@
 # .. note:: warning: "If you modify features, API, or usage, you MUST update the documentation immediately."
 from unittest.mock import MagicMock, patch
 
+import ecflow
 import pytest
 
 from ectop.client import EcflowClient  # noqa: E402
@@ -162,3 +163,78 @@ def test_client_requeue_failure():
         mock_client.return_value.requeue.side_effect = RuntimeError("Error")
         with pytest.raises(RuntimeError, match="Failed to requeue /path"):
             client.requeue("/path")
+
+
+def test_client_get_defs_returns_detached_copy():
+    """Test that workers get a copy of the Defs taken once per sync, not the object syncs modify."""
+    live = ecflow.Defs()
+    with patch("ectop.client.ecflow.Client") as mock_client, patch("ectop.client.copy_defs", side_effect=lambda d: object()):
+        mock_client.return_value.get_defs.return_value = live
+        client = EcflowClient()
+        first = client.get_defs()
+        assert first is not live
+        assert client.get_defs() is first
+        client.sync_local()
+        assert client.get_defs() is not first
+
+
+def test_client_serializes_stateful_calls():
+    """Test that sync_local calls never overlap on the primary client."""
+    import threading
+    import time
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_sync():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        mock_client.return_value.sync_local.side_effect = slow_sync
+        client = EcflowClient()
+        threads = [threading.Thread(target=client.sync_local) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert peak == 1
+
+
+def test_client_pool_runs_stateless_calls_in_parallel():
+    """Test that file fetches use separate pooled clients, bounded by pool_size."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=2)
+    instances = []
+
+    def make_client(*args):
+        instance = MagicMock()
+        instance.get_file.side_effect = lambda path, file_type: (barrier.wait(), path)[1]
+        instances.append(instance)
+        return instance
+
+    with patch("ectop.client.ecflow.Client", side_effect=make_client):
+        client = EcflowClient(pool_size=2)
+        results = []
+        threads = [threading.Thread(target=lambda p=p: results.append(client.file(p, "jobout"))) for p in ("/a", "/b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Both calls were in flight at once, each on its own pooled client
+        assert sorted(results) == ["/a", "/b"]
+        assert len(instances) == 3
+        instances[0].get_file.assert_not_called()
+
+        # Idle pooled clients are reused rather than recreated
+        barrier = threading.Barrier(1)
+        client.file("/c", "jobout")
+        assert len(instances) == 3
@@ -0,0 +1,186 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for connection health tracking, backoff and the circuit breaker.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ectop.app import Ectop
+from ectop.client import ConnectionHealth, EcflowClient
+from ectop.constants import CONN_CONNECTED, CONN_DEGRADED, CONN_DOWN, CONN_HALF_OPEN
+from ectop.widgets.statusbar import StatusBar
+
+
+def test_health_backoff_and_circuit() -> None:
+    """Test state transitions and exponential backoff."""
+    now = [100.0]
+    with patch("ectop.client.time.monotonic", side_effect=lambda: now[0]):
+        health = ConnectionHealth(failure_threshold=3, backoff_initial=1.0, backoff_max=3.0)
+        assert health.state == CONN_CONNECTED
+        assert health.retry_in() is None
+
+        health.record_failure()
+        assert health.state == CONN_DEGRADED
+        assert health.allow_request()
+        assert health.retry_in() == 1.0
+
+        health.record_failure()
+        health.record_failure()
+        assert health.state == CONN_DOWN
+        # 1 * 2**2 = 4, capped at 3
+        assert health.retry_in() == 3.0
+        assert not health.allow_request()
+        assert not health.retry_due()
+
+        now[0] += 3.0
+        assert health.retry_due()
+        assert health.allow_request()
+        assert health.state == CONN_HALF_OPEN
+        assert not health.retry_due()
+
+        health.record_success()
+        assert health.state == CONN_CONNECTED
+        assert health.failures == 0
+
+
+def test_client_fails_fast_when_down() -> None:
+    """Test that calls are refused without touching the server while the circuit is open."""
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        server = mock_client.return_value
+        server.sync_local.side_effect = RuntimeError("Connection refused")
+        client = EcflowClient("h", 1)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                client.sync_local()
+        assert client.health.state == CONN_DOWN
+
+        with pytest.raises(RuntimeError, match="server h:1 is down"):
+            client.file("/s/t", "jobout")
+        server.get_file.assert_not_called()
+
+
+def test_half_open_admits_a_single_probe() -> None:
+    """Test that only the first caller after the retry time reaches the server."""
+    now = [100.0]
+    with patch("ectop.client.time.monotonic", side_effect=lambda: now[0]):
+        health = ConnectionHealth(failure_threshold=1, backoff_initial=1.0, backoff_max=8.0)
+        health.record_failure()
+        now[0] += 1.0
+        assert [health.allow_request() for _ in range(3)] == [True, False, False]
+        assert health.state == CONN_HALF_OPEN
+        assert health.retry_in() is None
+
+        # A failed probe reopens the circuit with a longer backoff
+        health.record_failure()
+        assert health.state == CONN_DOWN
+        assert health.retry_in() == 2.0
+        assert not health.allow_request()
+
+        now[0] += 2.0
+        assert health.allow_request()
+        health.record_success()
+        assert [health.allow_request() for _ in range(3)] == [True, True, True]
+
+        # A probe that ends without a verdict hands the probe to the next caller
+        health.record_failure()
+        now[0] += 1.0
+        assert health.allow_request()
+        health.release_probe()
+        assert health.state == CONN_DOWN
+        assert health.allow_request()
+
+
+def test_client_probes_once_and_reads_local_defs_while_down() -> None:
+    """Test that concurrent callers fail fast behind the probe and get_defs is never refused."""
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        server = mock_client.return_value
+        server.sync_local.side_effect = RuntimeError("Connection refused")
+        client = EcflowClient("h", 1)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                client.sync_local()
+        assert client.health.state == CONN_DOWN
+        assert client.get_defs() is server.get_defs.return_value
+
+        def probe() -> None:
+            # Another caller arrives while the probe is still in flight
+            with pytest.raises(RuntimeError, match="server h:1 is down, a reconnect probe is in flight"):
+                client.file("/s/t", "jobout")
+            assert client.get_defs() is server.get_defs.return_value
+
+        client.health._next_retry = 0.0
+        server.ping.side_effect = probe
+        client.ping()
+        server.get_file.assert_not_called()
+        assert client.health.state == CONN_CONNECTED
+
+
+def test_local_calls_do_not_reset_failures() -> None:
+    """Test that reading the local definitions between failed syncs does not reset the circuit."""
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        mock_client.return_value.sync_local.side_effect = RuntimeError("Connection refused")
+        client = EcflowClient("h", 1)
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                client.sync_local()
+            client.get_defs()
+        with pytest.raises(RuntimeError):
+            client.sync_local()
+        assert client.health.state == CONN_DOWN
+
+
+def test_non_connectivity_errors_do_not_trip_circuit() -> None:
+    """Test that a missing file does not count as a connection failure."""
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        mock_client.return_value.get_file.side_effect = RuntimeError("no such file")
+        client = EcflowClient()
+        for _ in range(5):
+            with pytest.raises(RuntimeError):
+                client.file("/s/t", "jobout")
+        assert client.health.state == CONN_CONNECTED
+
+
+def test_statusbar_connection_display() -> None:
+    """Test that the status bar shows the state and retry timer."""
+    bar = StatusBar()
+    bar.update_connection(CONN_DOWN, 12.4)
+    plain = bar.render().plain
+    assert "Link: down" in plain
+    assert "retry in 12s" in plain
+
+    bar.update_connection(CONN_CONNECTED, None)
+    assert "retry in" not in bar.render().plain
+
+
+@pytest.mark.asyncio
+async def test_health_tick_reconnects() -> None:
+    """Test that the health tick probes the server and refreshes once reachable."""
+    app = Ectop()
+    app.call_from_thread = lambda f, *args, **kwargs: f(*args, **kwargs)
+    app.notify = MagicMock()
+    app.action_refresh = MagicMock()
+    status_bar = MagicMock()
+    app.query_one = MagicMock(return_value=status_bar)
+
+    client = MagicMock()
+    client.health = ConnectionHealth()
+    client.health.record_failure()
+    client.health._next_retry = 0.0
+    client.ping.side_effect = client.health.record_success
+    app.ecflow_client = client
+
+    app._health_tick()
+
+    status_bar.update_connection.assert_called_once_with(CONN_DEGRADED, 0.0)
+    client.ping.assert_called_once()
+    app.action_refresh.assert_called_once()
@@ -0,0 +1,105 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the node attributes shown in the Details tab.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import ecflow
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from ectop.nodes import NodeDetails, node_details
+from ectop.widgets.content import MainContent
+
+
+def _attribute(**values: object) -> MagicMock:
+    """Build an attribute whose methods return the given values."""
+    attribute = MagicMock()
+    for name, value in values.items():
+        getattr(attribute, name).return_value = value
+    return attribute
+
+
+def _task() -> MagicMock:
+    """Build a task with one attribute of each kind."""
+    node = MagicMock()
+    node.get_state.return_value = "active"
+    node.events = [_attribute(name_or_number="done", value=True)]
+    node.meters = [_attribute(name="step", min=0, max=10, value=5)]
+    node.labels = [_attribute(name="info", value="initial", new_value="")]
+    node.get_repeat.return_value = _attribute(empty=False, name="YMD", value=20261019, start=20261001, end=20261031, step=1)
+    node.limits = []
+    node.inlimits = [_attribute(name="hpc", path_to_node="/s", tokens=1)]
+    node.get_late.return_value = _attribute(is_late=True, __str__="late -c +01:00")
+    node.get_flag.return_value = _attribute(__str__="late")
+    return node
+
+
+def test_node_details() -> None:
+    """Test that the attributes are collected from the definitions."""
+    family = ecflow.Family()
+    family.get_state = lambda: "queued"
+    defs = MagicMock()
+    defs.find_abs_node.side_effect = {"/s/t": _task(), "/s/f": family}.get
+
+    details = node_details(defs, "/s/t")
+    assert details == NodeDetails(
+        "/s/t",
+        "task",
+        "active",
+        events=(("done", True),),
+        meters=(("step", 0, 10, 5),),
+        labels=(("info", "initial"),),
+        repeat=("YMD", "20261019", "20261001", "20261031", "1"),
+        inlimits=(("hpc", "/s", 1),),
+        late="late -c +01:00",
+        is_late=True,
+        flags="late",
+    )
+    assert node_details(defs, "/s/f") == NodeDetails("/s/f", "family", "queued")
+    assert node_details(defs, "/s/x") is None
+    assert node_details(None, "/s/t") is None
+
+
+class ContentApp(App):
+    """Minimal app hosting the content area."""
+
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_details_tab_repaints_on_change() -> None:
+    """Test that the Details tab shows the attributes and only repaints when they change."""
+    app = ContentApp()
+    async with app.run_test():
+        content = app.query_one(MainContent)
+        defs = MagicMock()
+        task = _task()
+        defs.find_abs_node.return_value = task
+
+        assert content.show_details(node_details(defs, "/s/t"))
+        text = str(content.query_one("#view_details", Static).render())
+        assert "● done" in text
+        assert "step " + "█" * 12 + "░" * 12 + " 5 / 10" in text
+        assert "YMD = 20261019  (20261001 .. 20261031, step 1)" in text
+        assert "/s:hpc  1 token" in text
+        assert "late!" in text
+
+        assert not content.show_details(node_details(defs, "/s/t"))
+        task.meters = [_attribute(name="step", min=0, max=10, value=10)]
+        assert content.show_details(node_details(defs, "/s/t"))
+        assert "█" * 24 + " 10 / 10" in str(content.query_one("#view_details", Static).render())
+
+        assert content.show_details(None)
+        assert "not found" in str(content.query_one("#view_details", Static).render())
@@ -0,0 +1,156 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the diff engine, the Diff tab and try diffs.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.app import App, ComposeResult
+
+from ectop.app import Ectop
+from ectop.diff import Opcode, diff_lines
+from ectop.tries import OutputHistory, try_number
+from ectop.widgets.content import MainContent
+from ectop.widgets.diffview import DiffView
+
+
+def _apply(a: Sequence[str], b: Sequence[str], opcodes: list[Opcode]) -> list[str]:
+    """Rebuild b from a and the opcodes, checking that they tile both sides."""
+    out: list[str] = []
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+            out.extend(a[i1:i2])
+        else:
+            out.extend(b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return out
+
+
+def test_diff_lines_reconstructs() -> None:
+    """Test that opcodes are valid for random inputs with many repeated lines."""
+    rng = random.Random(42)
+    for _ in range(300):
+        a = [rng.choice("abcde") for _ in range(rng.randint(0, 40))]
+        b = [rng.choice("abcdef") for _ in range(rng.randint(0, 40))]
+        assert _apply(a, b, diff_lines(a, b)) == b
+
+
+def test_diff_lines_large_file() -> None:
+    """Test that a large file with scattered edits is diffed into minimal hunks."""
+    a = [f"line {i}" for i in range(100_000)]
+    b = list(a)
+    b[500] = "edited"
+    b.insert(70_000, "inserted")
+    del b[90_000:90_010]
+    opcodes = diff_lines(a, b)
+    assert _apply(a, b, opcodes) == b
+    assert [op for op in opcodes if op[0] != "equal"] == [
+        ("replace", 500, 501, 500, 501),
+        ("insert", 70_000, 70_000, 70_000, 70_001),
+        ("delete", 89_999, 90_009, 90_000, 90_000),
+    ]
+
+
+def test_output_history_and_try_number() -> None:
+    """Test the output history store and ECF_TRYNO lookup."""
+    history = OutputHistory(maxsize=2)
+    history.put("/s/t", 1, "one")
+    history.put("/s/t", 2, "two")
+    history.put("/s/u", 1, "other")
+    assert history.get("/s/t", 1) is None
+    assert history.get("/s/t", 2) == "two"
+    assert history.tries("/s/t") == [2]
+
+    var = MagicMock()
+    var.name.return_value = "ECF_TRYNO"
+    var.value.return_value = "3"
+    defs = MagicMock()
+    defs.find_abs_node.return_value.get_generated_variables.return_value = [var]
+    assert try_number(defs, "/s/t") == 3
+    assert try_number(None, "/s/t") == 0
+
+
+class DiffApp(App):
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_diff_tab_folds_unchanged_lines() -> None:
+    """Test that the Diff tab folds long unchanged runs and navigates hunks."""
+    app = DiffApp()
+    async with app.run_test() as pilot:
+        content_area = app.query_one(MainContent)
+        old = "\n".join(f"line {i}" for i in range(100))
+        new = old.replace("line 50\n", "line fifty\n")
+        content_area.show_diff("Script → Job", old, new)
+        await pilot.pause()
+
+        view = app.query_one("#view_diff", DiffView)
+        assert content_area.active == "tab_diff"
+        # fold, 3 context, -1, +1, 3 context, fold
+        assert view.row_count == 10
+        assert view.row_text(0).plain.strip() == "⋯ 47 unchanged lines"
+        assert view.row_text(4).plain.endswith("- line 50")
+        assert view.row_text(5).plain.endswith("+ line fifty")
+        assert view.hunks == [4]
+        assert "1 changes, -1 +1 lines" in str(app.query_one("#diff_title").render())
+
+
+@pytest.mark.asyncio
+async def test_action_diff_tries_uses_history(tmp_path: Path) -> None:
+    """Test that the try diff reads the previous try from history or its local output file."""
+    app = Ectop()
+    app.get_selected_path = MagicMock(return_value="/s/t")
+    app.notify = MagicMock()
+    content_area = MagicMock()
+    app.query_one = MagicMock(return_value=content_area)
+    app.async_client = MagicMock()
+    app.async_client.sync_local = AsyncMock()
+    app.async_client.get_defs = AsyncMock(return_value=MagicMock())
+    app.async_client.file = AsyncMock(return_value="try 2 output")
+    (tmp_path / "t.1").write_text("try 1 from disk")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("ectop.app.try_number", lambda defs, path: 2)
+        mp.setattr("ectop.app.try_output_paths", lambda defs, path: {})
+        await app.action_diff_tries()
+        app.notify.assert_called_with("Cannot diff tries: Output file of try 1 is unknown", severity="error")
+
+        mp.setattr("ectop.app.try_output_paths", lambda defs, path: {1: str(tmp_path / "t.1"), 2: str(tmp_path / "t.2")})
+        await app.action_diff_tries()
+        content_area.show_diff.assert_called_with("/s/t: Try 1 → Try 2", "try 1 from disk", "try 2 output")
+
+        app.output_history.put("/s/t", 1, "try 1 output")
+        await app.action_diff_tries()
+        content_area.show_diff.assert_called_with("/s/t: Try 1 → Try 2", "try 1 output", "try 2 output")
+
+
+@pytest.mark.asyncio
+async def test_action_diff_script_fetches_both() -> None:
+    """Test that the script diff fetches script and job together."""
+    app = Ectop()
+    app.get_selected_path = MagicMock(return_value="/s/t")
+    content_area = MagicMock()
+    app.query_one = MagicMock(return_value=content_area)
+    app.async_client = MagicMock()
+    app.async_client.files = AsyncMock(return_value={"script": "%include x", "job": "source x"})
+    await app.action_diff_script()
+    app.async_client.files.assert_awaited_once_with("/s/t", ("script", "job"))
+    content_area.show_diff.assert_called_once_with("/s/t: Script → Job", "%include x", "source x")
@@ -0,0 +1,123 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the file cache and the idle prefetcher.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import ecflow
+import pytest
+
+from ectop.app import Ectop
+from ectop.filecache import FileCache
+from ectop.nodes import node_signature, tasks_in_state
+
+
+def _task(path: str, state: str) -> MagicMock:
+    """Build a mocked task node."""
+    node = MagicMock()
+    node.get_abs_node_path.return_value = path
+    node.get_state.return_value = state
+    return node
+
+
+def _defs(*tasks: MagicMock) -> MagicMock:
+    """Build mocked Defs with one suite holding the given tasks."""
+    suite = ecflow.Suite()
+    family = ecflow.Family()
+    suite.get_all_nodes = lambda: [family, *tasks]
+    defs = MagicMock()
+    defs.suites = [suite]
+    defs.find_abs_node.side_effect = lambda path: next((t for t in tasks if t.get_abs_node_path() == path), None)
+    return defs
+
+
+def test_file_cache_signature_and_eviction() -> None:
+    """Test signature checks, LRU eviction by size, and invalidation."""
+    cache = FileCache(max_bytes=10)
+    cache.put("/s/a", "jobout", "aaaa", ("complete", 1))
+    assert cache.get("/s/a", "jobout", ("complete", 1)) == "aaaa"
+    assert cache.get("/s/a", "jobout", ("aborted", 2)) is None
+
+    cache.put("/s/b", "jobout", "bbbb")
+    cache.get("/s/a", "jobout", ("complete", 1))
+    cache.put("/s/c", "jobout", "cccc")
+    assert cache.get("/s/b", "jobout") is None
+    assert cache.size == 8
+
+    cache.put("/s/huge", "jobout", "x" * 11)
+    assert cache.get("/s/huge", "jobout") is None
+
+    cache.invalidate("/s/a")
+    assert cache.get("/s/a", "jobout", ("complete", 1)) is None
+    assert cache.size == 4
+
+
+def test_file_cache_ttl() -> None:
+    """Test that entries expire."""
+    cache = FileCache(ttl=10)
+    with patch("ectop.filecache.time.monotonic", return_value=100.0):
+        cache.put("/s/a", "script", "content")
+    with patch("ectop.filecache.time.monotonic", return_value=105.0):
+        assert cache.get("/s/a", "script") == "content"
+    with patch("ectop.filecache.time.monotonic", return_value=111.0):
+        assert cache.get("/s/a", "script") is None
+
+
+def test_node_helpers() -> None:
+    """Test node signatures and the state query."""
+    defs = _defs(_task("/s/t1", "aborted"), _task("/s/t2", "complete"), _task("/s/t3", "aborted"))
+    assert tasks_in_state(defs, "aborted") == ["/s/t1", "/s/t3"]
+    assert tasks_in_state(None, "aborted") == []
+    assert node_signature(defs, "/s/t2") == ("complete", 0)
+    assert node_signature(defs, "/s/missing") is None
+
+
+@pytest.fixture
+def app() -> Ectop:
+    """Create an app with a mocked synchronous client."""
+    app = Ectop(host="localhost", port=3141)
+    app.ecflow_client = MagicMock()
+    app.async_client = None
+    return app
+
+
+def test_prefetch_fills_cache(app: Ectop) -> None:
+    """Test that siblings and aborted tasks are prefetched, skipping running ones."""
+    defs = _defs(_task("/s/t1", "complete"), _task("/s/t2", "active"), _task("/s/t3", "aborted"))
+    app.ecflow_client.get_defs.return_value = defs
+    app.ecflow_client.file.side_effect = lambda path, file_type: f"out {path}"
+
+    with patch("ectop.app.worker_limiter.busy", return_value=False):
+        app._prefetch_worker(["/s/t1", "/s/t2"])
+
+    fetched = [c.args[0] for c in app.ecflow_client.file.call_args_list]
+    assert fetched == ["/s/t1", "/s/t3"]
+    assert app.file_cache.get("/s/t3", "jobout", ("aborted", 0)) == "out /s/t3"
+
+    # Cached outputs are not fetched again
+    app.ecflow_client.file.reset_mock()
+    with patch("ectop.app.worker_limiter.busy", return_value=False):
+        app._prefetch_worker(["/s/t1"])
+    app.ecflow_client.file.assert_not_called()
+
+
+def test_prefetch_yields_to_user_work(app: Ectop) -> None:
+    """Test that prefetching stops while other work is in progress."""
+    app.ecflow_client.get_defs.return_value = _defs(_task("/s/t1", "aborted"))
+    with patch("ectop.app.worker_limiter.busy", return_value=True):
+        app._prefetch_worker([])
+    app.ecflow_client.file.assert_not_called()
+
+    app.async_client = MagicMock(in_flight=1)
+    with patch("ectop.app.worker_limiter.busy", return_value=False):
+        app._prefetch_worker([])
+    app.ecflow_client.file.assert_not_called()
@@ -0,0 +1,98 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the Gantt chart of a family's execution.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App
+
+from ectop.gantt import Bar, aggregate, depth_of, task_bars
+from ectop.transitions import Transition
+from ectop.widgets.gantt import BLOCK_QUEUED, BLOCK_RUN, BLOCK_SUBMITTED, GanttView
+from ectop.widgets.modals.gantt import GanttScreen
+
+
+def _cycle(path: str, start: float, end: str = "complete") -> list[Transition]:
+    """Build a cycle: 10s queued, 10s submitted, 20s running."""
+    return [
+        Transition(start, path, "complete", "queued"),
+        Transition(start + 10, path, "queued", "submitted"),
+        Transition(start + 20, path, "submitted", "active"),
+        Transition(start + 40, path, "active", end),
+    ]
+
+
+def test_task_bars_keep_last_cycle() -> None:
+    """Test that each task gets the phases of its last cycle and families get none."""
+    transitions = [
+        *_cycle("/s/f/a", 0.0),
+        *_cycle("/s/f/a", 100.0, end="aborted"),
+        Transition(5.0, "/s/f", "queued", "active"),
+        Transition(50.0, "/s/g/b", "queued", "submitted"),
+        Transition(60.0, "/s/g/b", "submitted", "active"),
+        Transition(1.0, "/other/t", "queued", "active"),
+    ]
+    transitions.sort()
+    bars = task_bars(transitions, "/s")
+    assert bars == [Bar("/s/g/b", None, 50.0, 60.0, None, "active"), Bar("/s/f/a", 100.0, 110.0, 120.0, 140.0, "aborted")]
+    assert depth_of(bars, "/s") == 2
+
+
+def test_aggregate_by_sub_family() -> None:
+    """Test that zooming out merges tasks into their sub-families."""
+    bars = task_bars(
+        sorted([*_cycle("/s/f/a", 0.0), *_cycle("/s/f/b", 30.0, end="aborted"), *_cycle("/s/t", 5.0)]),
+        "/s",
+    )
+    merged = aggregate(bars, "/s", 1)
+    assert merged == [Bar("/s/f", 0.0, 10.0, 20.0, 70.0, "aborted", 2), Bar("/s/t", 5.0, 15.0, 25.0, 45.0, "complete")]
+    assert aggregate(bars, "/s", 2) == bars
+
+
+@pytest.mark.asyncio
+async def test_gantt_row_rendering() -> None:
+    """Test that a row maps each phase to its columns."""
+    app = App()
+    async with app.run_test():
+        view = GanttView()
+        await app.screen.mount(view)
+        view.set_bars([Bar("/s/f/a", 0.0, 10.0, 20.0, 40.0, "complete")], "/s", now=40.0)
+        segments = view.row_segments(0, 32 + 40)
+        assert segments[0].text.startswith("f/a")
+        chart = "".join(segment.text for segment in segments[1:])
+        assert chart == BLOCK_QUEUED * 10 + BLOCK_SUBMITTED * 10 + BLOCK_RUN * 20
+        assert view.row_segments(1, 72) == []
+
+
+@pytest.mark.asyncio
+async def test_gantt_screen_zoom() -> None:
+    """Test that the screen charts thousands of tasks and zooms out to families."""
+    transitions = []
+    for family in range(50):
+        for task in range(40):
+            transitions.extend(_cycle(f"/s/f{family}/t{task}", float(family + task)))
+    app = App()
+    async with app.run_test() as pilot:
+        screen = GanttScreen("/s", sorted(transitions))
+        await app.push_screen(screen)
+        await pilot.pause()
+        view = screen.query_one(GanttView)
+        assert len(view.bars) == 2000
+        assert view.virtual_size.height == 2000
+
+        await pilot.press("minus")
+        assert screen.depth == 1
+        assert len(view.bars) == 50
+        assert view.bars[0].count == 40
+        await pilot.press("minus")
+        assert screen.depth == 1
+        await pilot.press("plus")
+        assert len(view.bars) == 2000
@@ -0,0 +1,85 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for cached syntax highlighting.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from rich.text import Text
+from textual.widgets import Static
+
+from ectop.highlight import HighlightCache, content_key, gutter_width, render_code
+from ectop.widgets.content import MainContent
+
+
+def test_render_code_gutter() -> None:
+    """Test line numbering and the content offset mapping."""
+    content = "\n".join(f"echo {i}" for i in range(12))
+    text = render_code(content)
+    lines = text.plain.split("\n")
+    assert lines[0] == " 1 echo 0"
+    assert lines[11] == "12 echo 11"
+    assert gutter_width(content) == 3
+    # "echo 5" starts at offset 42 of line 5
+    offset = content.index("echo 5")
+    start = offset + (5 + 1) * gutter_width(content)
+    assert text.plain[start : start + 6] == "echo 5"
+    assert render_code("a\nb\n", highlight=False).plain == "1 a\n2 b"
+
+
+def test_highlight_cache_lru() -> None:
+    """Test that the cache evicts the least recently used entry."""
+    cache = HighlightCache(maxsize=2)
+    cache.put("a", Text("a"))
+    cache.put("b", Text("b"))
+    assert cache.get("a") is not None
+    cache.put("c", Text("c"))
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert content_key("x") == content_key("x") != content_key("y")
+
+
+def _content_with_mock_views() -> tuple[MainContent, MagicMock]:
+    """Build an unmounted MainContent whose Script view is a mock."""
+    mc = MainContent()
+    view = MagicMock(spec=Static)
+    mc.query_one = MagicMock(return_value=view)
+    mc._highlight_worker = MagicMock()
+    return mc, view
+
+
+def test_update_script_uses_cache() -> None:
+    """Test that identical content is rendered once and then served from the cache."""
+    mc, view = _content_with_mock_views()
+    with patch("ectop.widgets.content.render_code", wraps=render_code) as mock_render:
+        mc.update_script("echo cached-once")
+        mc.update_script("echo cached-once")
+        assert mock_render.call_count == 1
+    assert view.update.call_count == 2
+    mc._highlight_worker.assert_not_called()
+
+
+def test_update_script_size_thresholds() -> None:
+    """Test progressive highlighting for mid-size files and plain text for huge ones."""
+    mc, view = _content_with_mock_views()
+    with (
+        patch("ectop.widgets.content.SYNTAX_INLINE_MAX_SIZE", 10),
+        patch("ectop.widgets.content.SYNTAX_HIGHLIGHT_MAX_SIZE", 100),
+        patch("ectop.widgets.content.render_code", wraps=render_code) as mock_render,
+    ):
+        mc.update_script("echo progressive")
+        mock_render.assert_called_with("echo progressive", highlight=False)
+        mc._highlight_worker.assert_called_once()
+
+        mc._highlight_worker.reset_mock()
+        mc.update_job("echo huge " * 20)
+        mock_render.assert_called_with("echo huge " * 20, highlight=False)
+        mc._highlight_worker.assert_not_called()
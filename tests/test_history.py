@@ -0,0 +1,101 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the persistent transition history.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from ectop.history import HistoryStore, Run
+from ectop.transitions import Transition
+from ectop.widgets.content import MainContent
+
+
+def _cycle(path: str, start: float, run_time: float, end: str = "complete") -> list[Transition]:
+    """Build the transitions of one run of a task."""
+    return [
+        Transition(start - 10, path, "complete", "queued"),
+        Transition(start, path, "submitted", "active"),
+        Transition(start + run_time, path, "active", end),
+    ]
+
+
+def test_history_store_runs(tmp_path: Path) -> None:
+    """Test that queued transitions are written and paired into runs."""
+    store = HistoryStore("my host", 3141, directory=str(tmp_path))
+    assert store.db_path == str(tmp_path / "my_host_3141.history.sqlite")
+    assert store.runs("/s/t") == []
+
+    for n in range(40):
+        store.record(_cycle("/s/t", 1000.0 * n, 60.0 + n, end="aborted" if n == 39 else "complete"))
+    # A run that was requeued while active is discarded
+    store.record([Transition(50_000, "/s/t", "queued", "active"), Transition(50_010, "/s/t", "active", "queued")])
+    store.record(_cycle("/s/other", 0.0, 5.0))
+    store.record([])
+    store.close()
+
+    runs = store.runs("/s/t")
+    assert len(runs) == 30
+    assert runs[-1] == Run(39_000.0, 39_099.0, "aborted")
+    assert runs[0].duration == 70.0
+    assert store.runs("/s/other", limit=5) == [Run(0.0, 5.0, "complete")]
+    assert store.last_error is None
+    with sqlite3.connect(store.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM transitions").fetchone() == (125,)
+
+
+def test_history_store_batches_writes(tmp_path: Path) -> None:
+    """Test that transitions recorded in quick succession are written together."""
+    store = HistoryStore("localhost", 3141, directory=str(tmp_path))
+    for n in range(4):
+        store._queue.put(_cycle("/s/t", 100.0 * n, 1.0))
+    store._queue.put(None)
+    with patch("ectop.history.HISTORY_BATCH_SIZE", 6):
+        assert [len(store._next_batch()[0]) for _ in range(2)] == [6, 6]
+    assert store._next_batch() == ([], True)
+
+
+def test_history_store_write_error(tmp_path: Path) -> None:
+    """Test that an unwritable database is reported without raising."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    store = HistoryStore("localhost", 3141, directory=str(blocker))
+    store.record(_cycle("/s/t", 0.0, 1.0))
+    store.close()
+    assert store.last_error is not None
+    assert store.runs("/s/t") == []
+
+
+class ContentApp(App):
+    """Minimal app hosting the content area."""
+
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_run_history_summary() -> None:
+    """Test that past runs are summarized above the timeline."""
+    app = ContentApp()
+    async with app.run_test():
+        content = app.query_one(MainContent)
+        content.show_run_history([Run(0.0, 60.0, "complete"), Run(100.0, 280.0, "aborted")])
+        summary = str(content.query_one("#timeline_runs", Static).render())
+        assert "Last 2 runs: mean 2m00s, min 1m00s" in summary
+        assert "max 3m00s" in summary
+        assert "1 aborted" in summary
+        content.show_run_history([])
+        assert str(content.query_one("#timeline_runs", Static).render()) == ""
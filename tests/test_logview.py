@@ -0,0 +1,106 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the windowed large log viewer.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from textual.app import App, ComposeResult
+
+from ectop.widgets.content import MainContent
+from ectop.widgets.logview import LargeLogView, LineIndex
+
+
+def test_line_index_incremental(tmp_path: Path) -> None:
+    """Test that lines are indexed chunk by chunk and read back from the mapping."""
+    log = tmp_path / "big.log"
+    log.write_bytes(b"alpha\nbeta\r\ngamma")
+    index = LineIndex(str(log))
+
+    assert index.build(chunk_size=8)
+    # Only complete lines are visible while indexing
+    assert index.line_count == 1
+    while index.build(chunk_size=8):
+        pass
+    assert index.complete
+    assert index.line_count == 3
+    assert [index.line(i) for i in range(3)] == ["alpha", "beta", "gamma"]
+    assert index.line(3) == ""
+    assert index.line_at(7) == 1
+    assert index.max_line_length == 5
+
+    with open(log, "ab") as f:
+        f.write(b"\ndelta\n")
+    index.remap()
+    while index.build():
+        pass
+    assert index.line_count == 4
+    assert index.line(3) == "delta"
+    index.close()
+
+
+class LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_large_output_uses_windowed_view() -> None:
+    """Test that large outputs switch to the windowed viewer and support jumps."""
+    app = LogApp()
+    async with app.run_test() as pilot:
+        content_area = app.query_one(MainContent)
+        lines = "\n".join(f"line {i}" for i in range(1000)) + "\n"
+        with patch("ectop.widgets.content.LARGE_LOG_THRESHOLD", 100):
+            content_area.update_log(lines)
+            await pilot.pause()
+
+            view = app.query_one("#log_large", LargeLogView)
+            assert content_area.large_log
+            assert "hidden" not in view.classes
+            assert view.index is not None and view.index.line_count == 1000
+            assert view.render_line(0).text.startswith("line 0")
+
+            content_area.jump_log("500")
+            await pilot.pause()
+            assert view.scroll_offset.y == 499
+
+            content_area.update_log(lines + "line 1000\n", append=True)
+            await pilot.pause()
+            assert view.index.line_count == 1001
+
+            content_area.update_log("small")
+            assert not content_area.large_log
+            assert "hidden" in view.classes
+
+
+@pytest.mark.asyncio
+async def test_large_log_spools_in_worker(tmp_path: Path) -> None:
+    """Test that loading only queues the content, and the worker spools the latest log in order."""
+    app = LogApp()
+    async with app.run_test():
+        view = app.query_one("#log_large", LargeLogView)
+        with patch.object(view, "_spool_worker") as worker, patch("tempfile.tempdir", str(tmp_path)):
+            view.load("old\n")
+            view.load("first\n")
+            view.append("second\n")
+            assert worker.call_count == 3
+            assert view.index is None
+            assert not list(tmp_path.iterdir())
+
+            LargeLogView._spool_worker(view)
+        assert view.index is not None
+        assert [view.index.line(i) for i in range(view.index.line_count)] == ["first", "second"]
+        assert [p.name for p in tmp_path.iterdir()] == [Path(view.index.path).name]
+        view.on_unmount()
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,73 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for offline browsing of checkpoint and definition files.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ectop.app import Ectop
+from ectop.offline import OfflineClient
+
+
+def _defs(**variables: str) -> MagicMock:
+    """Build mocked Defs whose nodes have the given generated variables."""
+    gen_vars = []
+    for name, value in variables.items():
+        var = MagicMock()
+        var.name.return_value = name
+        var.value.return_value = value
+        gen_vars.append(var)
+    defs = MagicMock()
+    defs.find_abs_node.return_value.get_generated_variables.return_value = gen_vars
+    return defs
+
+
+def test_offline_client_serves_file(tmp_path: Path) -> None:
+    """Test that the file is parsed once and node files are read from disk."""
+    checkpoint = tmp_path / "prod.check"
+    checkpoint.write_text("")
+    jobout = tmp_path / "t.1"
+    jobout.write_text("one\ntwo\nthree\n")
+    defs = _defs(ECF_JOBOUT=str(jobout))
+
+    with patch("ectop.offline.load_defs_file", return_value=defs) as mock_load:
+        client = OfflineClient(str(checkpoint))
+        client.ping()
+        client.sync_local()
+        assert client.get_defs() is defs
+        mock_load.assert_called_once_with(str(checkpoint))
+
+        assert client.host == "prod.check"
+        assert client.server_version() == "offline: prod.check"
+        assert client.file("/s/t", "jobout") == "one\ntwo\nthree\n"
+        assert client.file("/s/t", "jobout", max_lines=2) == "two\nthree"
+        with pytest.raises(RuntimeError, match="no location of script"):
+            client.file("/s/t", "script")
+        with pytest.raises(RuntimeError, match="read-only"):
+            client.requeue("/s/t")
+
+
+def test_offline_client_missing_file(tmp_path: Path) -> None:
+    """Test that a missing file is reported on creation."""
+    with pytest.raises(RuntimeError, match="does not exist"):
+        OfflineClient(str(tmp_path / "missing.def"))
+
+
+def test_app_uses_offline_client(tmp_path: Path) -> None:
+    """Test that the app browses the file without touching the server state cache."""
+    definition = tmp_path / "suite.def"
+    definition.write_text("")
+    app = Ectop(offline_path=str(definition))
+    assert app.state_cache is None
+    assert isinstance(app._create_client(), OfflineClient)
@@ -0,0 +1,124 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for session recording and replay.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ectop.client import EcflowClient
+from ectop.replay import ReplayClient, SessionRecorder
+
+
+def _record_session(directory: Path) -> None:
+    """Record a short session against a mocked server."""
+    recorder = SessionRecorder(str(directory), "prod", 4141)
+    with (
+        patch("ectop.client.ecflow.Client") as mock_client,
+        patch("ectop.replay.dump_defs", return_value=b"snapshot") as mock_dump,
+    ):
+        server = mock_client.return_value
+        server.get_file.side_effect = ["log try 1", "echo script", "log try 2"]
+        server.get_defs.return_value = MagicMock()
+        client = EcflowClient("prod", 4141, tracer=recorder)
+
+        client.sync_local()
+        client.get_defs()
+        client.get_defs()
+        client.file("/s/t", "jobout")
+        client.file("/s/t", "script")
+        client.sync_local()
+        client.get_defs()
+        client.file("/s/t", "jobout")
+        server.ping.side_effect = RuntimeError("down")
+        with pytest.raises(RuntimeError):
+            client.ping()
+
+        # get_defs without an intervening sync reuses the previous snapshot
+        assert mock_dump.call_count == 2
+    recorder.close()
+
+
+def test_recorder_writes_session(tmp_path: Path) -> None:
+    """Test that the recorder writes the call log and Defs snapshots."""
+    _record_session(tmp_path)
+    assert (tmp_path / "session.jsonl").exists()
+    assert sorted(p.name for p in (tmp_path / "defs").iterdir()) == ["00001.check.gz", "00002.check.gz"]
+
+
+def test_replay_serves_recorded_responses(tmp_path: Path) -> None:
+    """Test that replay returns responses in recording order, keyed by file type."""
+    _record_session(tmp_path)
+    client = ReplayClient(str(tmp_path), speed=0)
+    assert (client.host, client.port) == ("prod", 4141)
+
+    assert client.file("/s/t", "jobout") == "log try 1"
+    assert client.file("/s/t", "jobout") == "log try 2"
+    # Exhausted keys keep serving the last response
+    assert client.file("/s/t", "jobout") == "log try 2"
+    assert client.file("/s/t", "script") == "echo script"
+
+    with pytest.raises(RuntimeError, match="Failed to retrieve job for /s/t"):
+        client.file("/s/t", "job")
+    with pytest.raises(RuntimeError, match="Failed to ping ecFlow server at prod:4141: down"):
+        client.ping()
+
+    # Unrecorded control commands are accepted without effect
+    client.suspend("/s/t")
+
+
+def test_replay_loads_snapshots(tmp_path: Path) -> None:
+    """Test that get_defs restores recorded snapshots and caches them."""
+    _record_session(tmp_path)
+    client = ReplayClient(str(tmp_path), speed=0)
+    with patch("ectop.replay.load_defs", side_effect=lambda data: ("defs", data)) as mock_load:
+        first = client.get_defs()
+        second = client.get_defs()
+        assert first == ("defs", b"snapshot")
+        assert first is second
+        assert mock_load.call_count == 1
+
+
+def test_replay_follows_recorded_offsets(tmp_path: Path) -> None:
+    """Test that responses are held until their scaled recorded completion time."""
+    _record_session(tmp_path)
+    client = ReplayClient(str(tmp_path), speed=2.0)
+    backend = client.client
+    with patch("ectop.replay.time.monotonic", return_value=backend._t0 + 1.0):
+        # Recorded 3s into the session, taking 1s: due 2s after start at double speed
+        assert backend._delay({"offset": 3.0, "duration": 1.0}) == pytest.approx(1.0)
+        # Late calls still take the recorded duration
+        assert backend._delay({"offset": 0.0, "duration": 1.0}) == pytest.approx(0.5)
+
+
+def test_replay_paces_sync_outside_the_state_lock(tmp_path: Path) -> None:
+    """Test that get_defs is answered at once while a paced sync is waiting."""
+    events = [{"host": "prod", "port": 4141, "recorded": 0.0}, {"method": "sync_local", "offset": 0.0, "duration": 0.5}]
+    (tmp_path / "session.jsonl").write_text("".join(json.dumps(event) + "\n" for event in events))
+    client = ReplayClient(str(tmp_path), speed=1.0)
+    sync = threading.Thread(target=client.sync_local)
+    sync.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    assert client.get_defs() is None
+    assert time.perf_counter() - start < 0.2
+    sync.join()
+
+
+def test_replay_missing_session(tmp_path: Path) -> None:
+    """Test that a missing session raises a RuntimeError."""
+    with pytest.raises(RuntimeError, match="Failed to read recorded session"):
+        ReplayClient(str(tmp_path / "nope"))
@@ -0,0 +1,156 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for runtime statistics and completion predictions.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import ecflow
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable, Static
+
+from ectop.runtimes import RuntimeStats, RuntimeSummary
+from ectop.transitions import Transition
+from ectop.widgets.content import MainContent
+from ectop.widgets.modals.slow import SlowTasks
+from ectop.widgets.sidebar import SuiteTree
+
+
+def _run(path: str, start: float, run_time: float) -> list[Transition]:
+    """Build the transitions of one complete run."""
+    return [Transition(start, path, "submitted", "active"), Transition(start + run_time, path, "active", "complete")]
+
+
+def test_runtime_statistics_window() -> None:
+    """Test the rolling mean and p90 over the last runs."""
+    stats = RuntimeStats(window=10)
+    assert stats.summary("/s/t") is None
+    for n in range(15):
+        stats.update(_run("/s/t", 1000.0 * n, float(n)))
+    # Aborted and requeued runs are not counted
+    stats.update([Transition(20_000, "/s/t", "submitted", "active"), Transition(20_500, "/s/t", "active", "aborted")])
+    stats.update([Transition(30_000, "/s/t", "submitted", "active"), Transition(30_500, "/s/t", "active", "queued")])
+
+    # Runs 5..14 remain
+    assert stats.summary("/s/t") == RuntimeSummary(10, 9.5, 13.0, 14.0)
+    assert stats.started("/s/t") is None
+
+    # Seeding only applies to nodes without statistics
+    stats.seed("/s/t", [1000.0])
+    stats.seed("/s/other", [10.0, 20.0])
+    assert stats.summary("/s/t").mean == 9.5
+    assert stats.summary("/s/other") == RuntimeSummary(2, 15.0, 20.0, 20.0)
+
+
+def test_eta_propagates_to_families() -> None:
+    """Test that active nodes are predicted and families take the latest prediction."""
+    stats = RuntimeStats()
+    stats.update(_run("/s/f/a", 0.0, 100.0) + _run("/s/f/b", 0.0, 300.0))
+    stats.update(
+        [
+            Transition(1000.0, "/s/f/a", "submitted", "active"),
+            Transition(1000.0, "/s/f/b", "submitted", "active"),
+            Transition(1000.0, "/s/f/c", "submitted", "active"),
+        ]
+    )
+    assert stats.eta("/s/f/a") == 1100.0
+    assert stats.eta("/s/f/c") is None
+    assert stats.eta("/s/f") == stats.eta("/s") == 1300.0
+
+    # Completion removes the prediction and records the run
+    stats.update([Transition(1250.0, "/s/f/b", "active", "complete")])
+    assert stats.eta("/s/f/b") is None
+    assert stats.eta("/s") == 1100.0
+    assert stats.summary("/s/f/b").count == 2
+
+
+def test_slow_detection() -> None:
+    """Test that active nodes past their p95 are flagged once enough runs are known."""
+    stats = RuntimeStats()
+    for n in range(2):
+        stats.update(_run("/s/a", 1000.0 * n, 100.0))
+    stats.update([Transition(5000.0, "/s/a", "submitted", "active")])
+    assert not stats.is_slow("/s/a", now=9000.0)
+
+    stats.update([Transition(5100.0, "/s/a", "active", "complete")])
+    for n in range(17):
+        stats.update(_run("/s/a", 10_000.0 * (n + 1), 100.0 + n))
+    stats.update(_run("/s/b", 0.0, 10.0) + _run("/s/b", 100.0, 10.0) + _run("/s/b", 200.0, 10.0))
+    stats.update(
+        [
+            Transition(500_000.0, "/s/a", "submitted", "active"),
+            Transition(500_000.0, "/s/b", "submitted", "active"),
+            Transition(500_000.0, "/s/c", "submitted", "active"),
+        ]
+    )
+    # The p95 of /s/a is 115s, of /s/b 10s
+    assert not stats.is_slow("/s/a", now=500_110.0)
+    assert stats.is_slow("/s/a", now=500_120.0)
+    assert [task.path for task in stats.slow(now=500_120.0)] == ["/s/b", "/s/a"]
+    assert stats.slow(now=500_005.0) == []
+
+
+class ContentApp(App):
+    """Minimal app hosting the content area and a tree."""
+
+    def compose(self) -> ComposeResult:
+        yield SuiteTree("ecFlow Server", id="suite_tree")
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_runtime_shown_in_tree_and_details() -> None:
+    """Test that the tree labels active nodes with their prediction and the details show statistics."""
+    app = ContentApp()
+    async with app.run_test() as pilot:
+        stats = RuntimeStats()
+        stats.update(_run("/s", 0.0, 60.0))
+        stats.update([Transition(100.0, "/s", "queued", "active")])
+
+        tree = app.query_one(SuiteTree)
+        tree.runtime_stats = stats
+        suite = ecflow.Suite()
+        suite.name = lambda: "s"
+        suite.get_abs_node_path = lambda: "/s"
+        suite.get_state = lambda: "active"
+        suite.nodes = []
+        defs = MagicMock()
+        defs.suites = [suite]
+        tree.update_tree("localhost", 3141, defs)
+        await pilot.pause()
+        assert "🏁" in str(tree.root.children[0].label)
+
+        content = app.query_one(MainContent)
+        content.show_runtime(stats.summary("/s"), stats.eta("/s"), now=130.0)
+        text = str(content.query_one("#timeline_runtime", Static).render())
+        assert "last 1 runs: mean 1m00s, p90 1m00s" in text
+        assert "(in 30s)" in text
+        content.show_runtime(None, 160.0, now=190.0)
+        assert "overdue by 30s" in str(content.query_one("#timeline_runtime", Static).render())
+
+
+@pytest.mark.asyncio
+async def test_slow_tasks_screen() -> None:
+    """Test that the slow task list shows overdue nodes and reveals the selected one."""
+    stats = RuntimeStats()
+    stats.update(_run("/s/t", 0.0, 60.0) + _run("/s/t", 100.0, 60.0) + _run("/s/t", 200.0, 60.0))
+    stats.update([Transition(1000.0, "/s/t", "submitted", "active")])
+    tree = MagicMock()
+    app = App()
+    async with app.run_test() as pilot:
+        screen = SlowTasks(stats, tree)
+        await app.push_screen(screen)
+        screen.action_rescan(now=1090.0)
+        table = screen.query_one("#slow_table", DataTable)
+        assert table.get_row_at(0) == ["/s/t", "1m30s", "1m00s", "30s"]
+        await pilot.press("enter")
+        tree.select_by_path.assert_called_once_with("/s/t")
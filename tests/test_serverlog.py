@@ -0,0 +1,127 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the server log parser and the Server Log screen.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from textual.app import App
+from textual.widgets import DataTable, Static
+
+from ectop.client import EcflowClient
+from ectop.serverlog import LogRecord, ServerLog, parse_line
+from ectop.widgets.modals.serverlog import ServerLogScreen
+
+LOG = [
+    "MSG:[08:00:00 19.10.2026] --requeue force /s/f  :alice",
+    "LOG:[08:00:01 19.10.2026]  submitted: /s/f/t job_size:1234",
+    "MSG:[08:00:02 19.10.2026] chd:init /s/f/t",
+    "MSG:[08:00:05 19.10.2026] --force=complete /s/g/u  :bob@host",
+    "MSG:[08:00:06 19.10.2026] --sync_full=0 :alice",
+    "continuation of a previous line",
+]
+
+
+def test_parse_line() -> None:
+    """Test that commands, state changes and unknown lines are parsed."""
+    assert parse_line(LOG[0]) == LogRecord("MSG", "08:00:00 19.10.2026", "requeue", "/s/f", "alice", LOG[0])
+    assert parse_line(LOG[1])[2:5] == ("submitted", "/s/f/t", "")
+    assert parse_line(LOG[2])[2:4] == ("chd:init", "/s/f/t")
+    assert parse_line(LOG[3])[2:5] == ("force", "/s/g/u", "bob@host")
+    assert parse_line(LOG[4])[2:5] == ("sync_full", "", "alice")
+    assert parse_line(LOG[5]) == LogRecord("", "", "", "", "", LOG[5])
+
+
+def test_server_log_feeds_incrementally() -> None:
+    """Test that overlapping tails only add unseen lines and that records are indexed by path."""
+    log = ServerLog()
+    assert log.feed("\n".join(LOG[:3])) == 3
+    assert log.feed("\n".join(LOG[1:5])) == 2
+    assert log.feed("\n".join(LOG[1:5])) == 0
+    assert len(log) == 5
+    assert log.gaps == 0
+
+    assert [r.command for r in log.records("/s/f")] == ["requeue", "submitted", "chd:init"]
+    assert [r.command for r in log.records("/s/f", descendants=False)] == ["requeue"]
+    assert log.records("/s/unknown") == []
+
+    # A tail that does not overlap (e.g. a new log) is taken whole
+    assert log.feed("MSG:[09:00:00 19.10.2026] --restart :alice") == 1
+    assert log.gaps == 1
+
+
+def test_server_log_is_bounded() -> None:
+    """Test that the oldest records are dropped and the index still resolves."""
+    log = ServerLog(capacity=8)
+    for n in range(30):
+        log.feed(f"MSG:[08:00:{n:02d} 19.10.2026] chd:complete /s/t{n % 3}")
+    assert len(log) <= 10
+    assert [r.time[6:8] for r in log.records("/s/t2")][-1] == "29"
+    assert all(r.path == "/s/t0" for r in log.records("/s/t0"))
+
+    # Record numbers survive trimming, so callers can ask for what they have not seen
+    records, end = log.records_since(27)
+    assert end == 30
+    assert [r.time[6:8] for r in records] == ["27", "28", "29"]
+    assert [r.time[6:8] for r in log.records_since(27, "/s")[0]] == ["27", "28", "29"]
+    assert [r.time[6:8] for r in log.records_since(0, "/s/t1")[0]][-1] == "28"
+
+
+def test_client_get_log() -> None:
+    """Test that the server log tail is requested from the client."""
+    with patch("ecflow.Client") as mock_client:
+        mock_client.return_value.get_log.return_value = "log"
+        client = EcflowClient()
+        assert client.get_log(max_lines=50) == "log"
+        mock_client.return_value.get_log.assert_called_with(50)
+        mock_client.return_value.get_log.side_effect = RuntimeError("denied")
+        with pytest.raises(RuntimeError, match="Failed to get server log"):
+            client.get_log()
+
+
+@pytest.mark.asyncio
+async def test_server_log_screen_filters() -> None:
+    """Test that the screen lists new lines and filters by node and text."""
+    client = AsyncMock()
+    client.get_log.return_value = "\n".join(LOG)
+    app = App()
+    async with app.run_test() as pilot:
+        screen = ServerLogScreen(client, ServerLog(), "/s/f")
+        screen.poll_log = MagicMock()
+        await app.push_screen(screen)
+        await ServerLogScreen.poll_log(screen)
+        table = screen.query_one("#server_log_table", DataTable)
+        assert table.row_count == 3
+        assert table.get_row_at(2)[2] == "chd:init"
+        assert "chd:init /s/f/t" in str(screen.query_one("#server_log_line", Static).render())
+
+        await pilot.press("n")
+        assert table.row_count == 6
+        screen.query_one("#server_log_filter").value = "alice"
+        await pilot.pause()
+        assert table.row_count == 2
+
+        # New lines are appended without moving the cursor off its record
+        screen.query_one("#server_log_filter").value = ""
+        await pilot.pause()
+        table.move_cursor(row=0)
+        client.get_log.return_value = "\n".join([*LOG, "MSG:[08:00:09 19.10.2026] --suspend /s/h  :carol"])
+        with patch.object(table, "clear") as clear:
+            await ServerLogScreen.poll_log(screen)
+        clear.assert_not_called()
+        assert table.row_count == 7
+        assert table.get_row_at(6)[2] == "suspend"
+        assert table.cursor_row == 0
+
+        client.get_log.side_effect = RuntimeError("denied")
+        await ServerLogScreen.poll_log(screen)
+        assert "not available" in str(screen.query_one("#server_log_title", Static).render())
@@ -0,0 +1,123 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the persisted snapshot and UI state cache.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import ecflow
+import pytest
+from textual.app import App, ComposeResult
+
+from ectop.app import Ectop
+from ectop.constants import STATUS_STALE
+from ectop.statecache import StateCache
+from ectop.widgets.sidebar import SuiteTree
+
+
+def _node(cls: type, path: str, state: str, children: list | None = None) -> MagicMock:
+    """Build a node of the mocked ecflow type `cls`."""
+    node = cls()
+    node.name = lambda: path.rsplit("/", 1)[-1]
+    node.get_abs_node_path = lambda: path
+    node.get_state = lambda: state
+    node.nodes = children or []
+    return node
+
+
+@pytest.fixture
+def defs() -> MagicMock:
+    """Mocked Defs with two suites, one holding a family with a task."""
+    task = _node(ecflow.Node, "/s2/f/t", "aborted")
+    family = _node(ecflow.Family, "/s2/f", "aborted", [task])
+    suites = [_node(ecflow.Suite, "/s1", "complete"), _node(ecflow.Suite, "/s2", "aborted", [family])]
+    nodes = {n.get_abs_node_path(): n for n in (*suites, family, task)}
+    defs = MagicMock()
+    defs.suites = suites
+    defs.find_abs_node.side_effect = nodes.get
+    return defs
+
+
+def test_state_cache_round_trip(tmp_path: Path) -> None:
+    """Test that snapshots and UI state are stored per server and survive corruption."""
+    cache = StateCache("my host", 3141, directory=str(tmp_path))
+    assert cache.snapshot_path == str(tmp_path / "my_host_3141.check.gz")
+    assert cache.load_defs() is None
+    assert cache.load_ui_state() == {}
+
+    with patch("ectop.statecache.dump_defs", return_value=b"checkpoint"):
+        cache.save_defs(MagicMock())
+    with patch("ectop.statecache.load_defs", return_value="defs") as mock_load:
+        defs, saved_at = cache.load_defs()
+    mock_load.assert_called_once_with(b"checkpoint")
+    assert defs == "defs"
+    assert saved_at > 0
+
+    cache.save_ui_state({"expanded": ["/s"], "cursor": "/s/t", "filter": None})
+    assert cache.load_ui_state()["cursor"] == "/s/t"
+    Path(cache.ui_path).write_text("{not json")
+    assert cache.load_ui_state() == {}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TreeApp(App):
+    """Minimal app hosting a SuiteTree."""
+
+    def compose(self) -> ComposeResult:
+        yield SuiteTree("ecFlow Server", id="suite_tree")
+
+
+@pytest.mark.asyncio
+async def test_tree_ui_state_survives_rebuild(defs: MagicMock) -> None:
+    """Test that expanded nodes, cursor and filter are captured and restored."""
+    app = TreeApp()
+    async with app.run_test() as pilot:
+        tree = app.query_one(SuiteTree)
+        tree.update_tree("localhost", 3141, defs, {"expanded": ["/s2", "/s2/f"], "cursor": "/s2/f/t", "filter": None})
+        await pilot.pause()
+        state = tree.ui_state()
+        assert state == {"expanded": ["/s2", "/s2/f"], "cursor": "/s2/f/t", "filter": None}
+
+        # Vanished nodes are skipped, the filter is restored
+        tree.update_tree("localhost", 3141, defs, {**state, "expanded": ["/gone", "/s2"], "filter": "aborted"})
+        await pilot.pause()
+        assert tree.current_filter == "aborted"
+        assert [n.data for n in tree.root.children] == ["/s2"]
+        assert tree.cursor_node.data == "/s2/f/t"
+
+
+def test_cached_snapshot_shown_as_stale(tmp_path: Path) -> None:
+    """Test that startup shows the persisted tree and merges its state into the first sync."""
+    app = Ectop(host="localhost", port=3141)
+    app.state_cache = StateCache("localhost", 3141, directory=str(tmp_path))
+    app.state_cache.save_ui_state({"expanded": ["/s1"], "cursor": "/s1/t", "filter": None})
+    with patch("ectop.statecache.dump_defs", return_value=b"checkpoint"):
+        app.state_cache.save_defs(MagicMock())
+
+    tree, status_bar = MagicMock(), MagicMock()
+    with (
+        patch("ectop.statecache.load_defs", return_value="cached defs"),
+        patch.object(app, "query_one", side_effect=lambda sel, _t=None: tree if "tree" in sel else status_bar),
+        patch.object(app, "call_from_thread", side_effect=lambda f, *a, **kw: f(*a, **kw)),
+    ):
+        app._show_cached_state()
+
+    tree.update_tree.assert_called_once()
+    assert tree.update_tree.call_args.args[2] == "cached defs"
+    assert status_bar.update_status.call_args.kwargs["status"].startswith(STATUS_STALE)
+
+    tree.ui_state.return_value = {"expanded": ["/s2"], "cursor": None, "filter": None}
+    with patch.object(app, "call_from_thread", side_effect=lambda f, *a, **kw: f(*a, **kw)):
+        merged = app._merged_ui_state(tree)
+        assert merged == {"expanded": ["/s1", "/s2"], "cursor": "/s1/t", "filter": None}
+        # Later syncs only keep the live state
+        assert app._merged_ui_state(tree)["cursor"] is None
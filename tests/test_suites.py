@@ -0,0 +1,146 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for suite-scoped synchronization and the suite picker.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+from textual.app import App
+from textual.widgets import SelectionList, Static
+
+from ectop.app import Ectop
+from ectop.cli import main
+from ectop.client import EcflowClient
+from ectop.constants import CONN_CONNECTED, CONN_DOWN
+from ectop.offline import OfflineClient
+from ectop.replay import ReplayClient
+from ectop.widgets.modals.suites import SuitePicker
+
+
+def test_register_suites() -> None:
+    """Test that a client handle is registered, replaced and dropped."""
+    with patch("ecflow.Client") as mock_client:
+        ecf = mock_client.return_value
+        ecf.suites.return_value = ["b", "a"]
+        client = EcflowClient()
+        assert client.suite_names() == ["b", "a"]
+
+        client.register_suites(["s2", "s1", "s2"])
+        assert client.suites == ["s1", "s2"]
+        ecf.ch_register.assert_called_once_with(False, ["s1", "s2"])
+        ecf.ch_drop.assert_not_called()
+
+        client.register_suites(["s3"])
+        assert ecf.method_calls[-2:] == [call.ch_drop(), call.ch_register(False, ["s3"])]
+
+        client.register_suites(None)
+        assert client.suites is None
+        assert ecf.ch_drop.call_count == 2
+
+        ecf.ch_register.side_effect = RuntimeError("unknown suite")
+        with pytest.raises(RuntimeError, match="Failed to register suites x"):
+            client.register_suites(["x"])
+        assert client.suites is None
+
+
+def test_cli_suites() -> None:
+    """Test that --suites is split into suite names."""
+    with patch("sys.argv", ["ectop", "--suites", "oper,,mofc"]), patch("ectop.cli.Ectop") as mock_app:
+        main()
+    assert mock_app.call_args.kwargs["suites"] == ["oper", "mofc"]
+
+
+@pytest.mark.asyncio
+async def test_suite_picker() -> None:
+    """Test that the server suites are listed with the synchronized ones checked."""
+    client = MagicMock()
+    client.suite_names = AsyncMock(return_value=["e", "mofc", "oper"])
+    callback = MagicMock()
+    app = App()
+    async with app.run_test() as pilot:
+        screen = SuitePicker(client, ["oper"], callback)
+        screen.load_suites = MagicMock()
+        await app.push_screen(screen)
+        await SuitePicker.load_suites(screen)
+        selection = screen.query_one("#suites_list", SelectionList)
+        assert selection.option_count == 3
+        assert selection.selected == ["oper"]
+        assert "3, 1 synchronized" in str(screen.query_one("#suites_title", Static).render())
+
+        selection.select("mofc")
+        await pilot.press("a")
+        assert sorted(callback.call_args.args[0]) == ["mofc", "oper"]
+
+        client.suite_names.side_effect = RuntimeError("down")
+        screen = SuitePicker(client, None, callback)
+        screen.load_suites = MagicMock()
+        await app.push_screen(screen)
+        await SuitePicker.load_suites(screen)
+        assert "not available" in str(screen.query_one("#suites_title", Static).render())
+        await pilot.press("x")
+        callback.assert_called_with([])
+
+
+def test_app_applies_suites() -> None:
+    """Test that choosing suites registers them and refreshes the tree."""
+    app = Ectop(suites=["oper"])
+    app.ecflow_client = MagicMock(suites=None)
+    app.call_from_thread = MagicMock()
+    with patch.object(Ectop, "action_refresh") as refresh:
+        app._apply_suites([])
+    app.ecflow_client.register_suites.assert_called_once_with([])
+    assert app.suites is None
+    refresh.assert_called_once()
+
+    app.ecflow_client.register_suites.side_effect = RuntimeError("Failed to register suites x")
+    with patch.object(Ectop, "action_refresh"):
+        app._apply_suites(["x"])
+    assert "synchronizing all suites" in app.call_from_thread.call_args.args[1]
+    assert app.suites is None
+
+
+def test_replay_and_offline_clients_start_unregistered(tmp_path) -> None:
+    """Test that clients without a server connection go through registration and shutdown."""
+    (tmp_path / "session.jsonl").write_text(json.dumps({"host": "prod", "port": 4141, "recorded": 0.0}) + "\n")
+    checkpoint = tmp_path / "prod.check"
+    checkpoint.write_text("")
+    with patch("ectop.offline.load_defs_file", return_value=MagicMock()):
+        replay, offline = ReplayClient(str(tmp_path), speed=0), OfflineClient(str(checkpoint))
+
+    for client, registered in ((replay, ["oper"]), (offline, None)):
+        assert client.suites is None
+        app = Ectop()
+        app.ecflow_client = client
+        app.call_from_thread = MagicMock()
+        app._register_suites(["oper"])
+        assert app.suites == registered
+        app.on_unmount()
+        assert client.suites is None
+
+
+def test_exit_does_not_wait_on_an_unresponsive_server() -> None:
+    """Test that dropping the handle on exit is skipped while down and bounded otherwise."""
+    app = Ectop()
+    app.ecflow_client = MagicMock(suites=["oper"])
+    app.ecflow_client.health.state = CONN_DOWN
+    app.on_unmount()
+    app.ecflow_client.register_suites.assert_not_called()
+
+    app.ecflow_client.health.state = CONN_CONNECTED
+    app.ecflow_client.register_suites.side_effect = lambda suites: time.sleep(1)
+    start = time.perf_counter()
+    with patch("ectop.app.SHUTDOWN_DROP_TIMEOUT", 0.05):
+        app.on_unmount()
+    assert time.perf_counter() - start < 0.5
+    app.ecflow_client.register_suites.assert_called_once_with(None)
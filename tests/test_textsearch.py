@@ -0,0 +1,147 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for in-content search.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from ectop.constants import COLOR_SEARCH_MATCH
+from ectop.textsearch import MatchSet, compile_query
+from ectop.widgets.content import MainContent
+from ectop.widgets.logview import LargeLogView, LineIndex
+
+
+def test_collect_offsets_and_lines() -> None:
+    """Test that matches are collected with line numbers in one pass."""
+    text = "Error one\nok\nanother error\nERROR three error"
+    matches = MatchSet.collect("error", compile_query("error").finditer(text), text=text)
+    assert list(matches.offsets) == [0, 21, 27, 39]
+    assert list(matches.lines) == [0, 2, 3, 3]
+    assert all(length == 5 for length in matches.lengths)
+    assert matches.in_range(27, 46) == [(27, 5, False), (39, 5, False)]
+
+
+def test_navigation_wraps() -> None:
+    """Test next/previous navigation with wrap-around."""
+    matches = MatchSet.collect("a", compile_query("a").finditer("a a a"), text="a a a")
+    assert matches.previous() == 2
+    assert matches.next() == 0
+    assert matches.next() == 1
+    assert matches.status() == "Match 2/3 for 'a'"
+    assert MatchSet("x").next() == -1
+    assert MatchSet("x").status() == "No matches for 'x'"
+
+
+def test_regex_and_limit() -> None:
+    """Test regex queries, literal escaping, empty matches and the match limit."""
+    assert compile_query("a.c").search("abc") is None
+    assert compile_query("re:a.c").search("abc") is not None
+    with pytest.raises(ValueError, match="Invalid regular expression"):
+        compile_query("re:(")
+    with pytest.raises(ValueError, match="Empty search query"):
+        compile_query("re:")
+
+    matches = MatchSet.collect("re:x*", compile_query("re:x*").finditer("x y xx"), limit=1)
+    assert list(matches.offsets) == [0]
+    assert matches.truncated
+    assert matches.status() == "Match 0/1+ for 're:x*'"
+
+
+def test_line_index_finditer(tmp_path: Path) -> None:
+    """Test that a bytes pattern scans the memory-mapped file."""
+    log = tmp_path / "big.log"
+    log.write_bytes(b"start\nFAIL here\nok\nfail again\n")
+    index = LineIndex(str(log))
+    matches = MatchSet.collect("fail", index.finditer(compile_query("fail", binary=True)))
+    assert list(matches.offsets) == [6, 19]
+    assert matches.lines is None
+    index.close()
+
+
+class SearchApp(App):
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_search_navigation_in_tabs() -> None:
+    """Test searching and navigating the Output and Script tabs."""
+    app = SearchApp()
+    async with app.run_test() as pilot:
+        content_area = app.query_one(MainContent)
+        app.notify = MagicMock()
+        content_area.update_log("\n".join(f"line {i}" for i in range(200)) + "\nneedle\n")
+        content_area.update_script("echo a\n" * 50 + "echo needle\n")
+        await pilot.pause()
+
+        content_area.search("needle")
+        app.notify.assert_called_with("Match 1/1 for 'needle' in output")
+        assert content_area._matches["output"].lines[0] == 200
+
+        content_area.active = "tab_script"
+        await pilot.pause()
+        content_area.action_next_match()
+        app.notify.assert_called_with("No search results, press Ctrl+F to search", severity="warning")
+        content_area.search("re:echo \\w+")
+        assert len(content_area._matches["script"]) == 51
+        content_area.action_previous_match()
+        app.notify.assert_called_with("Match 51/51 for 're:echo \\w+' in script")
+
+        content_area.search("re:[")
+        assert "Invalid regular expression" in app.notify.call_args.args[0]
+
+        # Replacing the content drops stale matches
+        content_area.update_script("new")
+        assert "script" not in content_area._matches
+
+
+@pytest.mark.asyncio
+async def test_search_highlights_multiline_match_per_line() -> None:
+    """Test that a match crossing line breaks is highlighted on each numbered line."""
+    app = SearchApp()
+    async with app.run_test() as pilot:
+        content_area = app.query_one(MainContent)
+        app.notify = MagicMock()
+        content_area.update_script("".join(f"echo {i}\n" for i in range(9)) + "begin x\nmiddle\nend y\n")
+        content_area.active = "tab_script"
+        await pilot.pause()
+
+        content_area.search("re:x\\nmiddle\\nend")
+        text = app.query_one("#view_script", Static).content
+        highlighted = [text.plain[span.start : span.end] for span in text.spans if span.style == COLOR_SEARCH_MATCH]
+        assert highlighted == ["x", "middle", "end"]
+
+
+@pytest.mark.asyncio
+async def test_search_large_log() -> None:
+    """Test that large logs are searched over the mapping and highlighted."""
+    app = SearchApp()
+    async with app.run_test() as pilot:
+        content_area = app.query_one(MainContent)
+        app.notify = MagicMock()
+        lines = "".join(f"row {i}{' ERROR' if i % 100 == 0 else ''}\n" for i in range(1000))
+        with patch("ectop.widgets.content.LARGE_LOG_THRESHOLD", 100):
+            content_area.update_log(lines)
+            await pilot.pause()
+            view = app.query_one("#log_large", LargeLogView)
+
+            content_area.search("error")
+            assert len(content_area._matches["output"]) == 10
+            content_area.action_next_match()
+            await pilot.pause()
+            assert view.scroll_offset.y == 100
+            rendered = view._line_text(100)
+            assert any(span.start == 8 and span.end == 13 for span in rendered.spans)
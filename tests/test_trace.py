@@ -0,0 +1,94 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the JSON-lines client call tracer.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import ecflow
+import pytest
+
+from ectop.client import EcflowClient
+from ectop.trace import CallTracer
+
+
+def _read_records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_tracer_records_success(tmp_path: Path) -> None:
+    """Test that a successful call is written with its response size."""
+    trace_file = tmp_path / "trace.jsonl"
+    tracer = CallTracer(str(trace_file))
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        mock_client.return_value.get_file.return_value = "hello"
+        client = EcflowClient(tracer=tracer)
+        client.file("/s/t", "jobout")
+    tracer.close()
+
+    records = _read_records(trace_file)
+    assert len(records) == 1
+    assert records[0]["method"] == "file"
+    assert records[0]["path"] == "/s/t"
+    assert records[0]["size"] == 5
+    assert records[0]["error"] is None
+    assert records[0]["duration"] >= 0
+
+
+def test_tracer_records_error(tmp_path: Path) -> None:
+    """Test that failing calls are traced and the error still propagates."""
+    trace_file = tmp_path / "trace.jsonl"
+    tracer = CallTracer(str(trace_file))
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        mock_client.return_value.suspend.side_effect = RuntimeError("boom")
+        client = EcflowClient(tracer=tracer)
+        with pytest.raises(RuntimeError, match="Failed to suspend /s"):
+            client.suspend("/s")
+    tracer.close()
+
+    records = _read_records(trace_file)
+    assert records[0]["method"] == "suspend"
+    assert records[0]["error"] == "boom"
+    assert records[0]["size"] is None
+
+
+def test_tracer_records_defs_node_count(tmp_path: Path) -> None:
+    """Test that definitions responses are sized by their node count."""
+    suite = ecflow.Suite()
+    suite.get_all_nodes = lambda: [suite, ecflow.Family(), ecflow.Node()]
+    defs = ecflow.Defs()
+    defs.suites = [suite]
+    trace_file = tmp_path / "trace.jsonl"
+    tracer = CallTracer(str(trace_file))
+    with patch("ectop.client.ecflow.Client") as mock_client:
+        mock_client.return_value.get_defs.return_value = defs
+        client = EcflowClient(tracer=tracer)
+        client.sync_local()
+        client.get_defs()
+    tracer.close()
+
+    sync, get_defs = _read_records(trace_file)
+    assert (sync["size"], sync["nodes"]) == (None, None)
+    assert (get_defs["size"], get_defs["nodes"]) == (None, 3)
+
+
+def test_tracer_rotation(tmp_path: Path) -> None:
+    """Test that the trace file rotates once it grows past max_bytes."""
+    trace_file = tmp_path / "trace.jsonl"
+    tracer = CallTracer(str(trace_file), max_bytes=200, backup_count=2)
+    for _ in range(20):
+        tracer.record("ping", None, 0.0, 0.001)
+    tracer.close()
+
+    assert (tmp_path / "trace.jsonl.1").exists()
+    assert not (tmp_path / "trace.jsonl.3").exists()
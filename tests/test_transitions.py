@@ -0,0 +1,95 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the state transition recorder and the Timeline tab.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable, Static
+
+from ectop.transitions import Transition, TransitionRecorder
+from ectop.widgets.content import MainContent
+
+
+def _defs(states: dict[str, str]) -> MagicMock:
+    """Build mocked Defs with one suite '/s' holding nodes in the given states."""
+    nodes = []
+    for path, state in states.items():
+        node = MagicMock()
+        node.get_abs_node_path.return_value = path
+        node.get_state.return_value = state
+        nodes.append(node)
+    suite = MagicMock()
+    suite.get_abs_node_path.return_value = "/s"
+    suite.get_state.return_value = "active"
+    suite.get_all_nodes.return_value = nodes
+    defs = MagicMock()
+    defs.suites = [suite]
+    return defs
+
+
+def test_recorder_diffs_successive_syncs() -> None:
+    """Test that only changes between observations are recorded."""
+    recorder = TransitionRecorder()
+    assert recorder.observe(_defs({"/s/a": "queued", "/s/f/b": "queued"}), now=1.0) == []
+    found = recorder.observe(_defs({"/s/a": "submitted", "/s/f/b": "queued", "/s/new": "queued"}), now=2.0)
+    assert found == [Transition(2.0, "/s/a", "queued", "submitted")]
+    recorder.observe(_defs({"/s/a": "active", "/s/f/b": "custom"}), now=3.0)
+
+    assert [t.new for t in recorder.for_path("/s/a")] == ["submitted", "active"]
+    assert recorder.for_path("/s/f", descendants=True) == [Transition(3.0, "/s/f/b", "queued", "custom")]
+    assert recorder.for_path("/s/unknown") == []
+
+
+def test_recorder_is_bounded() -> None:
+    """Test that old transitions are overwritten and unused paths dropped."""
+    recorder = TransitionRecorder(capacity=3)
+    recorder.observe(_defs({}), now=0.0)
+    for n in range(1, 11):
+        # Each sync brings a new node (e.g. a new cycle) that then changes state
+        recorder.observe(_defs({f"/s/{n}": "queued"}), now=n)
+        recorder.observe(_defs({f"/s/{n}": "active"}), now=n + 0.5)
+    assert len(recorder) == 3
+    assert [t.path for t in recorder.for_path("/s", descendants=True)] == ["/s/8", "/s/9", "/s/10"]
+    assert len(recorder._path_names) <= 2 * recorder.capacity
+
+
+class ContentApp(App):
+    """Minimal app hosting the content area."""
+
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_timeline_tab() -> None:
+    """Test that the timeline lists transitions newest first with time in the old state."""
+    app = ContentApp()
+    async with app.run_test():
+        content = app.query_one(MainContent)
+        content.show_timeline(
+            "/s",
+            [
+                Transition(100.0, "/s/t", "queued", "submitted"),
+                Transition(110.0, "/s/t", "submitted", "active"),
+                Transition(300.0, "/s/t", "active", "complete"),
+            ],
+        )
+        table = content.query_one("#view_timeline", DataTable)
+        assert table.row_count == 3
+        newest = table.get_row_at(0)
+        assert newest[1] == "t"
+        assert newest[3].endswith("complete")
+        assert newest[4] == "3m10s"
+        assert table.get_row_at(2)[4] == ""
+        assert "3 state changes" in str(content.query_one("#timeline_title", Static).render())
@@ -0,0 +1,98 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the aborted task triage screen.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import ecflow
+import pytest
+from textual.app import App
+from textual.widgets import DataTable, Static
+
+from ectop.client import EcflowClient
+from ectop.widgets.modals.triage import AbortedTriage
+
+
+def _task(path: str, state: str, reason: str = "") -> MagicMock:
+    """Build a mocked task node."""
+    node = MagicMock()
+    node.get_abs_node_path.return_value = path
+    node.get_state.return_value = state
+    node.get_abort.return_value = reason
+    node.get_generated_variables.return_value = []
+    return node
+
+
+def _defs(*tasks: MagicMock) -> MagicMock:
+    """Build mocked Defs with one suite holding the given tasks."""
+    suite = ecflow.Suite()
+    suite.get_all_nodes = lambda: list(tasks)
+    defs = MagicMock()
+    defs.suites = [suite]
+    defs.find_abs_node.side_effect = lambda path: next((t for t in tasks if t.get_abs_node_path() == path), None)
+    return defs
+
+
+def test_file_tail_passes_max_lines() -> None:
+    """Test that a bounded fetch asks the server for the last lines only."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ecflow, "Client", MagicMock())
+        client = EcflowClient()
+    client._call = MagicMock(return_value="tail")
+    assert client.file("/s/t", "jobout", max_lines=20) == "tail"
+    client._call.assert_called_once_with("file", "/s/t", "get_file", "/s/t", "jobout", "20")
+
+
+@pytest.mark.asyncio
+async def test_triage_streams_tails_and_requeues() -> None:
+    """Test that rows are listed, tails filled in, and requeued tasks removed."""
+    defs = _defs(
+        _task("/s/a", "aborted", "trap"),
+        _task("/s/b", "complete"),
+        _task("/s/c", "aborted", "killed"),
+    )
+
+    async def fetch(path: str, file_type: str, max_lines: int | None = None) -> str:
+        if path == "/s/c":
+            raise RuntimeError("no output")
+        return "line 1\nline 2\nERROR: boom\n"
+
+    client = MagicMock()
+    client.sync_local = AsyncMock()
+    client.get_defs = AsyncMock(return_value=defs)
+    client.file = AsyncMock(side_effect=fetch)
+    client.command = AsyncMock()
+    tree = MagicMock()
+
+    app = App()
+    async with app.run_test() as pilot:
+        screen = AbortedTriage(client, tree)
+        # Workers run inline in tests, so drive the async loader directly
+        screen.load_aborted = MagicMock()
+        await app.push_screen(screen)
+        await AbortedTriage.load_aborted(screen)
+        await pilot.pause()
+
+        table = screen.query_one("#triage_table", DataTable)
+        assert table.row_count == 2
+        assert table.get_row("/s/a")[2] == "trap"
+        assert str(table.get_row("/s/a")[3]) == "ERROR: boom"
+        assert "no output" in str(table.get_row("/s/c")[3])
+        assert all(c.kwargs["max_lines"] == 20 for c in client.file.call_args_list)
+        assert "ERROR: boom" in str(screen.query_one("#triage_tail", Static).render())
+
+        await AbortedTriage.action_requeue(screen)
+        client.command.assert_awaited_once_with("requeue", "/s/a")
+        assert table.row_count == 1
+
+        screen.on_data_table_row_selected(MagicMock(row_key=MagicMock(value="/s/c")))
+        tree.select_by_path.assert_called_once_with("/s/c")
@@ -0,0 +1,120 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the per-try output history.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable
+
+from ectop.tries import OutputHistory, fetch_try_outputs, try_output_paths
+from ectop.widgets.content import MainContent
+from ectop.widgets.modals.tries import TryHistory
+
+
+def _defs_with(**variables: str) -> MagicMock:
+    """Build mocked Defs whose node has the given generated variables."""
+    gen_vars = []
+    for name, value in variables.items():
+        var = MagicMock()
+        var.name.return_value = name
+        var.value.return_value = value
+        gen_vars.append(var)
+    defs = MagicMock()
+    defs.find_abs_node.return_value.get_generated_variables.return_value = gen_vars
+    return defs
+
+
+def test_try_output_paths() -> None:
+    """Test resolution of earlier try files from ECF_JOBOUT and ECF_TRYNO."""
+    defs = _defs_with(ECF_JOBOUT="/out/s/t.3", ECF_TRYNO="3")
+    assert try_output_paths(defs, "/s/t") == {1: "/out/s/t.1", 2: "/out/s/t.2", 3: "/out/s/t.3"}
+    # A custom ECF_JOBOUT without the try suffix only identifies the current try
+    assert try_output_paths(_defs_with(ECF_JOBOUT="/out/t.log", ECF_TRYNO="2"), "/s/t") == {2: "/out/t.log"}
+    assert try_output_paths(_defs_with(ECF_TRYNO="2"), "/s/t") == {}
+    assert try_output_paths(None, "/s/t") == {}
+
+
+def test_output_history_size_budget() -> None:
+    """Test that large outputs evict older ones and outputs above the budget are not kept."""
+    history = OutputHistory(max_bytes=10)
+    history.put("/s/t", 1, "aaaa")
+    history.put("/s/t", 2, "bbbb")
+    history.put("/s/u", 1, "cccccccc")
+    assert history.tries("/s/t") == []
+    assert history.get("/s/u", 1) == "cccccccc"
+
+    history.put("/s/u", 2, "x" * 11)
+    assert history.get("/s/u", 2) is None
+    assert history.get("/s/u", 1) == "cccccccc"
+
+    history.put("/s/u", 1, "dd")
+    history.put("/s/v", 1, "eeeeeeee")
+    assert history.tries("/s/u") == [1]
+
+
+@pytest.mark.asyncio
+async def test_fetch_try_outputs_concurrent_and_cached(tmp_path: Path) -> None:
+    """Test that earlier tries are read from disk once and the current try always from the server."""
+    (tmp_path / "t.1").write_text("first")
+    client = MagicMock()
+    client.file = AsyncMock(return_value="current")
+    history = OutputHistory()
+    files = {1: str(tmp_path / "t.1"), 2: str(tmp_path / "t.2"), 3: str(tmp_path / "t.3")}
+
+    outputs = await fetch_try_outputs(client, history, "/s/t", files, 3, files)
+    assert outputs[1] == "first"
+    assert isinstance(outputs[2], RuntimeError)
+    assert outputs[3] == "current"
+
+    (tmp_path / "t.1").unlink()
+    outputs = await fetch_try_outputs(client, history, "/s/t", files, 3, (1, 3))
+    assert outputs[1] == "first"
+    assert client.file.await_count == 2
+
+
+class TriesApp(App):
+    def compose(self) -> ComposeResult:
+        yield MainContent(id="main_content")
+
+
+@pytest.mark.asyncio
+async def test_try_history_modal(tmp_path: Path) -> None:
+    """Test that the modal lists all tries and shows the selected one."""
+    (tmp_path / "t.1").write_text("first try\nfailed")
+    client = MagicMock()
+    client.sync_local = AsyncMock()
+    client.get_defs = AsyncMock(return_value=_defs_with(ECF_JOBOUT=str(tmp_path / "t.2"), ECF_TRYNO="2"))
+    client.file = AsyncMock(return_value="second try")
+
+    app = TriesApp()
+    async with app.run_test() as pilot:
+        content_area = app.query_one(MainContent)
+        content_area.update_log = MagicMock()
+        screen = TryHistory("/s/t", client, OutputHistory(), content_area)
+        # Workers run inline in tests, so drive the async loader directly
+        screen.load_tries = MagicMock()
+        await app.push_screen(screen)
+        await TryHistory.load_tries(screen)
+        await pilot.pause()
+
+        table = screen.query_one("#tries_table", DataTable)
+        assert table.row_count == 2
+        assert table.get_row("1")[1] == "2"
+        assert table.get_row("2")[1] == "1"
+
+        table.move_cursor(row=1)
+        screen.action_diff_selected()
+        await pilot.pause()
+        assert content_area.active == "tab_diff"
@@ -0,0 +1,147 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the watch list and its per-node queries.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from textual.app import App, ComposeResult
+
+from ectop.app import Ectop
+from ectop.client import EcflowClient
+from ectop.nodes import query_attribute
+from ectop.transitions import Transition
+from ectop.watch import WatchStatus, fetch_status
+from ectop.widgets.watchlist import WatchList
+
+
+def _node() -> MagicMock:
+    """Build a task with a meter, a label and an event."""
+    meter = MagicMock()
+    meter.name.return_value = "step"
+    meter.value.return_value = 3
+    meter.max.return_value = 10
+    label = MagicMock()
+    label.name.return_value = "info"
+    label.value.return_value = "initial"
+    label.new_value.return_value = "running"
+    event = MagicMock()
+    event.name_or_number.return_value = "done"
+    event.value.return_value = False
+    node = MagicMock()
+    node.get_state.return_value = "active"
+    node.meters = [meter]
+    node.labels = [label]
+    node.events = [event]
+    return node
+
+
+def _defs(node: MagicMock) -> MagicMock:
+    defs = MagicMock()
+    defs.find_abs_node.side_effect = {"/s/t": node}.get
+    return defs
+
+
+def test_query_attribute() -> None:
+    """Test that node queries are answered from definitions like the server does."""
+    defs = _defs(_node())
+    assert query_attribute(defs, "/s/t", "state") == "active"
+    assert query_attribute(defs, "/s/t", "meter", "step") == "3"
+    assert query_attribute(defs, "/s/t", "label", "info") == "running"
+    assert query_attribute(defs, "/s/t", "event", "done") == "clear"
+    with pytest.raises(RuntimeError, match="not found on /s/t"):
+        query_attribute(defs, "/s/t", "meter", "other")
+    with pytest.raises(RuntimeError, match="node /s/x not found"):
+        query_attribute(defs, "/s/x", "state")
+
+
+def test_client_query() -> None:
+    """Test that a query is sent for one node value."""
+    with patch("ecflow.Client") as mock_client:
+        mock_client.return_value.query.return_value = "complete"
+        client = EcflowClient()
+        assert client.query("/s/t", "state") == "complete"
+        mock_client.return_value.query.assert_called_with("state", "/s/t", "")
+        mock_client.return_value.query.side_effect = RuntimeError("no such node")
+        with pytest.raises(RuntimeError, match="Failed to query meter step of /s/t"):
+            client.query("/s/t", "meter", "step")
+
+
+@pytest.mark.asyncio
+async def test_fetch_status() -> None:
+    """Test that the values of the attributes known from the definitions are queried."""
+    client = AsyncMock()
+    client.query.side_effect = lambda path, query_type, attribute="": {"state": "active", "meter": "7", "label": "x"}[query_type]
+    status = await fetch_status(client, _defs(_node()), "/s/t")
+    assert status == WatchStatus("/s/t", "active", (("step", "7", 10),), (("info", "x"),))
+
+    client.query.side_effect = RuntimeError("down")
+    assert (await fetch_status(client, None, "/s/t")).error == "down"
+
+
+class WatchApp(App):
+    """Minimal app hosting a watch list."""
+
+    def compose(self) -> ComposeResult:
+        yield WatchList(id="watch_list")
+
+
+@pytest.mark.asyncio
+async def test_watch_list_rows() -> None:
+    """Test pinning, showing statuses and counting elapsed time from state changes."""
+    app = WatchApp()
+    async with app.run_test():
+        watch = app.query_one(WatchList)
+        assert not watch.display
+        assert watch.toggle("/s/t", since=100.0)
+        assert watch.toggle("/s/u")
+        assert watch.display
+
+        watch.update_status([WatchStatus("/s/t", "active", (("step", "7", 10),), (("info", "x"),))], now=190.0)
+        assert watch.get_row_at(0)[1:] == ["🔥 active", "1m30s", "step 7/10", "info: x"]
+        assert watch.get_row_at(1)[1] == "…"
+
+        watch.update_status([WatchStatus("/s/t", "complete"), WatchStatus("/s/u", "", error="down")], now=200.0)
+        watch.update_status([WatchStatus("/s/t", "complete")], now=260.0)
+        assert watch.get_row_at(0)[2] == "1m00s"
+        assert watch.get_row_at(1)[1] == "⚠ query failed"
+
+        assert not watch.toggle("/s/t")
+        assert not watch.toggle("/s/u")
+        assert not watch.display
+
+
+@pytest.mark.asyncio
+async def test_app_polls_watched_nodes() -> None:
+    """Test that the app pins the selected node and polls it with queries."""
+    app = Ectop()
+    with patch.object(Ectop, "_initial_connect"):
+        async with app.run_test():
+            app.async_client = MagicMock()
+            app.async_client.get_defs = AsyncMock(return_value=None)
+            app.async_client.query = AsyncMock(return_value="queued")
+            app.get_selected_path = MagicMock(return_value="/s/t")
+            app._poll_watch = MagicMock()
+            with patch.object(app.transitions, "for_path", return_value=[Transition(50.0, "/s/t", "active", "queued")]):
+                app.action_toggle_watch()
+            app._poll_watch.assert_called_once_with(["/s/t"])
+
+            await Ectop._poll_watch(app, ["/s/t"])
+            watch = app.query_one(WatchList)
+            assert watch.get_row_at(0)[1] == "🔵 queued"
+            app.async_client.query.assert_awaited_with("/s/t", "state")
+
+            # Attribute names come from the last refresh, not from a fetch per tick
+            app._watch_defs = _defs(_node())
+            await Ectop._poll_watch(app, ["/s/t"])
+            app.async_client.query.assert_any_await("/s/t", "meter", "step")
+            app.async_client.get_defs.assert_not_awaited()
@@ -0,0 +1,130 @@
+# #############################################################################
+# WARNING: If you modify features, API, or usage, you MUST update the
+# documentation immediately.
+# #############################################################################
+"""
+Tests for the bounded worker limiter.
+
+.. note::
+    If you modify features, API, or usage, you MUST update the documentation immediately.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Any
+
+from ectop.widgets.statusbar import StatusBar
+from ectop.workers import WorkerLimiter, limited, worker_limiter
+
+
+def test_limiter_bounds_concurrency() -> None:
+    """Test that no more than the category limit run at once and the rest queue without a thread."""
+    limiter = WorkerLimiter({"files": 2})
+    release = threading.Event()
+    peak = 0
+    done: list[int] = []
+    threads_used: set[int] = set()
+    lock = threading.Lock()
+
+    def job(n: int) -> None:
+        nonlocal peak
+        with lock:
+            peak = max(peak, limiter.running)
+            threads_used.add(threading.get_ident())
+        release.wait(2)
+        done.append(n)
+
+    threads = [threading.Thread(target=limiter.run, args=("files", functools.partial(job, n))) for n in range(2)]
+    for t in threads:
+        t.start()
+    for _ in range(50):
+        if limiter.running == 2:
+            break
+        time.sleep(0.01)
+    # Submissions beyond the limit return at once and wait in the queue
+    for n in range(2, 5):
+        assert limiter.run("files", functools.partial(job, n)) is None
+    # An identical job already waiting is not queued twice
+    limiter.run("files", functools.partial(job, 4))
+    assert limiter.running == 2
+    assert limiter.queued == 3
+
+    release.set()
+    for t in threads:
+        t.join()
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    assert peak == 2
+    assert len(threads_used) == 2
+    assert limiter.running == 0
+    assert limiter.queued == 0
+
+
+def test_limiter_coalesces_in_flight_jobs() -> None:
+    """Test that coalescing jobs are dropped while the category is full."""
+    limiter = WorkerLimiter({"poll": 1})
+    results: list[Any] = []
+
+    def tick() -> str:
+        # Re-entrant in the same thread
+        results.append(limiter.run("poll", functools.partial(str, "inner"), coalesce=True))
+        results.append(limiter.run("poll", functools.partial(str, "dropped"), coalesce=True))
+        return "outer"
+
+    def other_thread() -> None:
+        results.append(limiter.run("poll", functools.partial(str, "other"), coalesce=True))
+
+    def outer() -> str:
+        t = threading.Thread(target=other_thread)
+        t.start()
+        t.join()
+        return tick()
+
+    assert limiter.run("poll", functools.partial(outer), coalesce=True) == "outer"
+    assert results == [None, "inner", "dropped"]
+    assert limiter.dropped == 1
+    assert limiter.running == 0
+
+
+def test_limiter_keeps_errors_of_queued_jobs() -> None:
+    """Test that a failing queued job does not stop the queue."""
+    limiter = WorkerLimiter({"control": 1})
+    done: list[str] = []
+
+    def submit() -> None:
+        limiter.run("control", functools.partial(int, "x"))
+        limiter.run("control", functools.partial(done.append, "second"))
+
+    def first() -> None:
+        t = threading.Thread(target=submit)
+        t.start()
+        t.join()
+        assert limiter.queued == 2
+
+    limiter.run("control", functools.partial(first))
+    assert done == ["second"]
+    assert isinstance(limiter.last_error, ValueError)
+    assert limiter.running == 0
+
+
+def test_limited_decorator() -> None:
+    """Test that the decorator passes arguments and results through."""
+
+    @limited("control")
+    def add(a: int, b: int) -> int:
+        assert worker_limiter.running >= 1
+        return a + b
+
+    assert add(1, 2) == 3
+    assert worker_limiter.running == 0
+
+
+def test_statusbar_worker_counters() -> None:
+    """Test that the status bar shows running and queued jobs."""
+    bar = StatusBar()
+    bar.update_workers(3, 7)
+    assert bar.running_jobs == 3
+    assert bar.queued_jobs == 7
+    assert "Queue: 7" in bar.render().plain